@@ -0,0 +1,205 @@
+"""
+StarMeet API - Admission Control
+
+Per-lane concurrency limits for CPU-heavy endpoints.
+
+Without limits a burst of /full-calculate requests piles up behind the same
+worker as cheap /quick-varga, /signs and /timezone calls, and enough of them
+in flight at once can push the container past its memory limit. Heavy routes
+are assigned to a lane; each lane admits a fixed number of requests at a
+time, lets a bounded number wait (up to ADMISSION_WAIT_TIMEOUT) and answers
+503 with Retry-After beyond that. Routes without a lane are never held, so
+cheap endpoints stay responsive whatever the heavy lanes are doing.
+
+Lanes (per API worker process):
+    analysis   /full-calculate and its SSE stream (AstroBrain, LLM report)
+    chart      /calculate, /calculate/batch, /save (Digital Twin), /timezone/batch
+
+Background jobs have their own bounded queue (app.jobs).
+
+Configuration (environment):
+    ADMISSION_ANALYSIS_CONCURRENCY   Analysis requests running at once (default: 2)
+    ADMISSION_ANALYSIS_QUEUE         Analysis requests waiting (default: 8)
+    ADMISSION_CHART_CONCURRENCY      Chart requests running at once (default: 8)
+    ADMISSION_CHART_QUEUE            Chart requests waiting (default: 32)
+    ADMISSION_WAIT_TIMEOUT           Seconds a request may wait for a slot (default: 10)
+    ADMISSION_RETRY_AFTER            Retry-After sent with 503, seconds (default: 5)
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# (method, path under the API root) -> lane
+LANE_ROUTES = {
+    ("POST", "/v1/full-calculate"): "analysis",
+    ("POST", "/v1/full-calculate/stream"): "analysis",
+    ("POST", "/v1/calculate"): "chart",
+    ("POST", "/v1/calculate/batch"): "chart",
+    ("POST", "/v1/save"): "chart",
+    ("POST", "/v1/timezone/batch"): "chart",
+}
+
+
+class LaneFull(Exception):
+    """A lane has no free slot and its wait queue is full (or the wait timed out)."""
+
+    def __init__(self, lane: str, reason: str):
+        self.lane = lane
+        super().__init__(f"{lane} lane {reason}")
+
+
+@dataclass
+class AdmissionConfig:
+    """Admission control configuration"""
+    analysis_concurrency: int = 2
+    analysis_queue: int = 8
+    chart_concurrency: int = 8
+    chart_queue: int = 32
+    wait_timeout: float = 10.0
+    retry_after: int = 5
+
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        """Load configuration from ADMISSION_* environment variables."""
+        config = cls()
+        config.analysis_concurrency = int(os.getenv("ADMISSION_ANALYSIS_CONCURRENCY", config.analysis_concurrency))
+        config.analysis_queue = int(os.getenv("ADMISSION_ANALYSIS_QUEUE", config.analysis_queue))
+        config.chart_concurrency = int(os.getenv("ADMISSION_CHART_CONCURRENCY", config.chart_concurrency))
+        config.chart_queue = int(os.getenv("ADMISSION_CHART_QUEUE", config.chart_queue))
+        config.wait_timeout = float(os.getenv("ADMISSION_WAIT_TIMEOUT", config.wait_timeout))
+        config.retry_after = int(os.getenv("ADMISSION_RETRY_AFTER", config.retry_after))
+        return config
+
+
+class Lane:
+    """
+    Concurrency limit with a bounded wait queue.
+
+    Usage:
+        lane = Lane("analysis", concurrency=2, max_waiting=8, wait_timeout=10)
+        async with lane.slot():
+            ...
+    """
+
+    def __init__(self, name: str, concurrency: int, max_waiting: int, wait_timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one of the lane's slots for the duration of the block.
+
+        Raises:
+            LaneFull: If max_waiting requests are already waiting, or no slot
+                frees up within wait_timeout
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_waiting:
+                self.rejected += 1
+                raise LaneFull(self.name, "queue is full")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.wait_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise LaneFull(self.name, f"wait exceeded {self.wait_timeout:.0f}s")
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionController:
+    """The app's lanes, created in the lifespan handler (app.main) as app.state.admission."""
+
+    def __init__(self, config: Optional[AdmissionConfig] = None):
+        self.config = config or AdmissionConfig.from_env()
+        self.lanes = {
+            "analysis": Lane(
+                "analysis", self.config.analysis_concurrency, self.config.analysis_queue, self.config.wait_timeout
+            ),
+            "chart": Lane(
+                "chart", self.config.chart_concurrency, self.config.chart_queue, self.config.wait_timeout
+            ),
+        }
+
+    def lane_for(self, method: str, path: str) -> Optional[Lane]:
+        """The lane of a route, or None for routes that are never held."""
+        name = LANE_ROUTES.get((method, path.rstrip("/") or "/"))
+        return self.lanes[name] if name is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Lane snapshot, for /health."""
+        return {name: lane.to_dict() for name, lane in self.lanes.items()}
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware holding a lane slot for the whole request, streamed body included.
+
+    Passes everything through when the app has no admission controller
+    (e.g. it was created without its lifespan, as in tests).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        controller: Optional[AdmissionController] = None
+        if scope["type"] == "http":
+            controller = getattr(scope["app"].state, "admission", None)
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        lane = controller.lane_for(scope["method"], path)
+        if lane is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with lane.slot():
+                await self.app(scope, receive, send)
+        except LaneFull as e:
+            response = JSONResponse(
+                {"detail": f"Server busy ({e}), retry later"},
+                status_code=503,
+                headers={"Retry-After": str(controller.config.retry_after)}
+            )
+            await response(scope, receive, send)
@@ -7,7 +7,7 @@ ready for LLM interpretation.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 import json
 
 from .stages.stage_01_core import Stage01CorePersonality, BasicChartData
@@ -25,6 +25,21 @@ from .models.types import Planet, Zodiac, House
 from .scoring import calculate_house_scores
 
 
+# CalculatorOutput section filled by each stage
+STAGE_SECTIONS = {
+    1: "basic_chart",
+    2: "soul_blueprint",
+    3: "yogas",
+    4: "wealth_assets",
+    5: "skills_initiative",
+    6: "career_status",
+    7: "creativity_legacy",
+    8: "profit_expansion",
+    9: "karmic_depth",
+    10: "timing_analysis",
+}
+
+
 @dataclass
 class CalculatorOutput:
     """
@@ -138,6 +153,9 @@ class AstroBrain:
         output = brain.analyze()
         # or
         output = brain.analyze_stage(1)  # Just Stage 1
+        # or
+        for section, value in brain.iter_analyze():  # Section by section
+            ...
     """
 
     def __init__(self, digital_twin: Dict[str, Any]):
@@ -206,18 +224,50 @@ class AstroBrain:
         Returns:
             CalculatorOutput with results from all requested stages
         """
+        for _ in self.iter_analyze(stages):
+            pass
+        return self.output
+
+    def iter_analyze(self, stages: Optional[List[int]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Run analysis stages, yielding each section as soon as it is computed.
+
+        Same stages and results as analyze(); stages run on demand as the
+        iterator is advanced, so a consumer can stream early stages while
+        later ones are still pending.
+
+        Args:
+            stages: List of stage numbers to run (1-12).
+                   If None, runs all available stages.
+
+        Yields:
+            (section, value) in completion order: a STAGE_SECTIONS name with
+            its to_dict() form (dependencies such as Stage 1 are yielded when
+            they run), then "composite_indices" and "life_areas" once
+            Stages 4-8 are done
+        """
         if stages is None:
             # Run all available stages (1-10 implemented)
             stages = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
         for stage_num in sorted(stages):
+            already_completed = len(self.output.stages_completed)
             self.analyze_stage(stage_num)
+            for completed in self.output.stages_completed[already_completed:]:
+                yield STAGE_SECTIONS[completed], self._section_dict(STAGE_SECTIONS[completed])
 
         # Calculate composite indices if stages 4-8 were run
         if all(s in self.output.stages_completed for s in [4, 5, 6, 7, 8]):
             self._calculate_composite_indices()
-
-        return self.output
+            yield "composite_indices", self.output.composite_indices
+            yield "life_areas", self.output.life_areas
+
+    def _section_dict(self, section: str) -> Any:
+        """A CalculatorOutput section in its to_dict() form."""
+        value = getattr(self.output, section)
+        if isinstance(value, BasicChartData):
+            return value.to_dict()
+        return value
 
     def analyze_stage(self, stage_num: int) -> CalculatorOutput:
         """
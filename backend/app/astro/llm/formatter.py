@@ -289,20 +289,28 @@ class AstroDataFormatter:
         return "\n".join(lines)
 
     def _format_special_lagnas(self) -> str:
-        """Format special lagnas analysis (Stage 8)"""
-        lagnas = self.data.get("special_lagnas", {})
+        """Format special lagnas analysis (Stage 8), falling back to the engine's twin section"""
+        lagnas = self.data.get("special_lagnas") or self.digital_twin.get("special_lagnas", {})
 
         if not lagnas:
             return "Специальные лагны не рассчитаны"
 
         lines = ["### Специальные лагны:"]
 
-        if "hora_lagna" in lagnas:
-            lines.append(f"- Хора Лагна: {lagnas['hora_lagna']}")
-        if "ghati_lagna" in lagnas:
-            lines.append(f"- Гхати Лагна: {lagnas['ghati_lagna']}")
-        if "bhava_lagna" in lagnas:
-            lines.append(f"- Бхава Лагна: {lagnas['bhava_lagna']}")
+        labels = [
+            ("hora_lagna", "Хора Лагна"),
+            ("ghati_lagna", "Гхати Лагна"),
+            ("bhava_lagna", "Бхава Лагна"),
+            ("sree_lagna", "Шри Лагна"),
+            ("indu_lagna", "Инду Лагна"),
+        ]
+        for key, label in labels:
+            if key not in lagnas:
+                continue
+            value = lagnas[key]
+            if isinstance(value, dict):
+                value = f"{value.get('sign_name', 'Unknown')} ({value.get('degrees', 0):.1f}°)"
+            lines.append(f"- {label}: {value}")
 
         return "\n".join(lines)
 
@@ -102,7 +102,9 @@ class PersonalityReportGenerator:
         try:
             # Format input data
             logger.info("Formatting calculator output for LLM...")
+            phase_start = time.time()
             user_prompt = format_for_llm(calculator_output)
+            metrics.format_ms = (time.time() - phase_start) * 1000
 
             logger.info(f"User prompt length: {len(user_prompt)} chars")
 
@@ -111,6 +113,7 @@ class PersonalityReportGenerator:
 
             # Call API
             logger.info("Calling MiniMax API...")
+            phase_start = time.time()
             async with MinimaxClient(self.config) as client:
                 raw_output = await client.generate_with_retry(
                     system_prompt=sys_prompt,
@@ -120,12 +123,15 @@ class PersonalityReportGenerator:
                     max_tokens=max_tokens
                 )
 
+            metrics.api_ms = (time.time() - phase_start) * 1000
             metrics.latency_ms = (time.time() - start_time) * 1000
             logger.info(f"API call completed in {metrics.latency_ms:.0f}ms")
 
             # Validate output
             logger.info("Validating LLM output...")
+            phase_start = time.time()
             output, validation = self.validator.validate(raw_output)
+            metrics.validation_ms = (time.time() - phase_start) * 1000
 
             if not validation.is_valid:
                 logger.warning(f"Validation failed: {validation.errors}")
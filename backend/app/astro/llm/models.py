@@ -89,6 +89,10 @@ class GenerationMetrics:
     latency_ms: float = 0.0
     retries: int = 0
     model: str = "MiniMax-Text-01"
+    # Phase breakdown (0.0 if the phase was not reached)
+    format_ms: float = 0.0        # Calculator output -> prompt
+    api_ms: float = 0.0           # LLM API call, retries included
+    validation_ms: float = 0.0    # Output parsing and validation
 
     def to_dict(self) -> dict:
         return {
@@ -96,5 +100,8 @@ class GenerationMetrics:
             "output_tokens": self.output_tokens,
             "latency_ms": self.latency_ms,
             "retries": self.retries,
-            "model": self.model
+            "model": self.model,
+            "format_ms": self.format_ms,
+            "api_ms": self.api_ms,
+            "validation_ms": self.validation_ms,
         }
@@ -26,7 +26,12 @@ Target calibration:
 - Average: 45-55
 """
 
-from .calculator import HouseScoreCalculator, calculate_house_scores, get_house_score_details
+from .calculator import (
+    HouseScoreCalculator,
+    calculate_house_scores,
+    get_house_score_details,
+    PHASE_8_5_ERRORS,
+)
 from .layers import D1Layer, D9Layer, VargaLayer, YogaLayer, JaiminiLayer
 from .neecha_bhanga import (
     NeechaBhangaAnalyzer,
@@ -61,6 +66,7 @@ __all__ = [
     "HouseScoreCalculator",
     "calculate_house_scores",
     "get_house_score_details",
+    "PHASE_8_5_ERRORS",
     "D1Layer",
     "D9Layer",
     "VargaLayer",
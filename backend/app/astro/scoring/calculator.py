@@ -15,8 +15,10 @@ Target distribution:
 - Weak house: 20-35
 """
 
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
+import logging
 
 from .layers import D1Layer, D9Layer, VargaLayer, YogaLayer, JaiminiLayer, LayerResult
 
@@ -33,6 +35,18 @@ try:
 except ImportError:
     PHASE_8_5_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Phase 8.5 layer failures by layer name since import (per process). A failing
+# layer is left out of the score rather than failing it; this makes it visible.
+PHASE_8_5_ERRORS: Counter = Counter()
+
+
+def _phase_8_5_layer_failed(layer: str) -> None:
+    """Count (and debug-log) a Phase 8.5 layer that raised."""
+    PHASE_8_5_ERRORS[layer] += 1
+    logger.debug(f"Phase 8.5 layer {layer} failed", exc_info=True)
+
 
 @dataclass
 class HouseScoreResult:
@@ -164,7 +178,7 @@ class HouseScoreCalculator:
                 details={h: [f"Bhava Bala score: {s:.2f}"] for h, s in bhava_scores.items()}
             )
         except Exception:
-            pass
+            _phase_8_5_layer_failed("BhavaBala")
 
         try:
             # 2. Sudarshana Chakra Layer (±5 points)
@@ -175,7 +189,7 @@ class HouseScoreCalculator:
                 details={h: [f"Sudarshana score: {s:.2f}"] for h, s in sudarshana_scores.items()}
             )
         except Exception:
-            pass
+            _phase_8_5_layer_failed("Sudarshana")
 
         try:
             # 3. Upagraha Layer (±3 points)
@@ -186,7 +200,7 @@ class HouseScoreCalculator:
                 details={h: [f"Upagraha score: {s:.2f}"] for h, s in upagraha_scores.items()}
             )
         except Exception:
-            pass
+            _phase_8_5_layer_failed("Upagraha")
 
         try:
             # 4. Sahama Layer (±3 points)
@@ -197,7 +211,7 @@ class HouseScoreCalculator:
                 details={h: [f"Sahama score: {s:.2f}"] for h, s in sahama_scores.items()}
             )
         except Exception:
-            pass
+            _phase_8_5_layer_failed("Sahama")
 
         try:
             # 5. Tara Bala Layer (±3 points)
@@ -208,7 +222,7 @@ class HouseScoreCalculator:
                 details={h: [f"Tara Bala score: {s:.2f}"] for h, s in tara_scores.items()}
             )
         except Exception:
-            pass
+            _phase_8_5_layer_failed("TaraBal")
 
         return results
 
@@ -559,9 +559,35 @@ class Stage12JaiminiSynthesis:
         Arudha Lagna = Lord of Lagna counted from Lagna,
         then same distance from Lord's position.
 
+        Uses the engine's precomputed "arudha_padas" section (A1 in D1)
+        when the digital twin has it; otherwise calculates from D1 planets.
+
         Returns:
             ArudhaLagnaAnalysis with public image interpretation
         """
+        precomputed = self.digital_twin.get("arudha_padas", {}).get("D1", {}).get("A1")
+        if precomputed:
+            al_sign_id = precomputed.get("sign_id", self.lagna_sign_id)
+        else:
+            al_sign_id = self._calculate_arudha_lagna_sign_id()
+
+        try:
+            al_sign = Zodiac(al_sign_id)
+        except (ValueError, TypeError):
+            al_sign = Zodiac.ARIES
+
+        al_house_from_lagna = ((al_sign_id - self.lagna_sign_id) % 12) + 1
+
+        interpretation = ARUDHA_INTERPRETATIONS.get(al_house_from_lagna, "Unique public image expression.")
+
+        return ArudhaLagnaAnalysis(
+            sign=al_sign.name.title(),
+            house_from_lagna=al_house_from_lagna,
+            interpretation=interpretation,
+        )
+
+    def _calculate_arudha_lagna_sign_id(self) -> int:
+        """Calculate the Arudha Lagna sign id (1-12) from D1 planets."""
         try:
             lagna_sign = Zodiac(self.lagna_sign_id)
         except (ValueError, TypeError):
@@ -586,27 +612,14 @@ class Stage12JaiminiSynthesis:
         # AL sign = lord_sign + (lord_house - 1)
         al_sign_id = ((lord_sign_id - 1) + (lord_house - 1)) % 12 + 1
 
-        # Handle special cases (if AL falls in 1 or 7 from lord, move to 10 or 4)
-        al_from_lord = ((al_sign_id - lord_sign_id) % 12) + 1
-        if al_from_lord == 1:
-            al_sign_id = ((lord_sign_id - 1) + 9) % 12 + 1  # Move to 10th
-        elif al_from_lord == 7:
-            al_sign_id = ((lord_sign_id - 1) + 3) % 12 + 1  # Move to 4th
-
-        try:
-            al_sign = Zodiac(al_sign_id)
-        except (ValueError, TypeError):
-            al_sign = Zodiac.ARIES
-
-        al_house_from_lagna = ((al_sign_id - self.lagna_sign_id) % 12) + 1
-
-        interpretation = ARUDHA_INTERPRETATIONS.get(al_house_from_lagna, "Unique public image expression.")
+        # Handle special cases (if AL falls in 1st or 7th from Lagna, move to 10th or 4th)
+        al_from_lagna = ((al_sign_id - self.lagna_sign_id) % 12) + 1
+        if al_from_lagna == 1:
+            al_sign_id = ((self.lagna_sign_id - 1) + 9) % 12 + 1  # Move to 10th
+        elif al_from_lagna == 7:
+            al_sign_id = ((self.lagna_sign_id - 1) + 3) % 12 + 1  # Move to 4th
 
-        return ArudhaLagnaAnalysis(
-            sign=al_sign.name.title(),
-            house_from_lagna=al_house_from_lagna,
-            interpretation=interpretation,
-        )
+        return al_sign_id
 
     def _analyze_badhaka(self) -> BadhakaAnalysis:
         """
@@ -523,6 +523,26 @@ class TestStage12JaiminiSynthesis:
         assert "career_direction" in result.jaimini_summary
         assert "investment_insight" in result.jaimini_summary
 
+    def test_arudha_lagna_uses_precomputed_padas(self, digital_twin_fixture, mock_d1_planets, mock_d9_planets):
+        """Test Arudha Lagna is read from the engine's arudha_padas section"""
+        twin = dict(digital_twin_fixture)
+        lagna_sign_id = twin["vargas"]["D1"]["ascendant"]["sign_id"]
+        al_sign_id = (lagna_sign_id - 1 + 4) % 12 + 1  # 5th from Lagna
+        twin["arudha_padas"] = {"D1": {"A1": {"sign_id": al_sign_id, "sign_name": "", "house": 5}}}
+
+        stage12 = Stage12JaiminiSynthesis(twin, mock_d1_planets, mock_d9_planets)
+        result = stage12.analyze()
+
+        assert result.arudha_lagna.house_from_lagna == 5
+        assert result.arudha_lagna.sign == Zodiac(al_sign_id).name.title()
+
+    def test_arudha_lagna_fallback_exceptions(self, digital_twin_fixture, mock_d1_planets, mock_d9_planets):
+        """Test fallback Arudha Lagna never falls in the 1st or 7th from Lagna"""
+        stage12 = Stage12JaiminiSynthesis(digital_twin_fixture, mock_d1_planets, mock_d9_planets)
+        result = stage12.analyze()
+
+        assert result.arudha_lagna.house_from_lagna not in (1, 7)
+
 
 class TestCharaKarakaWithPreCalculated:
     """Tests for Stage 12 with pre-calculated Chara Karakas"""
@@ -0,0 +1,301 @@
+"""
+StarMeet API - Response Cache
+
+Redis-backed cache for calculation results, shared by all API workers.
+
+Keys are built from the canonicalized request plus the engine version, so a
+deploy that changes calculation output never serves stale results. Misses
+are protected against stampedes with a short SET NX lock: one caller computes,
+concurrent callers for the same key wait for its result.
+
+Redis errors never fail a request; the cache is bypassed instead. Values are
+stored as JSON encoded with orjson (app.responses.dumps).
+
+Configuration (environment):
+    REDIS_URL                   Redis URL; in-process cache if unset
+    CACHE_MEMORY_MAX_ENTRIES    Keys kept by the in-process cache (default: 128)
+    CACHE_ENABLED               "false" disables caching (default: true)
+    CACHE_TTL_CALCULATE         Natal core TTL in seconds (default: 30 days)
+    CACHE_TTL_FULL_CALCULATE    /full-calculate response TTL (default: 1 day)
+    CACHE_LOCK_TIMEOUT          Stampede lock lifetime in seconds (default: 30)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import orjson
+from fastapi import FastAPI, Request
+
+from app.responses import dumps
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.engine import ENGINE_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Key prefix; the engine version invalidates everything on calculation changes
+KEY_PREFIX = f"starmeet:{ENGINE_VERSION}"
+
+# Coordinates are rounded to 4 decimals (~11 m) before keying
+COORDINATE_PRECISION = 4
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class InMemoryCacheBackend:
+    """
+    In-process stand-in for Redis (tests, local runs without REDIS_URL).
+
+    Implements the subset of the redis.asyncio API the cache uses. Holds at
+    most max_entries keys, evicting the least recently used; expired entries
+    are swept on every write.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+
+    def _alive(self, key: str) -> bool:
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return False
+        return True
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._data.items() if expires_at is not None and expires_at <= now]
+        for key in expired:
+            del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if not self._alive(key):
+            return None
+        self._data.move_to_end(key)
+        return self._data[key][0]
+
+    async def set(self, key: str, value: Any, ex: Optional[float] = None, nx: bool = False) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._sweep()
+        self._data[key] = (value, time.monotonic() + ex if ex else None)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    async def aclose(self) -> None:
+        self._data.clear()
+
+
+def create_backend(redis_url: Optional[str], memory_max_entries: int = 128):
+    """Redis client for redis_url, or the in-memory backend (memory_max_entries keys) if unset."""
+    if not redis_url:
+        return InMemoryCacheBackend(memory_max_entries)
+    import redis.asyncio as redis
+    return redis.Redis.from_url(redis_url, socket_timeout=1.0, socket_connect_timeout=1.0)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+@dataclass
+class CacheConfig:
+    """Response cache configuration"""
+    redis_url: Optional[str] = None
+    enabled: bool = True
+    ttl_calculate: int = 30 * 24 * 3600
+    ttl_full_calculate: int = 24 * 3600
+    lock_timeout: float = 30.0
+    lock_poll_interval: float = 0.05
+    memory_max_entries: int = 128
+
+    @classmethod
+    def from_env(cls) -> "CacheConfig":
+        """Load configuration from REDIS_URL and CACHE_* environment variables."""
+        config = cls(redis_url=os.getenv("REDIS_URL") or None)
+        config.enabled = os.getenv("CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        config.ttl_calculate = int(os.getenv("CACHE_TTL_CALCULATE", config.ttl_calculate))
+        config.ttl_full_calculate = int(os.getenv("CACHE_TTL_FULL_CALCULATE", config.ttl_full_calculate))
+        config.lock_timeout = float(os.getenv("CACHE_LOCK_TIMEOUT", config.lock_timeout))
+        config.memory_max_entries = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", config.memory_max_entries))
+        return config
+
+
+@dataclass
+class CacheStats:
+    """Counters since startup (per worker process)."""
+    hits: int = 0
+    misses: int = 0
+    lock_waits: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "lock_waits": self.lock_waits,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def canonical_request(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize request fields that have several spellings for the same chart.
+
+    - lat/lon rounded to COORDINATE_PRECISION decimals
+    - time zero-padded to HH:MM
+    - string values stripped and lowercased (ayanamsa)
+    """
+    canonical = {}
+    for name, value in payload.items():
+        if name in ("lat", "lon") and value is not None:
+            value = round(float(value), COORDINATE_PRECISION)
+        elif name == "time" and isinstance(value, str):
+            parts = value.strip().split(":")
+            try:
+                value = f"{int(parts[0]):02d}:{int(parts[1]) if len(parts) > 1 else 0:02d}"
+            except ValueError:
+                value = value.strip()
+        elif isinstance(value, str):
+            value = value.strip().lower()
+        canonical[name] = value
+    return canonical
+
+
+class ResponseCache:
+    """
+    Calculation cache with stampede protection.
+
+    Usage:
+        cache = ResponseCache(CacheConfig.from_env())
+        key = cache.make_key("calculate", request.model_dump())
+        value = await cache.get_or_compute(key, compute, ttl=cache.config.ttl_calculate)
+    """
+
+    def __init__(self, config: Optional[CacheConfig] = None, backend=None):
+        self.config = config or CacheConfig.from_env()
+        self.backend = backend if backend is not None else create_backend(self.config.redis_url, self.config.memory_max_entries)
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(namespace: str, payload: Dict[str, Any]) -> str:
+        """Cache key for a request payload under a namespace."""
+        body = json.dumps(canonical_request(payload), sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+        return f"{KEY_PREFIX}:{namespace}:{digest}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None (also on backend errors)."""
+        try:
+            raw = await self.backend.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache get failed: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store value for ttl seconds (errors are logged, not raised)."""
+        try:
+            await self.backend.set(key, dumps(value), ex=ttl)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache set failed: {e}")
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        should_cache: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Only one caller computes a missing key: it takes a lock (SET NX with
+        lock_timeout expiry); others poll for the result until the lock
+        expires, then compute themselves.
+
+        Args:
+            key: Cache key (see make_key)
+            compute: Coroutine factory producing the value
+            ttl: Seconds to keep the value
+            should_cache: Predicate deciding whether a computed value is stored
+        """
+        if not self.config.enabled:
+            return await compute()
+
+        cached = await self.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+        self.stats.misses += 1
+
+        lock_key = f"{key}:lock"
+        try:
+            acquired = await self.backend.set(lock_key, b"1", ex=int(self.config.lock_timeout), nx=True)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache lock failed: {e}")
+            return await compute()
+
+        if not acquired:
+            self.stats.lock_waits += 1
+            deadline = time.monotonic() + self.config.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.config.lock_poll_interval)
+                cached = await self.get(key)
+                if cached is not None:
+                    return cached
+                try:
+                    if await self.backend.get(lock_key) is None:
+                        break  # Holder failed or chose not to cache
+                except Exception:
+                    break
+            return await compute()
+
+        try:
+            value = await compute()
+            if should_cache(value):
+                await self.set(key, value, ttl)
+            return value
+        finally:
+            try:
+                await self.backend.delete(lock_key)
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        """Close the backend connection."""
+        await self.backend.aclose()
+
+
+def get_cache(request: Union[Request, FastAPI]) -> Optional[ResponseCache]:
+    """The app's ResponseCache (from a request or the app), or None if the app was created without its lifespan."""
+    app = request if isinstance(request, FastAPI) else request.app
+    return getattr(app.state, "response_cache", None)
@@ -0,0 +1,125 @@
+"""
+StarMeet API - ETags and Conditional Requests
+
+Lets clients revalidate large responses (165 KB twins) instead of
+downloading them again: responses carry an ETag and a request whose
+If-None-Match names it gets 304 Not Modified with an empty body.
+
+ETags are computed without re-reading or re-serializing what they describe:
+    saved profiles      content hash of the stored file, cached by the file's
+                        (mtime, size, inode); /save primes it as it writes
+    profile list        hash of the profile files' stat metadata
+    /calculate          hash of the natal core cache key (engine version and
+                        resolved inputs), the as-of date, the projection,
+                        the detected timezone and the response media type
+
+Profile validators are strong: they hash the exact bytes served. /calculate
+validators are weak (W/"..."): two responses for the same inputs differ in
+meta.generated_at, so they are equivalent but not byte-identical.
+If-None-Match is compared weakly, as RFC 9110 requires.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# (mtime_ns, size, inode) of a file version
+FileVersion = Tuple[int, int, int]
+
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag (quoted) for a byte string."""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_for(payload: Any) -> str:
+    """ETag of a JSON-serializable description of a representation."""
+    return make_etag(json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def weak_etag_for(payload: Any) -> str:
+    """Weak ETag (W/"...") of a description of semantically equivalent representations."""
+    return f"W/{etag_for(payload)}"
+
+
+def file_version(stat: os.stat_result) -> FileVersion:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def directory_etag(paths: Iterable[Path]) -> str:
+    """ETag of a set of files from their names and stat metadata (files are not read)."""
+    entries = []
+    for path in paths:
+        try:
+            entries.append((path.name, *file_version(path.stat())))
+        except FileNotFoundError:
+            continue
+    return etag_for(sorted(entries))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, etag: str, headers: Optional[Dict[str, str]] = None) -> Optional[Response]:
+    """
+    304 response if the request's If-None-Match matches etag, else None.
+
+    headers (e.g. Vary, Cache-Control) are repeated on the 304 as they would
+    be sent with the full response.
+    """
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(status_code=304, headers={**(headers or {}), "ETag": etag})
+
+
+class FileETags:
+    """
+    Content-hash ETags of files, cached per file version.
+
+    Usage:
+        etag = profile_etags.cached(path, path.stat())    # None: not hashed yet
+        if etag is None:
+            content = path.read_bytes()
+            etag = profile_etags.store(path, stat, content)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[FileVersion, str]]" = OrderedDict()
+
+    def cached(self, path: Path, stat: os.stat_result) -> Optional[str]:
+        """ETag of the file version described by stat, if it has been hashed."""
+        entry = self._entries.get(str(path))
+        if entry is None or entry[0] != file_version(stat):
+            return None
+        self._entries.move_to_end(str(path))
+        return entry[1]
+
+    def store(self, path: Path, stat: os.stat_result, content: bytes) -> str:
+        """Hash content (the file's bytes at version stat) and remember it."""
+        etag = make_etag(content)
+        self._entries[str(path)] = (file_version(stat), etag)
+        self._entries.move_to_end(str(path))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return etag
+
+    def discard(self, path: Path) -> None:
+        self._entries.pop(str(path), None)
+
+
+# Saved profiles of this process (app.routers.astro)
+profile_etags = FileETags()
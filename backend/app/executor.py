@@ -0,0 +1,147 @@
+"""
+StarMeet API - Compute Pool
+
+Bounded, pre-warmed process pool for CPU-bound chart and analysis work.
+
+Handlers are async but the engine and AstroBrain are synchronous and CPU-bound;
+running them on the event loop stalls /health, in-flight LLM calls and every
+other request on the worker. The pool is created in the lifespan handler
+(app.main) and stored on app.state.compute_pool; handlers await run_compute().
+
+Configuration (environment):
+    COMPUTE_WORKERS        Worker processes (default: CPU count, max 4)
+    COMPUTE_MAX_PENDING    Tasks admitted at once, queued + running (default: 4 x workers)
+    COMPUTE_TASK_TIMEOUT   Per-task timeout in seconds (default: 60)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional, Union
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import HTTPConnection
+
+from app import tasks
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.phases import record_error, replay
+
+
+class ComputeTimeout(Exception):
+    """A compute task did not finish within its timeout."""
+
+    def __init__(self, task_name: str, timeout: float):
+        self.task_name = task_name
+        self.timeout = timeout
+        super().__init__(f"{task_name} did not finish within {timeout:.0f}s")
+
+
+@dataclass
+class ComputePoolConfig:
+    """Compute pool configuration"""
+    workers: int = min(os.cpu_count() or 1, 4)
+    max_pending: int = 0           # 0 = 4 x workers
+    task_timeout: float = 60.0     # seconds
+
+    @classmethod
+    def from_env(cls) -> "ComputePoolConfig":
+        """Load configuration from COMPUTE_* environment variables."""
+        config = cls()
+        config.workers = int(os.getenv("COMPUTE_WORKERS", config.workers))
+        config.max_pending = int(os.getenv("COMPUTE_MAX_PENDING", config.max_pending))
+        config.task_timeout = float(os.getenv("COMPUTE_TASK_TIMEOUT", config.task_timeout))
+        return config
+
+
+class ComputePool:
+    """
+    Process pool with admission bound and per-task timeouts.
+
+    Usage:
+        pool = ComputePool()
+        await pool.start()
+        twin = await pool.run(tasks.enhanced_twin_task, birth_datetime, lat, lon, tz, "Raman")
+        pool.shutdown()
+
+    A task that times out keeps running in its worker until it completes
+    (processes cannot be interrupted safely), but the caller is released and
+    its admission slot is freed.
+    """
+
+    def __init__(self, config: Optional[ComputePoolConfig] = None):
+        self.config = config or ComputePoolConfig.from_env()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0   # Tasks waiting for a slot, queued or running
+        self._slots = asyncio.Semaphore(self.config.max_pending or 4 * self.config.workers)
+
+    async def start(self) -> None:
+        """Start the worker processes and wait until each has imported the engine."""
+        self._executor = ProcessPoolExecutor(max_workers=self.config.workers)
+        loop = asyncio.get_running_loop()
+        # One warm-up task per worker; ProcessPoolExecutor spawns workers on demand
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, tasks.warm_up)
+            for _ in range(self.config.workers)
+        ))
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process.
+
+        Waits for an admission slot first, so at most max_pending tasks are
+        queued or running at once. Phases the task records (astro_core.phases)
+        are reported to this process's observers.
+
+        Raises:
+            ComputeTimeout: If the task does not finish within timeout
+                (default: config.task_timeout)
+        """
+        if self._executor is None:
+            raise RuntimeError("ComputePool is not started")
+
+        timeout = timeout or self.config.task_timeout
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            async with self._slots:
+                future = loop.run_in_executor(self._executor, partial(tasks.run_instrumented, fn, *args))
+                try:
+                    result, record = await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    record_error("compute_timeout")
+                    raise ComputeTimeout(fn.__name__, timeout)
+        finally:
+            self.pending -= 1
+        replay(record)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling queued tasks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+async def run_compute(request: Union[HTTPConnection, FastAPI], fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a compute task on the app's pool.
+
+    request is the current request or WebSocket, or the app itself for work
+    that runs outside a request (background jobs).
+
+    Falls back to the threadpool when no pool is configured (e.g. the app was
+    created without its lifespan, as in tests), so the event loop is never blocked.
+    """
+    app = request if isinstance(request, FastAPI) else request.app
+    pool: Optional[ComputePool] = getattr(app.state, "compute_pool", None)
+    if pool is None:
+        result, record = await run_in_threadpool(tasks.run_instrumented, fn, *args)
+        replay(record)
+        return result
+    return await pool.run(fn, *args)
@@ -0,0 +1,218 @@
+"""
+StarMeet API - Background Jobs
+
+Job store and bounded worker queue for long-running pipelines (the
+/full-calculate LLM report can take minutes with retries).
+
+A job is submitted with a coroutine factory; the caller gets the job record
+back immediately and polls GET /v1/jobs/{id} or follows its SSE stream
+(app.routers.jobs). Job records live in Redis when REDIS_URL is set, so any
+API worker can answer status requests; the queue and its workers are
+per-process, so a job runs in the worker that accepted it.
+
+Configuration (environment):
+    JOBS_WORKERS       Concurrent jobs per API worker (default: 2)
+    JOBS_MAX_QUEUED    Jobs waiting per API worker before 503 (default: 100)
+    JOBS_TIMEOUT       Seconds a job may run before it fails (default: 600)
+    JOBS_TTL           Seconds job records are kept (default: 1 day)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from fastapi import FastAPI, HTTPException, Request
+
+from app.cache import create_backend
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "starmeet:jobs"
+
+# Job lifecycle
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+FINAL_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+# A job body: awaited with a progress callback, returns the job result
+ProgressFn = Callable[[str], Awaitable[None]]
+JobFn = Callable[[ProgressFn], Awaitable[Dict[str, Any]]]
+
+
+class JobQueueFull(Exception):
+    """The job queue is at capacity."""
+
+
+@dataclass
+class JobQueueConfig:
+    """Job queue configuration"""
+    redis_url: Optional[str] = None
+    workers: int = 2
+    max_queued: int = 100
+    timeout: float = 600.0
+    ttl: int = 24 * 3600
+
+    @classmethod
+    def from_env(cls) -> "JobQueueConfig":
+        """Load configuration from REDIS_URL and JOBS_* environment variables."""
+        config = cls(redis_url=os.getenv("REDIS_URL") or None)
+        config.workers = int(os.getenv("JOBS_WORKERS", config.workers))
+        config.max_queued = int(os.getenv("JOBS_MAX_QUEUED", config.max_queued))
+        config.timeout = float(os.getenv("JOBS_TIMEOUT", config.timeout))
+        config.ttl = int(os.getenv("JOBS_TTL", config.ttl))
+        return config
+
+
+class JobStore:
+    """
+    Job records as JSON under starmeet:jobs:{id}.
+
+    Record fields: id, kind, status, stage, created_at, updated_at, result, error.
+    """
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{KEY_PREFIX}:{job_id}"
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.backend.get(self._key(job_id))
+        return json.loads(raw) if raw is not None else None
+
+    async def put(self, job: Dict[str, Any]) -> None:
+        job["updated_at"] = datetime.now().isoformat()
+        await self.backend.set(self._key(job["id"]), json.dumps(job, ensure_ascii=False, default=str), ex=self.ttl)
+
+    async def close(self) -> None:
+        await self.backend.aclose()
+
+
+class JobQueue:
+    """
+    Bounded queue of jobs with a fixed number of worker tasks.
+
+    Usage:
+        queue = JobQueue()
+        await queue.start()
+        job = await queue.submit("full-calculate", lambda progress: pipeline(progress))
+        ...
+        await queue.stop()
+        await queue.store.close()
+    """
+
+    def __init__(self, config: Optional[JobQueueConfig] = None, backend=None):
+        self.config = config or JobQueueConfig.from_env()
+        self.store = JobStore(
+            backend if backend is not None else create_backend(self.config.redis_url),
+            self.config.ttl
+        )
+        self._queue: "asyncio.Queue[Tuple[Dict[str, Any], JobFn]]" = asyncio.Queue(self.config.max_queued)
+        self._workers: list = []
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a worker in this process."""
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.config.workers)]
+
+    async def submit(self, kind: str, fn: JobFn) -> Dict[str, Any]:
+        """
+        Queue a job and return its record.
+
+        Raises:
+            JobQueueFull: If max_queued jobs are already waiting
+        """
+        if self._queue.full():
+            raise JobQueueFull(f"{self._queue.qsize()} jobs queued")
+        now = datetime.now().isoformat()
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": STATUS_QUEUED,
+            "stage": None,
+            "created_at": now,
+            "updated_at": now,
+            "result": None,
+            "error": None,
+        }
+        await self.store.put(job)
+        self._queue.put_nowait((job, fn))
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job, fn = await self._queue.get()
+            try:
+                await self._run(job, fn)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Dict[str, Any], fn: JobFn) -> None:
+        async def progress(stage: str) -> None:
+            job["stage"] = stage
+            await self.store.put(job)
+
+        job["status"] = STATUS_RUNNING
+        await self.store.put(job)
+        try:
+            job["result"] = await asyncio.wait_for(fn(progress), self.config.timeout)
+            job["status"] = STATUS_SUCCEEDED
+        except asyncio.CancelledError:
+            job["status"] = STATUS_FAILED
+            job["error"] = "Job cancelled (server shutting down)"
+            await self.store.put(job)
+            raise
+        except asyncio.TimeoutError:
+            job["status"] = STATUS_FAILED
+            job["error"] = f"Job did not finish within {self.config.timeout:.0f}s"
+        except HTTPException as e:
+            job["status"] = STATUS_FAILED
+            job["error"] = str(e.detail)
+        except Exception as e:
+            logger.exception(f"Job {job['id']} failed")
+            job["status"] = STATUS_FAILED
+            job["error"] = f"{type(e).__name__}: {e}"
+        job["stage"] = None
+        try:
+            await self.store.put(job)
+        except Exception as e:
+            logger.warning(f"Could not store job {job['id']}: {e}")
+
+    async def stop(self) -> None:
+        """Cancel the workers (running jobs fail) and mark queued jobs failed."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            job, _ = self._queue.get_nowait()
+            job["status"] = STATUS_FAILED
+            job["error"] = "Job cancelled (server shutting down)"
+            await self.store.put(job)
+
+
+def get_job_queue(request: Union[Request, FastAPI]) -> JobQueue:
+    """
+    The app's JobQueue.
+
+    Raises:
+        HTTPException(503): If the app was created without its lifespan
+    """
+    app = request if isinstance(request, FastAPI) else request.app
+    queue = getattr(app.state, "job_queue", None)
+    if queue is None:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return queue
@@ -5,12 +5,23 @@ Main application entry point
 API Namespace: /star-api (via Nginx proxy)
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
-from app.routers import astro
+from app.routers import astro, jobs
+from app.admission import AdmissionController, AdmissionMiddleware
+from app import metrics
+from app.timing import ServerTimingMiddleware
+from app.executor import ComputePool
+from app.cache import ResponseCache
+from app.jobs import JobQueue
+from app.singleflight import singleflight_stats
+from app.timezones import timezone_resolver
+from app.warmup import STATUS_READY, WarmupState, warm_up, warmup_enabled
 
 
 @asynccontextmanager
@@ -18,9 +29,30 @@ async def lifespan(app: FastAPI):
     """Application lifecycle handler."""
     # Startup
     print("StarMeet API starting...")
+    metrics.install()
+    app.state.admission = AdmissionController()
+    app.state.compute_pool = ComputePool()
+    await app.state.compute_pool.start()
+    print(f"Compute pool ready ({app.state.compute_pool.config.workers} workers)")
+    app.state.response_cache = ResponseCache()
+    app.state.job_queue = JobQueue()
+    await app.state.job_queue.start()
+    # Warm up in the background; /ready reports not-ready until it is done
+    if warmup_enabled():
+        app.state.warmup = WarmupState()
+        warmup_task = asyncio.create_task(warm_up(app))
+    else:
+        app.state.warmup = WarmupState(status=STATUS_READY)
+        warmup_task = None
     yield
     # Shutdown
     print("StarMeet API shutting down...")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await app.state.job_queue.stop()
+    await app.state.job_queue.store.close()
+    app.state.compute_pool.shutdown()
+    await app.state.response_cache.close()
 
 
 app = FastAPI(
@@ -33,6 +65,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Concurrency limits and priority lanes for CPU-heavy endpoints
+# (added first so it runs inside CORS and 503s carry CORS headers)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS middleware for Next.js frontend
 app.add_middleware(
     CORSMiddleware,
@@ -46,14 +82,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing header with the request's pipeline phases
+app.add_middleware(ServerTimingMiddleware)
+
+# Request latency per route (outermost, so admission waits are included)
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(astro.router, prefix="/v1", tags=["astro"])
+app.include_router(jobs.router, prefix="/v1", tags=["jobs"])
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker/Nginx."""
-    return {"status": "healthy", "service": "starmeet-api", "version": "1.0.0"}
+    return {
+        "status": "healthy",
+        "service": "starmeet-api",
+        "version": "1.0.0",
+        "singleflight": singleflight_stats(),
+        "timezone_cache": timezone_resolver.stats(),
+        "admission": app.state.admission.stats() if hasattr(app.state, "admission") else None,
+    }
+
+
+@app.get("/ready")
+async def readiness_check(request: Request):
+    """
+    Readiness probe for Docker/Nginx: 200 once the startup warm-up has
+    finished, 503 while it runs or if it failed (see app.warmup).
+    """
+    state = getattr(request.app.state, "warmup", None) or WarmupState()
+    return JSONResponse(state.to_dict(), status_code=200 if state.ready else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    """Prometheus metrics (see app.metrics)."""
+    return metrics.metrics_response(request.app)
 
 
 @app.get("/")
@@ -66,6 +132,10 @@ async def root():
         "endpoints": {
             "calculate": "POST /star-api/v1/calculate",
             "save": "POST /star-api/v1/save",
+            "jobs": "POST /star-api/v1/jobs/full-calculate",
+            "analysis_stream": "POST /star-api/v1/full-calculate/stream",
             "health": "GET /star-api/health",
+            "ready": "GET /star-api/ready",
+            "metrics": "GET /star-api/metrics",
         }
     }
@@ -0,0 +1,178 @@
+"""
+StarMeet API - Prometheus Metrics
+
+Exposed at GET /metrics (app.main) in the Prometheus text format:
+
+    starmeet_request_duration_seconds{method,route,status}   Request latency per route template
+    starmeet_phase_duration_seconds{phase}                    Pipeline phase latency:
+        ephemeris, twin_generation        (astro_core.engine)
+        twin_shift                        (incremental birth-time shift, astro_core.engine)
+        scrub_update                      (one /ws/scrub slider update, end to end)
+        astrobrain.<section>              (each AstroBrain stage, app.tasks)
+        house_scoring, planet_scoring     (Phase 8-9 scores)
+        llm_formatting, llm_call, llm_validation
+    starmeet_errors_total{kind}                               Handled errors: http_5xx,
+        compute_timeout, house_scoring, planet_scoring, house_layer.<Layer>
+        (Phase 8.5 layers left out of a score), llm_generation
+    starmeet_cache_*, starmeet_compute_pending, starmeet_admission_*,
+    starmeet_singleflight_*, starmeet_jobs_queued,
+    starmeet_timezone_cache_*                                 State gauges, read at scrape time
+
+Phases are reported through astro_core.phases; work done in compute pool
+workers is captured there and replayed here (app.executor), so all series
+live in the API process. With several API workers each one is scraped
+separately (no multiprocess mode).
+
+prometheus_client is optional: without it nothing is recorded and /metrics
+answers 503.
+"""
+
+import time
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prometheus client is optional
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+except ImportError:
+    REGISTRY = None
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.phases import add_observers, remove_observers
+
+from app.singleflight import singleflight_stats
+from app.timezones import timezone_resolver
+
+# Phases run from a few ms (stages) to minutes (LLM call with retries)
+PHASE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+if REGISTRY is not None:
+    REQUEST_LATENCY = Histogram(
+        "starmeet_request_duration_seconds", "HTTP request latency by route template",
+        ["method", "route", "status"], buckets=PHASE_BUCKETS
+    )
+    PHASE_LATENCY = Histogram(
+        "starmeet_phase_duration_seconds", "Calculation pipeline phase latency",
+        ["phase"], buckets=PHASE_BUCKETS
+    )
+    ERRORS = Counter("starmeet_errors", "Handled errors by kind", ["kind"])
+
+    CACHE_LOOKUPS = Gauge("starmeet_cache_lookups", "Response cache lookups since startup", ["result"])
+    CACHE_HIT_RATIO = Gauge("starmeet_cache_hit_ratio", "Response cache hit ratio since startup")
+    COMPUTE_PENDING = Gauge("starmeet_compute_pending", "Compute pool tasks waiting or running")
+    ADMISSION_ACTIVE = Gauge("starmeet_admission_active", "Requests holding a lane slot", ["lane"])
+    ADMISSION_WAITING = Gauge("starmeet_admission_waiting", "Requests waiting for a lane slot", ["lane"])
+    ADMISSION_REJECTED = Gauge("starmeet_admission_rejected", "Requests rejected by a lane since startup", ["lane"])
+    SINGLEFLIGHT_COALESCED = Gauge(
+        "starmeet_singleflight_coalesced", "Calls served by an in-flight computation since startup", ["flight"]
+    )
+    SINGLEFLIGHT_INFLIGHT = Gauge("starmeet_singleflight_inflight", "Computations in flight", ["flight"])
+    JOBS_QUEUED = Gauge("starmeet_jobs_queued", "Background jobs waiting for a worker")
+    TZ_CACHE_LOOKUPS = Gauge(
+        "starmeet_timezone_cache_lookups", "Timezone resolver cache lookups since startup", ["cache", "result"]
+    )
+    TZ_CACHE_HIT_RATIO = Gauge("starmeet_timezone_cache_hit_ratio", "Timezone resolver cache hit ratio", ["cache"])
+
+
+def _observe_phase(name: str, seconds: float) -> None:
+    PHASE_LATENCY.labels(name).observe(seconds)
+
+
+def _observe_error(name: str) -> None:
+    ERRORS.labels(name).inc()
+
+
+def install() -> None:
+    """Route astro_core.phases observations into the histograms and error counter."""
+    if REGISTRY is not None:
+        add_observers(_observe_phase, _observe_error)
+
+
+def uninstall() -> None:
+    """Stop observing astro_core.phases."""
+    remove_observers(_observe_phase, _observe_error)
+
+
+def _update_state_gauges(app: FastAPI) -> None:
+    """Copy the app's cache, pool, admission, singleflight, job queue and timezone cache state into gauges."""
+    state = app.state
+    cache = getattr(state, "response_cache", None)
+    if cache is not None:
+        CACHE_LOOKUPS.labels("hit").set(cache.stats.hits)
+        CACHE_LOOKUPS.labels("miss").set(cache.stats.misses)
+        CACHE_HIT_RATIO.set(cache.stats.to_dict()["hit_rate"] or 0.0)
+
+    pool = getattr(state, "compute_pool", None)
+    if pool is not None:
+        COMPUTE_PENDING.set(pool.pending)
+
+    admission = getattr(state, "admission", None)
+    if admission is not None:
+        for name, lane in admission.lanes.items():
+            ADMISSION_ACTIVE.labels(name).set(lane.active)
+            ADMISSION_WAITING.labels(name).set(lane.waiting)
+            ADMISSION_REJECTED.labels(name).set(lane.rejected)
+
+    for name, stats in singleflight_stats().items():
+        SINGLEFLIGHT_COALESCED.labels(name).set(stats["coalesced"])
+        SINGLEFLIGHT_INFLIGHT.labels(name).set(stats["inflight"])
+
+    job_queue = getattr(state, "job_queue", None)
+    if job_queue is not None:
+        JOBS_QUEUED.set(job_queue.queued)
+
+    for name, stats in timezone_resolver.stats().items():
+        TZ_CACHE_LOOKUPS.labels(name, "hit").set(stats["hits"])
+        TZ_CACHE_LOOKUPS.labels(name, "miss").set(stats["misses"])
+        TZ_CACHE_HIT_RATIO.labels(name).set(stats["hit_rate"] or 0.0)
+
+
+def metrics_response(app: FastAPI) -> Response:
+    """The /metrics body for app."""
+    if REGISTRY is None:
+        return PlainTextResponse("prometheus_client is not installed\n", status_code=503)
+    _update_state_gauges(app)
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware observing request latency per route template.
+
+    The route label is the matched path template (e.g. /v1/profiles/{profile_id}),
+    "unmatched" for 404s, so label cardinality stays bounded. Streaming
+    responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or REGISTRY is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_label: Optional[str] = getattr(route, "path", None)
+            REQUEST_LATENCY.labels(scope["method"], route_label or "unmatched", str(status)).observe(
+                time.perf_counter() - start
+            )
+            if status >= 500:
+                ERRORS.labels("http_5xx").inc()
@@ -0,0 +1,184 @@
+"""
+StarMeet API - Fast JSON Responses
+
+Serialization path for responses carrying engine output.
+
+Returning a pydantic model makes FastAPI validate it against response_model
+(walking the whole ~165 KB Digital Twin behind Dict[str, Any]) and then encode
+it again with jsonable_encoder + json.dumps. Engine output is produced by our
+own code and needs neither step: engine_response() fills the response model's
+fields without validation and serializes them once with orjson. Routes keep
+response_model, so the OpenAPI schema is unchanged (FastAPI skips response
+validation when a handler returns a Response).
+
+Twin responses can also be sent in the compact integer-coded format
+(astro_core.compact), selected with the Accept header:
+    application/vnd.starmeet.twin-compact+json       compact JSON
+    application/vnd.starmeet.twin-compact+msgpack    compact MessagePack
+    (application/msgpack and application/x-msgpack are accepted as aliases)
+"""
+
+from typing import Any, Dict, Optional, Type
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+# MessagePack is optional; without it only JSON formats are offered
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.compact import encode_twin
+from astro_core.phases import phase
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+JSON_MEDIA_TYPE = "application/json"
+COMPACT_JSON_MEDIA_TYPE = "application/vnd.starmeet.twin-compact+json"
+COMPACT_MSGPACK_MEDIA_TYPE = "application/vnd.starmeet.twin-compact+msgpack"
+_MEDIA_TYPE_ALIASES = {
+    "application/msgpack": COMPACT_MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": COMPACT_MSGPACK_MEDIA_TYPE,
+}
+
+# OpenAPI `responses=` entry documenting the compact media types of a route
+COMPACT_TWIN_RESPONSES = {
+    200: {"content": {COMPACT_JSON_MEDIA_TYPE: {}, COMPACT_MSGPACK_MEDIA_TYPE: {}}},
+}
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize engine output to JSON bytes (int dict keys become strings, as with json)."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class EngineJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        with phase("serialization"):
+            return dumps(content)
+
+
+class CompactMsgpackResponse(Response):
+    """MessagePack response (compact twin format)."""
+    media_type = COMPACT_MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        # Round-trip through orjson so msgpack only sees plain JSON types
+        with phase("serialization"):
+            return msgpack.packb(orjson.loads(dumps(content)), use_bin_type=True)
+
+
+def negotiate_twin_format(accept: Optional[str]) -> str:
+    """
+    Media type for a twin response given the Accept header.
+
+    Picks the highest-q supported type (ties keep header order); verbose JSON
+    when nothing supported is listed, so browsers and "*/*" clients are unaffected.
+
+    Raises:
+        HTTPException(406): If only MessagePack is acceptable but msgpack is not installed
+    """
+    candidates = []
+    for position, part in enumerate((accept or "").split(",")):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        media_type = _MEDIA_TYPE_ALIASES.get(media_type.lower(), media_type.lower())
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type))
+
+    msgpack_refused = False
+    for _, _, media_type in sorted(candidates):
+        if media_type == COMPACT_MSGPACK_MEDIA_TYPE and msgpack is None:
+            msgpack_refused = True
+            continue
+        if media_type in (JSON_MEDIA_TYPE, COMPACT_JSON_MEDIA_TYPE, COMPACT_MSGPACK_MEDIA_TYPE):
+            return media_type
+        if media_type in ("*/*", "application/*"):
+            return JSON_MEDIA_TYPE
+    if msgpack_refused:
+        raise HTTPException(status_code=406, detail="MessagePack is not available on this server")
+    return JSON_MEDIA_TYPE
+
+
+def _model_content(model: Type[BaseModel], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields in model order with defaults filled in, without validation."""
+    unknown = set(fields) - set(model.model_fields)
+    if unknown:
+        raise TypeError(f"{model.__name__} has no field(s) {sorted(unknown)}")
+
+    content: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name in fields:
+            content[name] = fields[name]
+        elif field.is_required():
+            raise TypeError(f"{model.__name__} requires field '{name}'")
+        else:
+            content[name] = field.get_default(call_default_factory=True)
+    return content
+
+
+def engine_response(model: Type[BaseModel], status_code: int = 200, **fields: Any) -> EngineJSONResponse:
+    """
+    Response shaped like model, built without validating fields.
+
+    Missing fields take the model's defaults; unknown fields are rejected so
+    the body cannot drift from the documented schema. Nested pydantic models
+    (e.g. DetectedTimezone) are dumped as usual.
+
+    Usage:
+        return engine_response(CalculateResponse, success=True,
+                               detected_timezone=tz_info, digital_twin=digital_twin)
+    """
+    return EngineJSONResponse(_model_content(model, fields), status_code=status_code)
+
+
+def twin_response(
+    model: Type[BaseModel],
+    accept: Optional[str],
+    twin_field: str = "digital_twin",
+    **fields: Any
+) -> Response:
+    """
+    engine_response() in the format negotiated from the Accept header value.
+
+    For the compact formats, fields[twin_field] is replaced by encode_twin()
+    of it; the other fields keep their verbose form.
+
+    Raises:
+        HTTPException(406): See negotiate_twin_format
+    """
+    media_type = negotiate_twin_format(accept)
+    headers = {"Vary": "Accept"}
+    if media_type == JSON_MEDIA_TYPE:
+        return EngineJSONResponse(_model_content(model, fields), headers=headers)
+
+    with phase("compact_encoding"):
+        compact = encode_twin(fields[twin_field])
+    content = _model_content(model, {**fields, twin_field: compact})
+    if media_type == COMPACT_MSGPACK_MEDIA_TYPE:
+        return CompactMsgpackResponse(content, headers=headers)
+    return EngineJSONResponse(content, media_type=COMPACT_JSON_MEDIA_TYPE, headers=headers)
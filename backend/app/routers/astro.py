@@ -3,21 +3,20 @@ StarMeet API - Astrology Router
 Handles chart calculations and profile operations.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from fastapi import APIRouter, Body, FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional, Dict, Any, List, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+import asyncio
+import json
+import time
 import traceback
 
-# Timezone detection
-try:
-    from timezonefinder import TimezoneFinder
-    import pytz
-    TZ_FINDER = TimezoneFinder()
-except ImportError:
-    TZ_FINDER = None
-    pytz = None
-
 # Import the Golden Math engine
 import sys
 sys.path.insert(0, '/app/packages')
@@ -26,18 +25,38 @@ from astro_core.engine import (
     calculate_all_vargas,
     get_varga_sign,
     get_varga_sign_and_degrees,
+    varga_sign_indices,
     SIGNS,
+    VARGA_CODES,
     generate_digital_twin,
     generate_digital_twin_enhanced,
-    calculate_chara_karakas
+    calculate_chara_karakas,
+    apply_as_of_overlay,
+    base_twin_from_core,
+    compute_as_of_overlay,
+    FULL_PROJECTION,
+    TwinProjection,
 )
-
-# Phase 8-9: House and Planet Scoring System
-from app.astro.scoring import (
-    calculate_planet_scores,
-    get_planet_score_report,
-    calculate_house_scores,
+from astro_core.phases import phase, record_error, record_phase
+
+from app.astro.calculator import AstroBrain
+from app.astro.llm.generator import PersonalityReportGenerator
+
+# CPU-bound work runs in the compute pool
+from app import tasks
+from app.executor import ComputeTimeout, run_compute
+from app.cache import ResponseCache, get_cache
+from app.responses import (
+    COMPACT_TWIN_RESPONSES,
+    EngineJSONResponse,
+    dumps,
+    engine_response,
+    negotiate_twin_format,
+    twin_response,
 )
+from app.etags import directory_etag, not_modified, profile_etags, weak_etag_for
+from app.singleflight import full_analysis_flight, natal_core_flight
+from app.timezones import timezone_resolver
 
 router = APIRouter()
 
@@ -127,6 +146,19 @@ class QuickVargaResponse(BaseModel):
     result_sign: str
 
 
+class QuickVargaBatchRequest(BaseModel):
+    """Varga signs of many longitudes in many vargas."""
+    longitudes: List[float] = Field(..., description="Absolute longitudes (0-360)")
+    vargas: List[str] = Field(default_factory=lambda: list(VARGA_CODES), description="Varga codes (default: all)")
+
+
+class QuickVargaBatchResponse(BaseModel):
+    """Compact matrix: matrix[i][j] indexes signs for longitudes[i] in vargas[j]."""
+    vargas: List[str]
+    signs: List[str]
+    matrix: List[List[int]]
+
+
 class TimezoneRequest(BaseModel):
     """Request for timezone detection."""
     lat: float = Field(..., description="Latitude")
@@ -135,6 +167,22 @@ class TimezoneRequest(BaseModel):
     time: str = Field(default="12:00", description="Time in HH:MM format")
 
 
+class TimezoneBatchRequest(BaseModel):
+    """Columns of timezone detection requests (one entry per row)."""
+    lat: List[float] = Field(..., description="Latitudes")
+    lon: List[float] = Field(..., description="Longitudes")
+    date: List[str] = Field(..., description="Dates in YYYY-MM-DD format")
+    time: Optional[List[str]] = Field(default=None, description="Times in HH:MM format (default: 12:00)")
+
+
+class TimezoneBatchResponse(BaseModel):
+    """Columns of detected timezones, in request row order."""
+    timezone_name: List[str]
+    utc_offset: List[float]
+    is_dst: List[bool]
+    dst_offset: List[float]
+
+
 class TimezoneResponse(BaseModel):
     """Response with detected timezone."""
     timezone_name: str
@@ -147,50 +195,98 @@ class TimezoneResponse(BaseModel):
 # ENDPOINTS
 # =============================================================================
 
+# Request ayanamsa names (case-insensitive) to engine ayanamsa names
+AYANAMSA_MAP = {
+    "lahiri": "Lahiri",
+    "raman": "Raman",
+    "true_chitrapaksha": "True_Chitrapaksha",
+}
+
+
+def _engine_ayanamsa(name: str, default: str = "Raman") -> str:
+    """Engine ayanamsa for a request's ayanamsa name (default if unknown)."""
+    return AYANAMSA_MAP.get(name.lower(), default)
+
+
+@phase("timezone")
 def _detect_timezone(lat: float, lon: float, date_str: str, time_str: str) -> tuple[str, float, bool]:
     """
     Detect historical timezone for given coordinates and datetime.
     Returns: (timezone_name, utc_offset, is_dst)
     """
-    if TZ_FINDER is None or pytz is None:
-        # Fallback to geographic calculation
-        tz_offset = round(lon / 15)
-        return ("UTC", float(tz_offset), False)
-
-    try:
-        # Find timezone name by coordinates
-        tz_name = TZ_FINDER.timezone_at(lat=lat, lng=lon)
-        if not tz_name:
-            tz_offset = round(lon / 15)
-            return ("UTC", float(tz_offset), False)
-
-        # Parse date and time
-        try:
-            naive_dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-        except ValueError:
-            naive_dt = datetime.strptime(date_str, "%Y-%m-%d")
+    tz = timezone_resolver.resolve(lat, lon, date_str, time_str)
+    return (tz.tz_name, tz.utc_offset, tz.is_dst)
+
+
+def _natal_core_key(
+    birth_datetime: datetime,
+    lat: float,
+    lon: float,
+    tz_offset: float,
+    ayanamsa: str,
+    projection: TwinProjection = FULL_PROJECTION
+) -> str:
+    """ResponseCache key of a natal core (includes the engine version)."""
+    return ResponseCache.make_key("natal-core", {
+        "birth_datetime": birth_datetime.isoformat(),
+        "lat": lat,
+        "lon": lon,
+        "tz_offset": tz_offset,
+        "ayanamsa": ayanamsa,
+        "sections": projection.computed_sections(),
+        "vargas": projection.computed_vargas(),
+    })
+
+
+async def _natal_core(
+    http_request: Request,
+    birth_datetime: datetime,
+    lat: float,
+    lon: float,
+    tz_offset: float,
+    ayanamsa: str,
+    projection: TwinProjection = FULL_PROJECTION
+) -> Dict[str, Any]:
+    """
+    Natal core for resolved engine inputs, shared by /calculate and /save.
+
+    Keyed on the inputs after timezone detection and ayanamsa mapping (plus
+    the sections and vargas the projection computes), so different request
+    shapes for the same birth share one entry. Concurrent identical calls in
+    this worker share one computation (singleflight); across workers and over
+    time the ResponseCache serves it. The returned dict is shared: apply the
+    overlay to a copy, never mutate it.
+    """
+    key = _natal_core_key(birth_datetime, lat, lon, tz_offset, ayanamsa, projection)
 
-        # Get timezone object and localize the datetime
-        tz = pytz.timezone(tz_name)
-        local_dt = tz.localize(naive_dt, is_dst=None)
+    async def compute_core():
+        return await run_compute(
+            http_request, tasks.natal_core_task,
+            birth_datetime, lat, lon, tz_offset, ayanamsa, projection
+        )
 
-        # Calculate UTC offset in hours
-        utc_offset = local_dt.utcoffset().total_seconds() / 3600
+    async def cached_core():
+        cache = get_cache(http_request)
+        if cache is None:
+            return await compute_core()
+        return await cache.get_or_compute(key, compute_core, ttl=cache.config.ttl_calculate)
 
-        # Check if DST is in effect
-        dst = local_dt.dst()
-        is_dst = dst is not None and dst.total_seconds() > 0
+    return await natal_core_flight.do(key, cached_core)
 
-        return (tz_name, utc_offset, is_dst)
 
-    except Exception:
-        # Fallback to geographic calculation
-        tz_offset = round(lon / 15)
-        return ("UTC", float(tz_offset), False)
+# Query parameters for sparse fieldsets (see TwinProjection)
+INCLUDE_QUERY = Query(None, description="Comma-separated fields to return, e.g. meta,dasha.current")
+EXCLUDE_QUERY = Query(None, description="Comma-separated fields to drop, e.g. dasha.periods")
 
 
-@router.post("/calculate", response_model=CalculateResponse)
-async def calculate_chart(request: CalculateRequest):
+@router.post("/calculate", response_model=CalculateResponse, responses=COMPACT_TWIN_RESPONSES)
+async def calculate_chart(
+    request: CalculateRequest,
+    http_request: Request,
+    include: Optional[str] = INCLUDE_QUERY,
+    exclude: Optional[str] = EXCLUDE_QUERY,
+    vargas: Optional[str] = Query(None, description="Comma-separated varga charts to return, e.g. D1,D9")
+):
     """
     Calculate a Vedic birth chart - returns FULL Digital Twin with all 16 Vargas.
 
@@ -210,8 +306,26 @@ async def calculate_chart(request: CalculateRequest):
         "ayanamsa": "raman"
     }
     ```
+
+    Sparse fieldsets: `?include=meta,dasha.current&vargas=D1,D9` computes and
+    returns only those parts of the twin; `exclude=dasha.periods` drops the
+    (large) period tree.
+
+    Compact format: send `Accept: application/vnd.starmeet.twin-compact+json`
+    (or `+msgpack`) to receive digital_twin integer-coded (astro_core.compact).
+
+    Revalidation: the response carries a weak ETag computed from the inputs
+    (not the twin), valid until the as-of date or engine version changes;
+    bodies under one ETag differ only in meta.generated_at. Browsers
+    do not cache POST, so clients resend it as `If-None-Match` themselves and
+    get 304 without the chart being computed.
     """
     try:
+        try:
+            projection = TwinProjection.parse(include, exclude, vargas)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         # Parse date and time
         try:
             birth_date = datetime.strptime(request.date, "%Y-%m-%d")
@@ -247,35 +361,188 @@ async def calculate_chart(request: CalculateRequest):
             )
 
         # Map ayanamsa
-        ayanamsa_map = {
-            "lahiri": "Lahiri",
-            "raman": "Raman",
-            "true_chitrapaksha": "True_Chitrapaksha",
-        }
-        ayanamsa = ayanamsa_map.get(request.ayanamsa.lower(), "Raman")
-
-        # Generate FULL Digital Twin with all 20 Vargas + Dasha + Karakas
-        digital_twin = generate_digital_twin_enhanced(
-            birth_datetime=birth_datetime,
-            latitude=request.lat,
-            longitude=request.lon,
-            tz_offset_hours=tz_offset,
-            ayanamsa=ayanamsa
-        )
-
-        return CalculateResponse(
+        ayanamsa = _engine_ayanamsa(request.ayanamsa)
+
+        # The response is determined by the natal core inputs, the as-of date,
+        # the projection and the format (up to meta.generated_at, hence a weak
+        # ETag): revalidate before computing
+        as_of = date.today()
+        etag = weak_etag_for({
+            "core": _natal_core_key(birth_datetime, request.lat, request.lon, tz_offset, ayanamsa, projection),
+            "as_of": as_of.isoformat(),
+            "projection": [projection.include, projection.exclude, projection.vargas],
+            "timezone": tz_info.model_dump(),
+            "media_type": negotiate_twin_format(http_request.headers.get("accept")),
+        })
+        unchanged = not_modified(http_request, etag, {"Vary": "Accept"})
+        if unchanged is not None:
+            return unchanged
+
+        # Generate FULL Digital Twin with all 20 Vargas + Dasha + Karakas:
+        # the natal core is shared and cached, today's dasha overlay is applied per request
+        core = await _natal_core(http_request, birth_datetime, request.lat, request.lon, tz_offset, ayanamsa, projection)
+        digital_twin = projection.apply(apply_as_of_overlay(core, compute_as_of_overlay(core, as_of)))
+
+        # Engine output is serialized directly, without re-validating the twin
+        response = twin_response(
+            CalculateResponse,
+            http_request.headers.get("accept"),
             success=True,
             detected_timezone=tz_info,
             digital_twin=digital_twin
         )
+        response.headers["ETag"] = etag
+        return response
 
     except HTTPException:
         raise
+    except ComputeTimeout as e:
+        raise HTTPException(status_code=504, detail=f"Calculation timed out: {e}")
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
+# Batch limits: items per request, items per compute task, tasks in flight per request
+BATCH_MAX_ITEMS = 5000
+BATCH_CHUNK_SIZE = 16
+BATCH_MAX_INFLIGHT_CHUNKS = 4
+
+
+def _prepare_batch_item(index: int, raw: Any) -> tuple:
+    """
+    Validate one /calculate/batch item and resolve its timezone.
+
+    Returns:
+        (task_item, None) with a tasks.BatchItem, or (None, error_line) if invalid
+    """
+    if not isinstance(raw, dict):
+        return None, {"index": index, "success": False, "error": "Invalid request: item must be an object"}
+
+    try:
+        item = CalculateRequest(**raw)
+        birth_date = datetime.strptime(item.date, "%Y-%m-%d")
+        time_parts = item.time.split(":")
+        birth_datetime = birth_date.replace(
+            hour=int(time_parts[0]),
+            minute=int(time_parts[1]) if len(time_parts) > 1 else 0,
+            second=0
+        )
+    except ValidationError as e:
+        detail = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+        return None, {"index": index, "success": False, "error": f"Invalid request: {detail}"}
+    except (ValueError, TypeError) as e:
+        return None, {"index": index, "success": False, "error": f"Invalid date/time format: {e}"}
+
+    if item.timezone_override is not None:
+        tz_info = DetectedTimezone(
+            timezone_name="Manual Override", utc_offset=item.timezone_override,
+            is_dst=False, source="override"
+        )
+    else:
+        tz_name, tz_offset, is_dst = _detect_timezone(item.lat, item.lon, item.date, item.time)
+        tz_info = DetectedTimezone(
+            timezone_name=tz_name, utc_offset=tz_offset, is_dst=is_dst, source="auto"
+        )
+
+    ayanamsa = _engine_ayanamsa(item.ayanamsa)
+    return (index, birth_datetime, item.lat, item.lon, tz_info.utc_offset, ayanamsa, tz_info), None
+
+
+@router.post("/calculate/batch")
+async def calculate_batch(
+    http_request: Request,
+    items: List[Any] = Body(..., description="Array of CalculateRequest objects"),
+    mode: str = Query(default="positions", pattern="^(twin|positions)$",
+                      description="positions: D1 longitudes + varga signs (engine batch path); "
+                                  "twin: full enhanced Digital Twin, built per item"),
+):
+    """
+    Calculate many charts in one request, streamed as NDJSON.
+
+    Body: JSON array of CalculateRequest objects (up to BATCH_MAX_ITEMS).
+
+    Each output line is one item, in completion order (not input order):
+    - {"index": 3, "success": true, "detected_timezone": {...}, "positions": {...}}
+    - {"index": 4, "success": true, "detected_timezone": {...}, "digital_twin": {...}}  (mode=twin)
+    - {"index": 5, "success": false, "error": "..."}
+
+    The default mode=positions runs each chunk through the engine's batch
+    path (astro_core.batch). mode=twin is the exception: the enhanced twin has
+    no batch implementation, so each item is built like a /calculate call
+    (much slower; use it only when the full twin is needed).
+
+    Invalid or failing items (including array elements that are not objects)
+    produce an error line; the rest of the batch continues. Items are
+    calculated in chunks on the compute pool, with at most
+    BATCH_MAX_INFLIGHT_CHUNKS chunks of one request in flight.
+    """
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {BATCH_MAX_ITEMS} items")
+
+    task = tasks.batch_positions_task if mode == "positions" else tasks.batch_twins_task
+    indexed = list(enumerate(items))
+    chunks = [
+        indexed[start:start + BATCH_CHUNK_SIZE]
+        for start in range(0, len(indexed), BATCH_CHUNK_SIZE)
+    ]
+
+    async def run_chunk(chunk):
+        prepared = await run_in_threadpool(lambda: [_prepare_batch_item(i, raw) for i, raw in chunk])
+        lines = [error for _, error in prepared if error is not None]
+        valid = [item for item, _ in prepared if item is not None]
+        if valid:
+            tz_by_index = {item[0]: item[6] for item in valid}
+            try:
+                results = await run_compute(http_request, task, [item[:6] for item in valid])
+            except ComputeTimeout as e:
+                results = [{"index": item[0], "success": False, "error": f"Calculation timed out: {e}"}
+                           for item in valid]
+            except Exception as e:
+                traceback.print_exc()
+                results = [{"index": item[0], "success": False, "error": f"Calculation error: {str(e)}"}
+                           for item in valid]
+            for result in results:
+                if result["success"]:
+                    result = {
+                        "index": result["index"],
+                        "success": True,
+                        "detected_timezone": tz_by_index[result["index"]].model_dump(),
+                        **{k: v for k, v in result.items() if k not in ("index", "success")},
+                    }
+                lines.append(result)
+        return lines
+
+    async def stream():
+        remaining = iter(chunks)
+        pending = set()
+        try:
+            for chunk in remaining:
+                pending.add(asyncio.create_task(run_chunk(chunk)))
+                if len(pending) >= BATCH_MAX_INFLIGHT_CHUNKS:
+                    break
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    for line in finished.result():
+                        yield dumps(line) + b"\n"
+                    next_chunk = next(remaining, None)
+                    if next_chunk is not None:
+                        pending.add(asyncio.create_task(run_chunk(next_chunk)))
+        finally:
+            # Client went away: stop scheduling and drop queued chunks
+            for unfinished in pending:
+                unfinished.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@lru_cache(maxsize=65536)
+def _cached_varga_sign(longitude: float, varga: str) -> str:
+    """get_varga_sign memoized in-process (cheaper than a Redis round trip)."""
+    return get_varga_sign(longitude, varga)
+
+
 @router.post("/quick-varga", response_model=QuickVargaResponse)
 async def quick_varga(request: QuickVargaRequest):
     """
@@ -284,7 +551,7 @@ async def quick_varga(request: QuickVargaRequest):
     Useful for testing or when you already have the longitude.
     """
     try:
-        result_sign = get_varga_sign(request.longitude, request.varga.upper())
+        result_sign = _cached_varga_sign(request.longitude, request.varga.upper())
         return QuickVargaResponse(
             longitude=request.longitude,
             varga=request.varga.upper(),
@@ -294,6 +561,30 @@ async def quick_varga(request: QuickVargaRequest):
         raise HTTPException(status_code=500, detail=f"Varga calculation error: {str(e)}")
 
 
+# Longitudes x vargas per /quick-varga/batch request
+QUICK_VARGA_BATCH_MAX_CELLS = 1_000_000
+
+
+@router.post("/quick-varga/batch", response_model=QuickVargaBatchResponse)
+async def quick_varga_batch(request: QuickVargaBatchRequest):
+    """
+    Varga signs for many longitudes and varga codes in one call.
+
+    Returns a matrix of sign indices (rows: longitudes, columns: vargas)
+    with the sign names once in `signs`, computed by the vectorized varga
+    kernel (identical to /quick-varga per cell).
+    """
+    if len(request.longitudes) * len(request.vargas) > QUICK_VARGA_BATCH_MAX_CELLS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {QUICK_VARGA_BATCH_MAX_CELLS} cells")
+
+    vargas = [code.upper() for code in request.vargas]
+    try:
+        matrix = await run_in_threadpool(varga_sign_indices, request.longitudes, vargas)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid longitude: {e}")
+    return engine_response(QuickVargaBatchResponse, vargas=vargas, signs=SIGNS, matrix=matrix)
+
+
 @router.get("/signs")
 async def get_signs():
     """Get list of zodiac signs."""
@@ -310,71 +601,197 @@ async def get_timezone(request: TimezoneRequest):
 
     Example: Saint Petersburg on May 30, 1982 was UTC+4 (summer time).
     """
-    if TZ_FINDER is None or pytz is None:
-        # Fallback to geographic calculation if libraries not available
-        tz = round(request.lon / 15)
-        return TimezoneResponse(
-            timezone_name="UTC",
-            utc_offset=float(tz),
-            is_dst=False,
-            dst_offset=0.0
+    with phase("timezone"):
+        tz = timezone_resolver.resolve(request.lat, request.lon, request.date, request.time)
+    return TimezoneResponse(
+        timezone_name=tz.tz_name,
+        utc_offset=tz.utc_offset,
+        is_dst=tz.is_dst,
+        dst_offset=tz.dst_offset
+    )
+
+
+# Rows per /timezone/batch request
+TIMEZONE_BATCH_MAX_ITEMS = 500_000
+
+
+@router.post("/timezone/batch", response_model=TimezoneBatchResponse)
+async def get_timezones_batch(http_request: Request, request: TimezoneBatchRequest):
+    """
+    Historical timezones for many places and dates at once (imports, backfills).
+
+    Body and response are columnar: row i of the response answers row i of
+    the request, exactly as POST /timezone would. Resolved in bulk on the
+    compute pool (see app.timezones).
+    """
+    if len(request.lat) > TIMEZONE_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {TIMEZONE_BATCH_MAX_ITEMS} rows")
+
+    times = request.time if request.time is not None else ["12:00"] * len(request.lat)
+    if not len(request.lat) == len(request.lon) == len(request.date) == len(times):
+        raise HTTPException(status_code=422, detail="lat, lon, date and time must have the same length")
+    try:
+        columns = await run_compute(
+            http_request, tasks.bulk_timezones_task, request.lat, request.lon, request.date, times
         )
+    except ComputeTimeout as e:
+        raise HTTPException(status_code=504, detail=f"Timezone resolution timed out: {e}")
+    return engine_response(TimezoneBatchResponse, **columns)
+
+
+# =============================================================================
+# TIME SCRUBBING (WebSocket)
+# =============================================================================
+
+def _scrub_positions(twin: Dict[str, Any]) -> Dict[str, Any]:
+    """Continuously moving D1 values sent with every scrub update."""
+    d1 = twin["vargas"]["D1"]
+    moon = next((p for p in d1["planets"] if p["name"] == "Moon"), None)
+    return {
+        "ascendant": d1["ascendant"],
+        "moon": {
+            "absolute_degree": moon["absolute_degree"],
+            "nakshatra": moon["nakshatra"],
+            "nakshatra_pada": moon["nakshatra_pada"],
+        } if moon else None,
+    }
+
+
+@router.websocket("/ws/scrub")
+async def scrub_birth_time(websocket: WebSocket):
+    """
+    Interactive birth-time slider.
+
+    Protocol:
+    1. Client sends a CalculateRequest JSON. Server replies
+       {"type": "base", "detected_timezone": ..., "digital_twin": ...} (sent once).
+    2. Client sends {"time": "HH:MM[:SS]"} (optionally with "date") as the slider moves.
+       Server replies {"type": "diff", "time": ..., "positions": ..., "diff": ...}
+       where diff holds only what changed since the previous update
+       (see astro_core.engine.diff_digital_twins).
+
+    Only the latest requested time is computed; times that arrive while a
+    calculation is running are dropped. The timezone is resolved once, for the
+    first request, and its offset is kept for the whole session. Shifts run
+    on the compute pool; each update's latency (shift and send) is reported
+    as phase "scrub_update".
+    """
+    await websocket.accept()
 
     try:
-        # Find timezone name by coordinates
-        tz_name = TZ_FINDER.timezone_at(lat=request.lat, lng=request.lon)
-        if not tz_name:
-            # Fallback for ocean/unknown areas
-            tz = round(request.lon / 15)
-            return TimezoneResponse(
-                timezone_name="UTC",
-                utc_offset=float(tz),
-                is_dst=False,
-                dst_offset=0.0
-            )
+        request = CalculateRequest(**await websocket.receive_json())
+        birth_datetime = datetime.strptime(f"{request.date} {request.time}", "%Y-%m-%d %H:%M")
+    except (ValidationError, ValueError, TypeError) as e:
+        await websocket.send_json({"type": "error", "detail": f"Invalid request: {e}"})
+        await websocket.close(code=1003)
+        return
+    except WebSocketDisconnect:
+        return
+
+    if request.timezone_override is not None:
+        tz_info = DetectedTimezone(
+            timezone_name="Manual Override",
+            utc_offset=request.timezone_override,
+            is_dst=False,
+            source="override"
+        )
+    else:
+        tz_name, tz_offset, is_dst = await run_in_threadpool(
+            _detect_timezone, request.lat, request.lon, request.date, request.time
+        )
+        tz_info = DetectedTimezone(
+            timezone_name=tz_name, utc_offset=tz_offset, is_dst=is_dst, source="auto"
+        )
 
-        # Parse date and time
-        dt_str = f"{request.date} {request.time}"
-        try:
-            naive_dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-        except ValueError:
-            naive_dt = datetime.strptime(request.date, "%Y-%m-%d")
-
-        # Get timezone object and localize the datetime
-        tz = pytz.timezone(tz_name)
-        local_dt = tz.localize(naive_dt, is_dst=None)
-
-        # Calculate UTC offset in hours
-        utc_offset = local_dt.utcoffset().total_seconds() / 3600
-
-        # Check if DST is in effect
-        dst_offset = local_dt.dst()
-        is_dst = dst_offset is not None and dst_offset.total_seconds() > 0
-        dst_hours = dst_offset.total_seconds() / 3600 if dst_offset else 0.0
-
-        return TimezoneResponse(
-            timezone_name=tz_name,
-            utc_offset=utc_offset,
-            is_dst=is_dst,
-            dst_offset=dst_hours
+    try:
+        context, last_twin = await run_compute(
+            websocket, tasks.scrub_base_task,
+            birth_datetime, request.lat, request.lon, tz_info.utc_offset,
+            _engine_ayanamsa(request.ayanamsa)
         )
+        await websocket.send_json({
+            "type": "base",
+            "detected_timezone": tz_info.model_dump(),
+            "digital_twin": last_twin,
+        })
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        traceback.print_exc()
+        await websocket.send_json({"type": "error", "detail": f"Calculation error: {str(e)}"})
+        await websocket.close(code=1011)
+        return
 
+    # Latest-wins slot shared by the reader and the calculator
+    latest: Dict[str, Any] = {}
+    pending = asyncio.Event()
+
+    async def read_requests():
+        while True:
+            try:
+                latest["message"] = await websocket.receive_json()
+            except ValueError:
+                latest["message"] = None  # Reported as an invalid time below
+            pending.set()
+
+    reader = asyncio.create_task(read_requests())
+    try:
+        while True:
+            waiter = asyncio.create_task(pending.wait())
+            done, _ = await asyncio.wait({reader, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            if reader in done:
+                waiter.cancel()
+                reader.result()  # Re-raises WebSocketDisconnect
+                return
+
+            pending.clear()
+            message = latest.pop("message")
+            try:
+                date_str = message.get("date", request.date)
+                time_str = message["time"]
+                time_format = "%H:%M:%S" if time_str.count(":") == 2 else "%H:%M"
+                new_datetime = datetime.strptime(f"{date_str} {time_str}", f"%Y-%m-%d {time_format}")
+            except (AttributeError, KeyError, ValueError):
+                await websocket.send_json({
+                    "type": "error",
+                    "detail": 'Invalid time request: expected {"time": "HH:MM[:SS]", "date": "YYYY-MM-DD"}'
+                })
+                continue
+
+            start = time.perf_counter()
+            delta = await run_compute(websocket, tasks.shift_twin_task, context, new_datetime, last_twin)
+            if not delta.incremental:
+                # Beyond the shift window: the full recompute becomes the new anchor
+                context = delta.context
+            last_twin = delta.twin
+
+            await websocket.send_json({
+                "type": "diff",
+                "time": new_datetime.isoformat(),
+                "positions": _scrub_positions(delta.twin),
+                "diff": delta.diff,
+            })
+            record_phase("scrub_update", time.perf_counter() - start)
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         traceback.print_exc()
-        # Fallback to geographic calculation
-        tz = round(request.lon / 15)
-        return TimezoneResponse(
-            timezone_name="UTC",
-            utc_offset=float(tz),
-            is_dst=False,
-            dst_offset=0.0
-        )
+        await websocket.send_json({"type": "error", "detail": f"Calculation error: {str(e)}"})
+        await websocket.close(code=1011)
+    finally:
+        reader.cancel()
 
 
 # =============================================================================
 # SAVE PROFILE ENDPOINT
 # =============================================================================
 
+PROFILES_DIR = Path("/app/data/profiles")
+
+# Profiles may change (delete, re-save): clients revalidate with If-None-Match
+PROFILE_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+
 class SaveProfileRequest(BaseModel):
     """Request to save a calculated chart profile."""
     input_data: Dict[str, Any] = Field(..., description="Original input data (date, time, location)")
@@ -389,7 +806,7 @@ class SaveProfileResponse(BaseModel):
 
 
 @router.post("/save", response_model=SaveProfileResponse)
-async def save_profile(request: SaveProfileRequest):
+async def save_profile(request: SaveProfileRequest, http_request: Request):
     """
     Save a calculated chart profile with FULL Digital Twin.
 
@@ -399,17 +816,14 @@ async def save_profile(request: SaveProfileRequest):
     NOTE: This is a placeholder implementation that stores to a JSON file.
     In production, this should save to PostgreSQL JSONB.
     """
-    import json
     import uuid
-    from pathlib import Path
 
     try:
         # Generate unique profile ID
         profile_id = str(uuid.uuid4())[:8]
 
         # Create profiles directory if not exists
-        profiles_dir = Path("/app/data/profiles")
-        profiles_dir.mkdir(parents=True, exist_ok=True)
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
 
         # Extract birth data from input
         input_data = request.input_data
@@ -421,12 +835,7 @@ async def save_profile(request: SaveProfileRequest):
         ayanamsa = input_data.get("ayanamsa", "raman")
 
         # Map ayanamsa to engine format
-        ayanamsa_map = {
-            "lahiri": "Lahiri",
-            "raman": "Raman",
-            "true_chitrapaksha": "True_Chitrapaksha",
-        }
-        engine_ayanamsa = ayanamsa_map.get(ayanamsa.lower(), "Lahiri")
+        engine_ayanamsa = _engine_ayanamsa(ayanamsa, default="Lahiri")
 
         # Parse birth datetime
         try:
@@ -444,14 +853,11 @@ async def save_profile(request: SaveProfileRequest):
                 profile_id=None
             )
 
-        # Generate Digital Twin (comprehensive data for all 16 Vargas)
-        digital_twin = generate_digital_twin(
-            birth_datetime=birth_datetime,
-            latitude=latitude,
-            longitude=longitude,
-            tz_offset_hours=timezone_offset,
-            ayanamsa=engine_ayanamsa
-        )
+        # Generate Digital Twin (comprehensive data for all 16 Vargas); the base
+        # twin is taken from the natal core shared with a concurrent or earlier
+        # /calculate for the same birth
+        core = await _natal_core(http_request, birth_datetime, latitude, longitude, timezone_offset, engine_ayanamsa)
+        digital_twin = base_twin_from_core(core)
 
         # Prepare profile data with Digital Twin
         profile = {
@@ -462,10 +868,12 @@ async def save_profile(request: SaveProfileRequest):
             "digital_twin": digital_twin,  # NEW: Full Digital Twin with all Vargas
         }
 
-        # Save to JSON file
-        profile_path = profiles_dir / f"{profile_id}.json"
-        with open(profile_path, "w", encoding="utf-8") as f:
-            json.dump(profile, f, ensure_ascii=False, indent=2, default=str)
+        # Save to JSON file; the bytes written are hashed right away so the
+        # first GET of the profile does not have to read it back for its ETag
+        profile_path = PROFILES_DIR / f"{profile_id}.json"
+        content = json.dumps(profile, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+        profile_path.write_bytes(content)
+        profile_etags.store(profile_path, profile_path.stat(), content)
 
         return SaveProfileResponse(
             success=True,
@@ -483,21 +891,26 @@ async def save_profile(request: SaveProfileRequest):
 
 
 @router.get("/profiles")
-async def list_profiles():
+async def list_profiles(http_request: Request):
     """
     Get list of all saved profiles.
     Returns only metadata (id, name, created_at, input data).
-    """
-    import json
-    from pathlib import Path
 
+    The ETag is derived from the profile files' names and stat metadata, so
+    revalidating an unchanged list reads no profile.
+    """
     try:
-        profiles_dir = Path("/app/data/profiles")
-        if not profiles_dir.exists():
+        if not PROFILES_DIR.exists():
             return {"profiles": []}
 
+        profile_paths = list(PROFILES_DIR.glob("*.json"))
+        etag = directory_etag(profile_paths)
+        unchanged = not_modified(http_request, etag, PROFILE_CACHE_HEADERS)
+        if unchanged is not None:
+            return unchanged
+
         profiles = []
-        for profile_path in sorted(profiles_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        for profile_path in sorted(profile_paths, key=lambda p: p.stat().st_mtime, reverse=True):
             try:
                 with open(profile_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -510,7 +923,7 @@ async def list_profiles():
             except Exception:
                 continue
 
-        return {"profiles": profiles}
+        return EngineJSONResponse({"profiles": profiles}, headers={**PROFILE_CACHE_HEADERS, "ETag": etag})
 
     except Exception as e:
         traceback.print_exc()
@@ -518,23 +931,36 @@ async def list_profiles():
 
 
 @router.get("/profiles/{profile_id}")
-async def get_profile(profile_id: str):
+async def get_profile(profile_id: str, http_request: Request):
     """
     Get a specific profile by ID.
     Returns full profile data including chart.
-    """
-    import json
-    from pathlib import Path
 
+    Carries a content-hash ETag; If-None-Match revalidation of a profile whose
+    hash is cached (saved or served before by this process) answers 304
+    without reading the file.
+    """
     try:
-        profile_path = Path(f"/app/data/profiles/{profile_id}.json")
-        if not profile_path.exists():
+        profile_path = PROFILES_DIR / f"{profile_id}.json"
+        try:
+            stat = profile_path.stat()
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        with open(profile_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        content = None
+        etag = profile_etags.cached(profile_path, stat)
+        if etag is None:
+            content = profile_path.read_bytes()
+            etag = profile_etags.store(profile_path, stat, content)
+
+        unchanged = not_modified(http_request, etag, PROFILE_CACHE_HEADERS)
+        if unchanged is not None:
+            return unchanged
 
-        return data
+        if content is None:
+            content = profile_path.read_bytes()
+        # Served as stored: the ETag is the hash of exactly these bytes
+        return Response(content, media_type="application/json", headers={**PROFILE_CACHE_HEADERS, "ETag": etag})
 
     except HTTPException:
         raise
@@ -546,14 +972,13 @@ async def get_profile(profile_id: str):
 @router.delete("/profiles/{profile_id}")
 async def delete_profile(profile_id: str):
     """Delete a saved profile."""
-    from pathlib import Path
-
     try:
-        profile_path = Path(f"/app/data/profiles/{profile_id}.json")
+        profile_path = PROFILES_DIR / f"{profile_id}.json"
         if not profile_path.exists():
             raise HTTPException(status_code=404, detail="Profile not found")
 
         profile_path.unlink()
+        profile_etags.discard(profile_path)
         return {"success": True, "message": "Profile deleted"}
 
     except HTTPException:
@@ -1074,59 +1499,115 @@ def _extract_jaimini_from_digital_twin(digital_twin: Dict[str, Any]) -> Dict[str
     return result
 
 
-@router.post("/full-calculate", response_model=FullCalculatorResponse)
-async def full_calculate(request: FullCalculatorRequest):
-    """
-    Full personality calculation endpoint.
+@dataclass
+class FullCalculatePlan:
+    """Validated inputs of a /full-calculate run (see plan_full_calculate)."""
+    request: FullCalculatorRequest
+    include: Optional[str]
+    exclude: Optional[str]
+    projection: TwinProjection
+    birth_datetime: datetime
+    tz_offset: float
+    ayanamsa: str
+    generate_report: bool
+    include_admin_data: bool
+    include_scores: bool
 
-    Combines:
-    1. Digital Twin generation (Swiss Ephemeris)
-    2. AstroBrain 12-stage analysis
-    3. LLM personality report generation (optional)
 
-    Returns:
-    - report_text: LLM-generated personality report (5 pages)
-    - admin_data: Structured scores for admin view (optional)
+# Progress callback of run_full_calculate: awaited with the stage about to run
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+
+def plan_full_calculate(
+    request: FullCalculatorRequest,
+    include: Optional[str] = None,
+    exclude: Optional[str] = None
+) -> FullCalculatePlan:
     """
-    try:
-        # Parse birth datetime
-        try:
-            birth_date = datetime.strptime(request.date, "%Y-%m-%d")
-            time_parts = request.time.split(":")
-            birth_datetime = birth_date.replace(
-                hour=int(time_parts[0]),
-                minute=int(time_parts[1]) if len(time_parts) > 1 else 0,
-                second=0
-            )
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid date/time: {e}")
+    Validate a /full-calculate request and resolve its engine inputs.
 
-        # Detect timezone
-        tz_name, tz_offset, is_dst = _detect_timezone(
-            request.lat, request.lon, request.date, request.time
+    Raises:
+        HTTPException(400): On invalid fields, date or time
+    """
+    try:
+        projection = TwinProjection.parse(include, exclude, sections=tuple(FullCalculatorResponse.model_fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    generate_report = request.generate_report and projection.wants("report_text")
+    include_admin_data = request.include_admin_data and projection.wants("admin_data")
+    include_scores = include_admin_data and (
+        projection.wants("admin_data.house_scores") or projection.wants("admin_data.planet_scores")
+    )
+
+    # Parse birth datetime
+    try:
+        birth_date = datetime.strptime(request.date, "%Y-%m-%d")
+        time_parts = request.time.split(":")
+        birth_datetime = birth_date.replace(
+            hour=int(time_parts[0]),
+            minute=int(time_parts[1]) if len(time_parts) > 1 else 0,
+            second=0
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date/time: {e}")
+
+    # Detect timezone
+    tz_name, tz_offset, is_dst = _detect_timezone(
+        request.lat, request.lon, request.date, request.time
+    )
+
+    # Map ayanamsa
+    ayanamsa = _engine_ayanamsa(request.ayanamsa, default="Lahiri")
+
+    return FullCalculatePlan(
+        request=request,
+        include=include,
+        exclude=exclude,
+        projection=projection,
+        birth_datetime=birth_datetime,
+        tz_offset=tz_offset,
+        ayanamsa=ayanamsa,
+        generate_report=generate_report,
+        include_admin_data=include_admin_data,
+        include_scores=include_scores,
+    )
+
+
+async def run_full_calculate(
+    app: FastAPI,
+    plan: FullCalculatePlan,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Run the /full-calculate pipeline for a plan.
 
-        # Map ayanamsa
-        ayanamsa_map = {
-            "lahiri": "Lahiri",
-            "raman": "Raman",
-        }
-        ayanamsa = ayanamsa_map.get(request.ayanamsa.lower(), "Lahiri")
+    Used by the endpoint and by background jobs (app.routers.jobs). progress,
+    if given, is awaited with "analysis", "report" and "admin_data" before
+    each stage runs (stages served from the cache or a coalesced run are not
+    reported).
 
-        # 1. Generate Digital Twin
-        digital_twin = generate_digital_twin_enhanced(
-            birth_datetime=birth_datetime,
-            latitude=request.lat,
-            longitude=request.lon,
-            tz_offset_hours=tz_offset,
-            ayanamsa=ayanamsa
-        )
+    Returns:
+        FullCalculatorResponse fields, projected
 
-        # 2. Run AstroBrain analysis
-        from app.astro.calculator import AstroBrain
-        brain = AstroBrain(digital_twin)
-        calculator_output = brain.analyze()
-        calculator_dict = calculator_output.to_dict()
+    Raises:
+        ComputeTimeout: If the analysis task times out
+    """
+    request = plan.request
+
+    async def report_progress(stage: str) -> None:
+        if progress is not None:
+            await progress(stage)
+
+    async def build_response_data() -> Dict[str, Any]:
+        # 1-2. Generate Digital Twin and run AstroBrain analysis (+ scores for admin view)
+        await report_progress("analysis")
+        analysis = await run_compute(
+            app, tasks.full_analysis_task,
+            plan.birth_datetime, request.lat, request.lon, plan.tz_offset, plan.ayanamsa,
+            plan.include_scores
+        )
+        digital_twin = analysis["digital_twin"]
+        calculator_dict = analysis["calculator"]
 
         # Add digital_twin to output for LLM formatter
         calculator_dict["digital_twin"] = digital_twin
@@ -1141,25 +1622,34 @@ async def full_calculate(request: FullCalculatorRequest):
         }
 
         # 3. Generate LLM report (optional)
-        if request.generate_report:
+        if plan.generate_report:
+            await report_progress("report")
             try:
-                from app.astro.llm.generator import PersonalityReportGenerator
-
                 generator = PersonalityReportGenerator()
                 result = await generator.generate(calculator_dict)
+                for phase_name, ms in (
+                    ("llm_formatting", result.metrics.format_ms),
+                    ("llm_call", result.metrics.api_ms),
+                    ("llm_validation", result.metrics.validation_ms),
+                ):
+                    if ms:
+                        record_phase(phase_name, ms / 1000)
 
                 if result.success and result.output:
                     response_data["report_text"] = result.output.personality_report
                     response_data["generation_metrics"] = result.metrics.to_dict()
                 else:
+                    record_error("llm_generation")
                     response_data["error"] = result.error or "LLM generation failed"
 
             except Exception as e:
                 # Continue without LLM report if it fails
+                record_error("llm_generation")
                 response_data["error"] = f"LLM generation error: {str(e)}"
 
         # 4. Prepare admin data (optional)
-        if request.include_admin_data:
+        if plan.include_admin_data:
+            await report_progress("admin_data")
             basic_chart = calculator_dict.get("basic_chart", {})
 
             # Extract nakshatra from digital_twin (not from calculator_dict)
@@ -1168,22 +1658,9 @@ async def full_calculate(request: FullCalculatorRequest):
             # Extract jaimini from digital_twin (not from calculator_dict)
             jaimini_data = _extract_jaimini_from_digital_twin(digital_twin)
 
-            # Phase 8-9: Calculate house and planet scores
-            d1_data = digital_twin.get("vargas", {}).get("D1", {})
-
-            # Phase 8: House scores (needs full digital_twin for multi-layer scoring)
-            house_scores = {}
-            try:
-                house_scores = calculate_house_scores(digital_twin)
-            except Exception as e:
-                print(f"House scoring error: {e}")
-
-            # Phase 9: Planet scores (needs full digital_twin for multi-layer scoring)
-            planet_scores = {}
-            try:
-                planet_scores = calculate_planet_scores(digital_twin)
-            except Exception as e:
-                print(f"Planet scoring error: {e}")
+            # Phase 8-9: House and planet scores (calculated in full_analysis_task)
+            house_scores = analysis.get("house_scores", {})
+            planet_scores = analysis.get("planet_scores", {})
 
             response_data["admin_data"] = {
                 "house_scores": _format_house_scores_russian(house_scores),
@@ -1201,13 +1678,140 @@ async def full_calculate(request: FullCalculatorRequest):
                 "timing_analysis": calculator_dict.get("timing_analysis", {}),
             }
 
-        return FullCalculatorResponse(**response_data)
+        return response_data
+
+    # Successful responses (including the LLM report) are cached per request
+    # and day, since the current dasha and timing analysis follow today's date;
+    # identical concurrent requests share one AstroBrain run and LLM call
+    key = ResponseCache.make_key("full-calculate", {
+        **request.model_dump(),
+        "include": plan.include,
+        "exclude": plan.exclude,
+        "as_of": date.today().isoformat(),
+    })
+
+    async def cached_response_data() -> Dict[str, Any]:
+        cache = get_cache(app)
+        if cache is None:
+            return await build_response_data()
+        return await cache.get_or_compute(
+            key,
+            build_response_data,
+            ttl=cache.config.ttl_full_calculate,
+            should_cache=lambda data: data["success"] and not data["error"]
+        )
+
+    response_data = await full_analysis_flight.do(key, cached_response_data)
+
+    return {
+        **plan.projection.apply(response_data),
+        "success": response_data["success"],
+        "error": response_data["error"],
+    }
+
+
+@router.post("/full-calculate", response_model=FullCalculatorResponse)
+async def full_calculate(
+    request: FullCalculatorRequest,
+    http_request: Request,
+    include: Optional[str] = INCLUDE_QUERY,
+    exclude: Optional[str] = EXCLUDE_QUERY
+):
+    """
+    Full personality calculation endpoint.
+
+    Combines:
+    1. Digital Twin generation (Swiss Ephemeris)
+    2. AstroBrain 12-stage analysis
+    3. LLM personality report generation (optional)
+
+    Returns:
+    - report_text: LLM-generated personality report (5 pages)
+    - admin_data: Structured scores for admin view (optional)
+
+    Sparse fieldsets: `include`/`exclude` select response fields, e.g.
+    `?include=admin_data.house_scores`. Parts left out are not computed
+    (no LLM call without report_text, no scoring without the score fields).
+
+    Long LLM runs are better submitted as a job: POST /v1/jobs/full-calculate.
+    """
+    try:
+        plan = plan_full_calculate(request, include, exclude)
+        response_data = await run_full_calculate(http_request.app, plan)
+        return engine_response(FullCalculatorResponse, **response_data)
 
     except HTTPException:
         raise
+    except ComputeTimeout as e:
+        raise HTTPException(status_code=504, detail=f"Calculation timed out: {e}")
     except Exception as e:
         traceback.print_exc()
         return FullCalculatorResponse(
             success=False,
             error=f"Calculation error: {str(e)}"
         )
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    """One server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+@router.post("/full-calculate/stream")
+async def full_calculate_stream(request: FullCalculatorRequest, http_request: Request):
+    """
+    AstroBrain analysis streamed as server-sent events, stage by stage.
+
+    Each section is sent as soon as its stage completes, as an event named
+    after the section with its JSON as data:
+        event: basic_chart          (Stage 1), then soul_blueprint, yogas,
+                                    wealth_assets, ... timing_analysis
+        event: composite_indices    then life_areas
+        event: scores               {"house_scores": {...}, "planet_scores": {...}}
+        event: done                 {"sections": [...]}
+    A failure ends the stream with `event: error` {"detail": "..."}.
+
+    The Digital Twin comes from the shared natal core (cached, coalesced
+    with /calculate and /save); scores are computed on the compute pool
+    while the stages stream. generate_report and include_admin_data are
+    ignored: no LLM report here (see /full-calculate or its job).
+    Input errors are reported before the stream starts (400).
+    """
+    plan = plan_full_calculate(request)
+
+    async def stream():
+        sections = []
+        scores = None
+        try:
+            core = await _natal_core(
+                http_request, plan.birth_datetime, request.lat, request.lon, plan.tz_offset, plan.ayanamsa
+            )
+            digital_twin = apply_as_of_overlay(core, compute_as_of_overlay(core, date.today()))
+            scores = asyncio.ensure_future(run_compute(http_request, tasks.scores_task, digital_twin))
+
+            # Stages take milliseconds once the twin exists; each step runs in
+            # the threadpool so the loop keeps serving, and a client that goes
+            # away stops the remaining stages
+            start = time.perf_counter()
+            async for section, value in iterate_in_threadpool(AstroBrain(digital_twin).iter_analyze()):
+                record_phase(f"astrobrain.{section}", time.perf_counter() - start)
+                sections.append(section)
+                yield _sse_event(section, value)
+                start = time.perf_counter()
+
+            yield _sse_event("scores", await scores)
+            yield _sse_event("done", {"sections": sections + ["scores"]})
+        except ComputeTimeout as e:
+            yield _sse_event("error", {"detail": f"Calculation timed out: {e}"})
+        except Exception as e:
+            traceback.print_exc()
+            yield _sse_event("error", {"detail": f"Calculation error: {str(e)}"})
+        finally:
+            if scores is not None and not scores.done():
+                scores.cancel()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,120 @@
+"""
+StarMeet API - Jobs Router
+Background job endpoints for long-running calculations.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.jobs import FINAL_STATUSES, JobQueueFull, get_job_queue
+from app.routers.astro import (
+    EXCLUDE_QUERY,
+    INCLUDE_QUERY,
+    FullCalculatorRequest,
+    plan_full_calculate,
+    run_full_calculate,
+)
+
+router = APIRouter()
+
+# SSE: store poll interval and keep-alive comment interval (seconds)
+EVENTS_POLL_INTERVAL = 0.5
+EVENTS_KEEPALIVE_INTERVAL = 15.0
+
+# Retry-After sent with 503 when the queue is full (seconds)
+QUEUE_FULL_RETRY_AFTER = 30
+
+
+class JobResponse(BaseModel):
+    """Job status record."""
+    id: str
+    kind: str
+    status: str                      # queued, running, succeeded, failed
+    stage: Optional[str] = None      # Pipeline stage while running
+    created_at: str
+    updated_at: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@router.post("/jobs/full-calculate", response_model=JobResponse, status_code=202)
+async def submit_full_calculate(
+    request: FullCalculatorRequest,
+    http_request: Request,
+    include: Optional[str] = INCLUDE_QUERY,
+    exclude: Optional[str] = EXCLUDE_QUERY
+):
+    """
+    Queue a /full-calculate run and return its job immediately.
+
+    Poll GET /v1/jobs/{id} or follow GET /v1/jobs/{id}/events (SSE); the
+    result is the /full-calculate response body. Input errors are reported
+    here (400), not in the job.
+    """
+    plan = plan_full_calculate(request, include, exclude)
+    app = http_request.app
+    queue = get_job_queue(http_request)
+
+    try:
+        return await queue.submit("full-calculate", lambda progress: run_full_calculate(app, plan, progress))
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many queued jobs, retry later",
+            headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)}
+        )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, http_request: Request):
+    """Get a job's status, and its result once it has succeeded."""
+    job = await get_job_queue(http_request).store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, http_request: Request):
+    """
+    Server-sent events for a job.
+
+    Emits a `status` event with the job record whenever its status or stage
+    changes, ending with the final record (including the result). Comment
+    lines keep idle connections open through proxies.
+    """
+    store = get_job_queue(http_request).store
+    if await store.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    async def stream():
+        last_seen = None
+        idle = 0.0
+        while True:
+            job = await store.get(job_id)
+            if job is None:
+                yield f"event: error\ndata: {json.dumps({'detail': 'Job expired'})}\n\n"
+                return
+            state = (job["status"], job["stage"])
+            if state != last_seen:
+                last_seen = state
+                idle = 0.0
+                yield f"event: status\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+                if job["status"] in FINAL_STATUSES:
+                    return
+            elif idle >= EVENTS_KEEPALIVE_INTERVAL:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+            idle += EVENTS_POLL_INTERVAL
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
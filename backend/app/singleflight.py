@@ -0,0 +1,82 @@
+"""
+StarMeet API - Singleflight
+
+Coalesces identical concurrent computations within one worker process.
+
+A double-submitted form, or the wizard's /calculate and /save for the same
+birth, would otherwise compute the same chart twice at the same time. With
+SingleFlight.do(), the first caller for a key starts the computation and
+every caller that arrives while it is in flight awaits the same result.
+
+The computation runs as its own task, so a caller that disconnects (and is
+cancelled) does not cancel it for the others. Results are shared objects:
+callers must not mutate them.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters since startup (per worker process)."""
+    executed: int = 0     # Computations started
+    coalesced: int = 0    # Calls served by an already running computation
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = self.executed + self.coalesced
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / calls, 4) if calls else None,
+        }
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of concurrent async computations.
+
+    Usage:
+        flight = SingleFlight("natal_core")
+        core = await flight.do(key, lambda: compute_core(...))
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stats = SingleFlightStats()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def inflight(self) -> int:
+        """Number of keys currently being computed."""
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return fn()'s result, sharing one execution among concurrent callers of key.
+
+        Exceptions from fn propagate to every caller waiting on that execution.
+        """
+        task: Optional[asyncio.Task] = self._inflight.get(key)
+        if task is None:
+            self.stats.executed += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+
+# Flights shared by the routers
+natal_core_flight = SingleFlight("natal_core")
+full_analysis_flight = SingleFlight("full_analysis")
+
+
+def singleflight_stats() -> Dict[str, Any]:
+    """Stats of all flights, for /health."""
+    return {
+        flight.name: {**flight.stats.to_dict(), "inflight": flight.inflight}
+        for flight in (natal_core_flight, full_analysis_flight)
+    }
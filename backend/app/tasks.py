@@ -0,0 +1,295 @@
+"""
+StarMeet API - Compute Tasks
+
+CPU-bound work executed in the ComputePool worker processes (see app.executor).
+Every task is a module-level function taking and returning plain picklable
+values, so it can cross the process boundary.
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.engine import (
+    SIGNS,
+    VARGA_CODES,
+    generate_digital_twin_enhanced,
+    build_chart_context,
+    build_natal_core,
+    build_digital_twin,
+    shift_digital_twin,
+    ChartContext,
+    TwinDelta,
+    TwinProjection,
+)
+from astro_core.batch import BATCH_BODIES, BatchBirth, compute_batch
+from astro_core.phases import PhaseRecord, collect_phases, phase, record_error, record_phase
+
+from app.astro.calculator import AstroBrain
+from app.astro.llm.formatter import format_for_llm
+from app.astro.scoring import (
+    PHASE_8_5_ERRORS,
+    calculate_planet_scores,
+    calculate_house_scores,
+)
+from app.timezones import parse_local_datetimes, timezone_resolver
+
+
+def warm_up() -> bool:
+    """Touch the engine and analysis modules so their import cost is paid at pool start."""
+    return AstroBrain is not None and generate_digital_twin_enhanced is not None
+
+
+# Reference chart for the startup warm-up (app.warmup): New Delhi, 2000-01-01 12:00 IST
+REFERENCE_CHART = (datetime(2000, 1, 1, 12, 0), 28.6139, 77.2090, 5.5, "Lahiri")
+
+
+def reference_chart_task() -> float:
+    """
+    Run the reference chart through the whole pipeline in this worker.
+
+    Digital Twin, AstroBrain, Phase 8-9 scores and LLM prompt formatting (no
+    LLM call), so ephemeris files and first-touch imports are loaded before
+    real requests arrive.
+
+    Returns:
+        Seconds taken
+    """
+    start = time.perf_counter()
+    analysis = full_analysis_task(*REFERENCE_CHART, include_scores=True)
+    format_for_llm({**analysis["calculator"], "digital_twin": analysis["digital_twin"]})
+    return time.perf_counter() - start
+
+
+def run_instrumented(fn: Callable[..., Any], *args: Any) -> Tuple[Any, PhaseRecord]:
+    """
+    Run a task, capturing its phase timings and handled errors.
+
+    Used by the compute pool so phases measured in a worker process reach the
+    API process's metrics (astro_core.phases.replay). Phase 8.5 scoring-layer
+    failures are reported as errors "house_layer.<Layer>".
+    """
+    layer_errors_before = PHASE_8_5_ERRORS.copy()
+    with collect_phases() as record:
+        result = fn(*args)
+    for layer, count in (PHASE_8_5_ERRORS - layer_errors_before).items():
+        record.errors.extend([f"house_layer.{layer}"] * count)
+    return result, record
+
+
+def analyze_timed(brain: AstroBrain) -> Dict[str, Any]:
+    """brain.analyze().to_dict(), reporting each section's time as phase "astrobrain.<section>"."""
+    start = time.perf_counter()
+    for section, _ in brain.iter_analyze():
+        record_phase(f"astrobrain.{section}", time.perf_counter() - start)
+        start = time.perf_counter()
+    return brain.output.to_dict()
+
+
+def enhanced_twin_task(
+    birth_datetime: datetime,
+    latitude: float,
+    longitude: float,
+    tz_offset_hours: float,
+    ayanamsa: str
+) -> Dict[str, Any]:
+    """Enhanced Digital Twin with Dasha and retrograde data (generate_digital_twin_enhanced)."""
+    return generate_digital_twin_enhanced(
+        birth_datetime=birth_datetime,
+        latitude=latitude,
+        longitude=longitude,
+        tz_offset_hours=tz_offset_hours,
+        ayanamsa=ayanamsa
+    )
+
+
+def scrub_base_task(
+    birth_datetime: datetime,
+    latitude: float,
+    longitude: float,
+    tz_offset_hours: float,
+    ayanamsa: str
+) -> Tuple[ChartContext, Dict[str, Any]]:
+    """Chart context and base Digital Twin anchoring a /ws/scrub session (build_digital_twin)."""
+    context = build_chart_context(
+        birth_datetime=birth_datetime,
+        latitude=latitude,
+        longitude=longitude,
+        tz_offset_hours=tz_offset_hours,
+        ayanamsa=ayanamsa
+    )
+    return context, build_digital_twin(context)
+
+
+def shift_twin_task(
+    context: ChartContext,
+    new_birth_datetime: datetime,
+    base_twin: Dict[str, Any]
+) -> TwinDelta:
+    """Digital Twin for a nearby birth time and its diff (shift_digital_twin)."""
+    return shift_digital_twin(context, new_birth_datetime, base_twin)
+
+
+def natal_core_task(
+    birth_datetime: datetime,
+    latitude: float,
+    longitude: float,
+    tz_offset_hours: float,
+    ayanamsa: str,
+    projection: Optional[TwinProjection] = None
+) -> Dict[str, Any]:
+    """Deterministic natal core of the enhanced twin (build_natal_core); cacheable."""
+    context = build_chart_context(
+        birth_datetime=birth_datetime,
+        latitude=latitude,
+        longitude=longitude,
+        tz_offset_hours=tz_offset_hours,
+        ayanamsa=ayanamsa
+    )
+    return build_natal_core(context, projection)
+
+
+def full_analysis_task(
+    birth_datetime: datetime,
+    latitude: float,
+    longitude: float,
+    tz_offset_hours: float,
+    ayanamsa: str,
+    include_scores: bool = False
+) -> Dict[str, Any]:
+    """
+    Digital Twin + AstroBrain analysis (+ Phase 8-9 scores) for /full-calculate.
+
+    Returns:
+        {
+            "digital_twin": {...},
+            "calculator": AstroBrain output dict,
+            "house_scores": {...},   # only with include_scores
+            "planet_scores": {...}   # only with include_scores
+        }
+        Scoring failures leave the score dict empty, as the endpoint did inline.
+    """
+    digital_twin = enhanced_twin_task(birth_datetime, latitude, longitude, tz_offset_hours, ayanamsa)
+
+    result: Dict[str, Any] = {
+        "digital_twin": digital_twin,
+        "calculator": analyze_timed(AstroBrain(digital_twin)),
+    }
+
+    if include_scores:
+        result.update(scores_task(digital_twin))
+
+    return result
+
+
+def scores_task(digital_twin: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Phase 8-9 house and planet scores of a Digital Twin.
+
+    Returns:
+        {"house_scores": {...}, "planet_scores": {...}}
+        A scoring failure leaves its dict empty.
+    """
+    # Phase 8: House scores (needs full digital_twin for multi-layer scoring)
+    house_scores = {}
+    try:
+        with phase("house_scoring"):
+            house_scores = calculate_house_scores(digital_twin)
+    except Exception as e:
+        record_error("house_scoring")
+        print(f"House scoring error: {e}")
+
+    # Phase 9: Planet scores (needs full digital_twin for multi-layer scoring)
+    planet_scores = {}
+    try:
+        with phase("planet_scoring"):
+            planet_scores = calculate_planet_scores(digital_twin)
+    except Exception as e:
+        record_error("planet_scoring")
+        print(f"Planet scoring error: {e}")
+
+    return {"house_scores": house_scores, "planet_scores": planet_scores}
+
+
+# (index, birth_datetime, latitude, longitude, tz_offset_hours, ayanamsa)
+BatchItem = Tuple[int, datetime, float, float, float, str]
+
+
+def batch_twins_task(items: List[BatchItem]) -> List[Dict[str, Any]]:
+    """
+    Enhanced Digital Twins for a chunk of /calculate/batch?mode=twin items.
+
+    Built one item at a time (enhanced_twin_task): the engine's batch path
+    covers positions only (see batch_positions_task).
+
+    Returns:
+        One {"index", "success", "digital_twin"} or {"index", "success", "error"}
+        dict per item; a failing item does not affect the others.
+    """
+    results = []
+    for index, birth_datetime, latitude, longitude, tz_offset_hours, ayanamsa in items:
+        try:
+            twin = enhanced_twin_task(birth_datetime, latitude, longitude, tz_offset_hours, ayanamsa)
+            results.append({"index": index, "success": True, "digital_twin": twin})
+        except Exception as e:
+            results.append({"index": index, "success": False, "error": f"Calculation error: {str(e)}"})
+    return results
+
+
+def batch_positions_task(items: List[BatchItem]) -> List[Dict[str, Any]]:
+    """
+    D1 longitudes and varga signs for a chunk of /calculate/batch items.
+
+    Uses the engine's batch path (astro_core.batch) inline in this worker:
+    the endpoint's parallelism is its chunks running on the compute pool, and
+    a nested process pool per chunk would only oversubscribe the CPUs. Items
+    are grouped by ayanamsa since the sidereal mode is set per batch.
+
+    Returns:
+        One {"index", "success", "positions": {body: {"longitude", "sign", "vargas"}}}
+        or {"index", "success", "error"} dict per item.
+    """
+    by_ayanamsa: Dict[str, List[BatchItem]] = {}
+    for item in items:
+        by_ayanamsa.setdefault(item[5], []).append(item)
+
+    results = []
+    for ayanamsa, group in by_ayanamsa.items():
+        births = [BatchBirth(item[1], item[2], item[3], item[4]) for item in group]
+        with compute_batch(births, ayanamsa=ayanamsa, workers=1) as batch:
+            for row, item in enumerate(group):
+                if row in batch.errors:
+                    results.append({"index": item[0], "success": False, "error": batch.errors[row]})
+                    continue
+                results.append({
+                    "index": item[0],
+                    "success": True,
+                    "positions": {
+                        body: {
+                            "longitude": round(float(batch.longitudes[row, b]), 4),
+                            "sign": SIGNS[batch.sign_indices[row, b]],
+                            "vargas": {
+                                code: SIGNS[batch.varga_signs[row, b, v]]
+                                for v, code in enumerate(VARGA_CODES)
+                            },
+                        }
+                        for b, body in enumerate(BATCH_BODIES)
+                    },
+                })
+    return results
+
+
+def bulk_timezones_task(
+    lats: List[float], lons: List[float], dates: List[str], times: List[str]
+) -> Dict[str, List[Any]]:
+    """
+    Timezones for columns of birth places and local dates/times (/timezone/batch).
+
+    Returns:
+        {"timezone_name", "utc_offset", "is_dst", "dst_offset"} lists, one entry per row
+    """
+    with phase("timezone"):
+        return timezone_resolver.resolve_many(lats, lons, parse_local_datetimes(dates, times)).to_dict()
@@ -0,0 +1,106 @@
+"""
+Tests for per-lane admission control (app.admission).
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.admission import AdmissionConfig, AdmissionController, AdmissionMiddleware, Lane, LaneFull
+
+
+def test_lane_limits_concurrency_and_queue():
+    async def main():
+        lane = Lane("test", concurrency=1, max_waiting=1, wait_timeout=5)
+        release = asyncio.Event()
+        order = []
+
+        async def hold(name):
+            async with lane.slot():
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(hold("first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold("second"))
+        await asyncio.sleep(0)
+        snapshot = lane.to_dict()
+
+        with pytest.raises(LaneFull, match="queue is full"):
+            async with lane.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(first, second)
+        return order, snapshot, lane.to_dict()
+
+    order, during, after = asyncio.run(main())
+
+    assert order == ["first", "second"]
+    assert during["active"] == 1 and during["waiting"] == 1
+    assert after == {"concurrency": 1, "active": 0, "waiting": 0, "max_waiting": 1, "admitted": 2, "rejected": 1}
+
+
+def test_lane_wait_times_out():
+    async def main():
+        lane = Lane("test", concurrency=1, max_waiting=5, wait_timeout=0.01)
+        async with lane.slot():
+            with pytest.raises(LaneFull, match="wait exceeded"):
+                async with lane.slot():
+                    pass
+        return lane.to_dict()
+
+    stats = asyncio.run(main())
+
+    assert stats["rejected"] == 1 and stats["waiting"] == 0
+
+
+def test_routes_are_assigned_to_lanes():
+    controller = AdmissionController(AdmissionConfig())
+
+    assert controller.lane_for("POST", "/v1/full-calculate").name == "analysis"
+    assert controller.lane_for("POST", "/v1/calculate/").name == "chart"
+    assert controller.lane_for("POST", "/v1/quick-varga") is None
+    assert controller.lane_for("GET", "/v1/signs") is None
+
+
+@pytest.fixture
+def app():
+    app = FastAPI(root_path="/star-api")
+    app.add_middleware(AdmissionMiddleware)
+    app.state.admission = AdmissionController(
+        AdmissionConfig(analysis_concurrency=0, analysis_queue=0, retry_after=7)
+    )
+
+    @app.post("/v1/full-calculate")
+    async def full_calculate():
+        return {"ran": True}
+
+    @app.get("/v1/signs")
+    async def signs():
+        return {"ran": True}
+
+    return app
+
+
+def test_middleware_rejects_full_lane_and_passes_other_routes(app):
+    client = TestClient(app)
+
+    busy = client.post("/v1/full-calculate")
+    assert busy.status_code == 503
+    assert busy.headers["Retry-After"] == "7"
+    assert client.get("/v1/signs").json() == {"ran": True}
+    assert app.state.admission.stats()["analysis"]["rejected"] == 1
+
+
+def test_middleware_passes_through_without_controller(app):
+    del app.state.admission
+
+    assert TestClient(app).post("/v1/full-calculate").json() == {"ran": True}
@@ -0,0 +1,95 @@
+"""
+Tests for stage-by-stage AstroBrain analysis (AstroBrain.iter_analyze) and its SSE route.
+"""
+
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend, packages and engine test helpers to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "astro_core" / "tests"))
+
+from conftest import VADIM_ASCENDANT, VADIM_LONGITUDES, build_chart
+from astro_core.engine import ChartContext, build_digital_twin_enhanced
+
+from app import tasks
+from app.astro.calculator import STAGE_SECTIONS, AstroBrain
+from app.routers import astro as astro_router
+
+
+def make_context(*args, **kwargs) -> ChartContext:
+    return ChartContext(chart=build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT), tz_offset_hours=3.0)
+
+
+@pytest.fixture(scope="module")
+def digital_twin():
+    return build_digital_twin_enhanced(make_context(), datetime.date(2026, 10, 18))
+
+
+def test_iter_analyze_yields_sections_in_stage_order(digital_twin):
+    sections = [section for section, _ in AstroBrain(digital_twin).iter_analyze()]
+
+    assert sections == list(STAGE_SECTIONS.values()) + ["composite_indices", "life_areas"]
+
+
+def test_iter_analyze_matches_analyze(digital_twin):
+    brain = AstroBrain(digital_twin)
+    streamed = dict(brain.iter_analyze())
+    expected = AstroBrain(digital_twin).analyze().to_dict()
+
+    assert json.dumps(brain.output.to_dict(), default=str) == json.dumps(expected, default=str)
+    assert {k: v for k, v in expected.items() if k in streamed} == streamed
+
+
+def test_iter_analyze_yields_dependencies():
+    brain = AstroBrain(json.loads((Path(__file__).parent.parent / "astro" / "tests" / "fixtures"
+                                   / "digital_twin_fixture.json").read_text()))
+
+    assert [section for section, _ in brain.iter_analyze(stages=[3])] == ["basic_chart", "yogas"]
+
+
+def read_events(response) -> list:
+    events, event = [], None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            events.append((event, json.loads(line[len("data: "):])))
+    return events
+
+
+REQUEST = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7}
+
+
+def test_stream_route_sends_stages_then_scores(monkeypatch):
+    monkeypatch.setattr(tasks, "build_chart_context", make_context)
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+
+    with TestClient(app) as client:
+        with client.stream("POST", "/v1/full-calculate/stream", json=REQUEST) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = read_events(response)
+
+    names = [name for name, _ in events]
+    assert names[0] == "basic_chart"
+    assert names[-2:] == ["scores", "done"]
+    assert events[-1][1]["sections"] == names[:-1]
+    assert set(events[-2][1]) == {"house_scores", "planet_scores"}
+
+
+def test_stream_route_rejects_bad_input():
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+
+    with TestClient(app) as client:
+        response = client.post("/v1/full-calculate/stream", json={**REQUEST, "date": "1977-13-45"})
+
+    assert response.status_code == 400
@@ -0,0 +1,229 @@
+"""
+Tests for the response cache (app.cache) against the in-memory backend.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app.cache import (
+    KEY_PREFIX,
+    CacheConfig,
+    InMemoryCacheBackend,
+    ResponseCache,
+    canonical_request,
+)
+from astro_core.engine import ENGINE_VERSION
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(CacheConfig(lock_timeout=2.0, lock_poll_interval=0.01), InMemoryCacheBackend())
+
+
+REQUEST = {"date": "1977-10-25", "time": "6:28", "lat": 61.70001, "lon": 30.7, "ayanamsa": "Raman"}
+
+
+def test_canonical_request():
+    assert canonical_request(REQUEST) == {
+        "date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7, "ayanamsa": "raman",
+    }
+
+
+def test_key_ignores_spelling_but_not_content():
+    same = {**REQUEST, "time": "06:28", "lat": 61.7, "ayanamsa": " raman "}
+    other = {**REQUEST, "time": "06:29"}
+
+    assert ResponseCache.make_key("calculate", REQUEST) == ResponseCache.make_key("calculate", same)
+    assert ResponseCache.make_key("calculate", REQUEST) != ResponseCache.make_key("calculate", other)
+    assert ResponseCache.make_key("calculate", REQUEST) != ResponseCache.make_key("full-calculate", REQUEST)
+    assert ResponseCache.make_key("calculate", REQUEST).startswith(f"starmeet:{ENGINE_VERSION}:calculate:")
+    assert KEY_PREFIX == f"starmeet:{ENGINE_VERSION}"
+
+
+def test_miss_then_hit(cache):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"value": 42}
+
+    async def scenario():
+        first = await cache.get_or_compute("k", compute, ttl=60)
+        second = await cache.get_or_compute("k", compute, ttl=60)
+        return first, second
+
+    assert asyncio.run(scenario()) == ({"value": 42}, {"value": 42})
+    assert len(calls) == 1
+    assert cache.stats.to_dict()["hit_rate"] == 0.5
+
+
+def test_ttl_expiry(cache):
+    backend = cache.backend
+
+    async def scenario():
+        await cache.set("k", [1], ttl=0.05)
+        assert await cache.get("k") == [1]
+        await asyncio.sleep(0.08)
+        return await cache.get("k")
+
+    assert asyncio.run(scenario()) is None
+    assert backend._data == {}
+
+
+def test_memory_backend_is_bounded_lru():
+    backend = InMemoryCacheBackend(max_entries=2)
+
+    async def scenario():
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.get("a")          # "b" is now least recently used
+        await backend.set("c", b"3")
+        return [await backend.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [b"1", None, b"3"]
+    assert len(backend) == 2
+
+
+def test_memory_backend_sweeps_expired_on_write():
+    backend = InMemoryCacheBackend()
+
+    async def scenario():
+        await backend.set("short", b"1", ex=0.05)
+        await backend.set("long", b"2", ex=60)
+        await asyncio.sleep(0.08)
+        await backend.set("other", b"3")
+
+    asyncio.run(scenario())
+    assert list(backend._data) == ["long", "other"]
+
+
+def test_values_round_trip_like_json(cache):
+    async def scenario():
+        await cache.set("k", {"houses": {1: "Aries"}, "names": ("Sun", "Moon")}, ttl=60)
+        return await cache.get("k")
+
+    assert asyncio.run(scenario()) == {"houses": {"1": "Aries"}, "names": ["Sun", "Moon"]}
+
+
+def test_stampede_computes_once(cache):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "chart"
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_compute("k", compute, ttl=60) for _ in range(10)))
+
+    assert asyncio.run(scenario()) == ["chart"] * 10
+    assert len(calls) == 1
+    assert cache.stats.lock_waits == 9
+
+
+def test_uncacheable_result_releases_waiters(cache):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"success": False}
+
+    async def scenario():
+        return await asyncio.gather(*(
+            cache.get_or_compute("k", compute, ttl=60, should_cache=lambda v: v["success"])
+            for _ in range(3)
+        ))
+
+    assert asyncio.run(scenario()) == [{"success": False}] * 3
+    # Waiters notice the released lock and compute themselves
+    assert len(calls) == 3
+    assert asyncio.run(cache.get("k")) is None
+
+
+def test_backend_errors_bypass_cache():
+    class BrokenBackend(InMemoryCacheBackend):
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    cache = ResponseCache(CacheConfig(), BrokenBackend())
+
+    async def compute():
+        return "fresh"
+
+    assert asyncio.run(cache.get_or_compute("k", compute, ttl=60)) == "fresh"
+    assert cache.stats.errors == 2
+
+
+def test_disabled_cache_always_computes():
+    cache = ResponseCache(CacheConfig(enabled=False), InMemoryCacheBackend())
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return 1
+
+    asyncio.run(cache.get_or_compute("k", compute, ttl=60))
+    asyncio.run(cache.get_or_compute("k", compute, ttl=60))
+    assert len(calls) == 2
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    monkeypatch.setenv("CACHE_TTL_CALCULATE", "120")
+    monkeypatch.setenv("CACHE_MEMORY_MAX_ENTRIES", "16")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    config = CacheConfig.from_env()
+
+    assert config.enabled is False
+    assert config.ttl_calculate == 120
+    assert ResponseCache(config).backend.max_entries == 16
+    assert config.redis_url is None
+
+
+def test_full_calculate_is_cached_per_day(monkeypatch):
+    import datetime
+
+    from fastapi import FastAPI
+
+    from app import tasks
+    from app.routers import astro
+
+    today = {"date": datetime.date(2026, 10, 18)}
+
+    class FakeDate(datetime.date):
+        @classmethod
+        def today(cls):
+            return today["date"]
+
+    runs = []
+
+    def fake_analysis(*args):
+        runs.append(today["date"])
+        return {"digital_twin": {}, "calculator": {"run": len(runs)}}
+
+    monkeypatch.setattr(astro, "date", FakeDate)
+    monkeypatch.setattr(tasks, "full_analysis_task", fake_analysis)
+    app = FastAPI()
+    app.state.response_cache = ResponseCache(CacheConfig(), InMemoryCacheBackend())
+    plan = astro.plan_full_calculate(astro.FullCalculatorRequest(
+        date="1977-10-25", time="06:28", lat=61.7, lon=30.7, generate_report=False
+    ))
+
+    asyncio.run(astro.run_full_calculate(app, plan))
+    asyncio.run(astro.run_full_calculate(app, plan))
+    today["date"] = datetime.date(2026, 10, 19)
+    asyncio.run(astro.run_full_calculate(app, plan))
+
+    assert runs == [datetime.date(2026, 10, 18), datetime.date(2026, 10, 19)]
@@ -0,0 +1,56 @@
+"""
+Tests for the /calculate/batch NDJSON endpoint.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app import tasks
+from app.routers import astro as astro_router
+
+ITEM = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7, "timezone_override": 3.0}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+    with TestClient(app) as client:
+        yield client
+
+
+def batch_lines(response):
+    return sorted((json.loads(line) for line in response.text.splitlines()), key=lambda line: line["index"])
+
+
+def test_default_mode_uses_engine_batch_path(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("per-item twin built in default mode")
+
+    monkeypatch.setattr(tasks, "enhanced_twin_task", fail)
+    lines = batch_lines(client.post("/v1/calculate/batch", json=[ITEM, ITEM]))
+
+    assert [line["success"] for line in lines] == [True, True]
+    assert lines[0]["positions"]["Sun"]["sign"] == "Libra"
+    assert lines[0]["detected_timezone"]["source"] == "override"
+
+
+
+@pytest.mark.parametrize("raw, error", [
+    ("1977-10-25", "Invalid request: item must be an object"),
+    ({**ITEM, "time": "25:99"}, "Invalid date/time format"),
+])
+def test_invalid_items_get_error_lines(client, raw, error):
+    lines = batch_lines(client.post("/v1/calculate/batch", json=[ITEM, raw]))
+
+    assert lines[0]["success"]
+    assert not lines[1]["success"] and lines[1]["error"].startswith(error)
@@ -0,0 +1,138 @@
+"""
+Tests for ETags and If-None-Match on saved profiles and /calculate (app.etags).
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend, packages and engine test helpers to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "astro_core" / "tests"))
+
+from conftest import VADIM_ASCENDANT, VADIM_LONGITUDES, build_chart
+from astro_core.engine import ChartContext
+
+from app import tasks
+from app.etags import FileETags, etag_matches
+from app.routers import astro as astro_router
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def profiles_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(astro_router, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(astro_router, "profile_etags", FileETags())
+    (tmp_path / "abc.json").write_text('{"id": "abc", "input": {"name": "Olya"}}', encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('"x"', True),
+    ('W/"x"', True),
+    ('"y", "x"', True),
+    ("*", True),
+    ('"y"', False),
+    (None, False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"x"') is expected
+
+
+def test_profile_revalidation(client, profiles_dir):
+    first = client.get("/v1/profiles/abc")
+    etag = first.headers["etag"]
+
+    revalidated = client.get("/v1/profiles/abc", headers={"If-None-Match": etag})
+
+    assert first.content == (profiles_dir / "abc.json").read_bytes()
+    assert first.headers["content-type"] == "application/json"
+    assert first.headers["cache-control"] == "no-cache"
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    (profiles_dir / "abc.json").write_text('{"id": "abc", "input": {"name": "Olga Ivanova"}}', encoding="utf-8")
+    changed = client.get("/v1/profiles/abc", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+
+
+def test_cached_etag_skips_reading_the_profile(client, profiles_dir, monkeypatch):
+    etag = client.get("/v1/profiles/abc").headers["etag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("profile read during revalidation")
+
+    monkeypatch.setattr(Path, "read_bytes", fail)
+    assert client.get("/v1/profiles/abc", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_profile_list_etag_follows_the_directory(client, profiles_dir):
+    etag = client.get("/v1/profiles").headers["etag"]
+
+    assert client.get("/v1/profiles", headers={"If-None-Match": etag}).status_code == 304
+
+    (profiles_dir / "def.json").write_text('{"id": "def"}', encoding="utf-8")
+    changed = client.get("/v1/profiles", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and len(changed.json()["profiles"]) == 2
+
+
+def test_deleted_profile_is_not_revalidated(client, profiles_dir):
+    etag = client.get("/v1/profiles/abc").headers["etag"]
+
+    client.delete("/v1/profiles/abc")
+
+    assert client.get("/v1/profiles/abc", headers={"If-None-Match": etag}).status_code == 404
+
+
+def test_calculate_revalidation(client, monkeypatch):
+    calls = []
+
+    def make_context(*args, **kwargs):
+        calls.append(args)
+        return ChartContext(chart=build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT), tz_offset_hours=3.0)
+
+    monkeypatch.setattr(tasks, "build_chart_context", make_context)
+    request = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7}
+
+    first = client.post("/v1/calculate?vargas=D1,D9", json=request)
+    etag = first.headers["etag"]
+    computed = len(calls)
+
+    revalidated = client.post("/v1/calculate?vargas=D1,D9", json=request, headers={"If-None-Match": etag})
+    assert len(calls) == computed
+    other_projection = client.post("/v1/calculate?vargas=D1", json=request, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert revalidated.status_code == 304 and revalidated.headers["vary"] == "Accept"
+    assert other_projection.status_code == 200 and other_projection.headers["etag"] != etag
+
+
+def test_calculate_etag_is_weak_across_equivalent_bodies(client, monkeypatch):
+    monkeypatch.setattr(
+        tasks, "build_chart_context",
+        lambda *args, **kwargs: ChartContext(chart=build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT), tz_offset_hours=3.0)
+    )
+    request = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7}
+
+    first = client.post("/v1/calculate", json=request)
+    second = client.post("/v1/calculate", json=request)
+    bodies = [response.json() for response in (first, second)]
+    for body in bodies:
+        del body["digital_twin"]["meta"]["generated_at"]
+
+    # Same ETag, same body up to the generation timestamp: not byte-identical,
+    # so the validator must be weak
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"].startswith('W/"')
+    assert bodies[0] == bodies[1]
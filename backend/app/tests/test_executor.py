@@ -0,0 +1,97 @@
+"""
+Tests for the compute pool (app.executor).
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app.executor import ComputePool, ComputePoolConfig, ComputeTimeout, run_compute
+
+
+def square(x):
+    return x * x
+
+
+def worker_pid():
+    return os.getpid()
+
+
+def sleepy(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def pool():
+    pool = ComputePool(ComputePoolConfig(workers=2, max_pending=2, task_timeout=5.0))
+    asyncio.run(pool.start())
+    yield pool
+    pool.shutdown()
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("COMPUTE_WORKERS", "3")
+    monkeypatch.setenv("COMPUTE_TASK_TIMEOUT", "12.5")
+
+    config = ComputePoolConfig.from_env()
+
+    assert config.workers == 3
+    assert config.task_timeout == 12.5
+
+
+def test_runs_in_worker_process(pool):
+    async def scenario():
+        return await pool.run(square, 7), await pool.run(worker_pid)
+
+    result, pid = asyncio.run(scenario())
+
+    assert result == 49
+    assert pid != os.getpid()
+
+
+def test_timeout_raises_and_frees_slot(pool):
+    async def scenario():
+        with pytest.raises(ComputeTimeout):
+            await pool.run(sleepy, 2, timeout=0.2)
+        with pytest.raises(ComputeTimeout):
+            await pool.run(sleepy, 2, timeout=0.2)
+        # Both slots were released despite the workers still sleeping
+        return await pool.run(square, 3, timeout=10)
+
+    assert asyncio.run(scenario()) == 9
+
+
+def test_admission_is_bounded(pool):
+    async def scenario():
+        running = [asyncio.create_task(pool.run(sleepy, 0.5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        waiting = asyncio.create_task(pool.run(square, 2))
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+        await asyncio.gather(*running)
+        return await waiting
+
+    assert asyncio.run(scenario()) == 4
+
+
+def test_not_started_pool_raises():
+    pool = ComputePool(ComputePoolConfig(workers=1))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool.run(square, 2))
+
+
+def test_run_compute_falls_back_without_pool():
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+    assert asyncio.run(run_compute(request, square, 5)) == 25
@@ -0,0 +1,143 @@
+"""
+Tests for background jobs (app.jobs, app.routers.jobs) against the in-memory store.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app.cache import InMemoryCacheBackend
+from app.jobs import JobQueue, JobQueueConfig, JobQueueFull
+from app.routers import jobs as jobs_router
+
+
+def make_queue(**config) -> JobQueue:
+    return JobQueue(JobQueueConfig(**config), InMemoryCacheBackend())
+
+
+async def wait_final(queue: JobQueue, job_id: str) -> dict:
+    for _ in range(200):
+        job = await queue.store.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_runs_and_reports_stages():
+    async def main():
+        queue = make_queue(workers=1)
+        await queue.start()
+        stages = []
+
+        async def pipeline(progress):
+            await progress("analysis")
+            stages.append((await queue.store.get(job["id"]))["stage"])
+            return {"success": True}
+
+        job = await queue.submit("test", pipeline)
+        assert job["status"] == "queued"
+        final = await wait_final(queue, job["id"])
+        await queue.stop()
+        return final, stages
+
+    final, stages = asyncio.run(main())
+
+    assert stages == ["analysis"]
+    assert final["status"] == "succeeded"
+    assert final["result"] == {"success": True}
+    assert final["stage"] is None
+
+
+def test_failures_and_timeouts_are_recorded():
+    async def main():
+        queue = make_queue(workers=2, timeout=0.05)
+        await queue.start()
+
+        async def boom(progress):
+            raise RuntimeError("LLM down")
+
+        async def slow(progress):
+            await asyncio.sleep(1)
+
+        failed = await queue.submit("test", boom)
+        timed_out = await queue.submit("test", slow)
+        results = await wait_final(queue, failed["id"]), await wait_final(queue, timed_out["id"])
+        await queue.stop()
+        return results
+
+    failed, timed_out = asyncio.run(main())
+
+    assert failed["status"] == "failed" and failed["error"] == "RuntimeError: LLM down"
+    assert timed_out["status"] == "failed" and "did not finish" in timed_out["error"]
+
+
+def test_queue_is_bounded_and_stop_fails_queued_jobs():
+    async def main():
+        queue = make_queue(workers=0, max_queued=2)
+        await queue.start()
+
+        async def noop(progress):
+            return {}
+
+        queued = [await queue.submit("test", noop) for _ in range(2)]
+        with pytest.raises(JobQueueFull):
+            await queue.submit("test", noop)
+        await queue.stop()
+        return [await queue.store.get(job["id"]) for job in queued]
+
+    for job in asyncio.run(main()):
+        assert job["status"] == "failed"
+        assert "shutting down" in job["error"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fake_pipeline(app, plan, progress=None):
+        await progress("analysis")
+        return {"success": True, "report_text": None, "error": None}
+
+    monkeypatch.setattr(jobs_router, "plan_full_calculate", lambda request, include, exclude: None)
+    monkeypatch.setattr(jobs_router, "run_full_calculate", fake_pipeline)
+    monkeypatch.setattr(jobs_router, "EVENTS_POLL_INTERVAL", 0.01)
+
+    app = FastAPI()
+    app.include_router(jobs_router.router, prefix="/v1")
+    app.state.job_queue = make_queue(workers=1)
+    with TestClient(app) as client:
+        client.portal.call(app.state.job_queue.start)
+        yield client
+        client.portal.call(app.state.job_queue.stop)
+
+
+REQUEST = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7}
+
+
+def test_submit_poll_and_stream(client):
+    response = client.post("/v1/jobs/full-calculate", json=REQUEST)
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    with client.stream("GET", f"/v1/jobs/{job_id}/events") as stream:
+        events = [
+            json.loads(line[len("data: "):])
+            for line in stream.iter_lines() if line.startswith("data: ")
+        ]
+
+    assert events[-1]["status"] == "succeeded"
+    assert events[-1]["result"]["success"] is True
+    assert client.get(f"/v1/jobs/{job_id}").json()["status"] == "succeeded"
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/v1/jobs/nope").status_code == 404
+    assert client.get("/v1/jobs/nope/events").status_code == 404
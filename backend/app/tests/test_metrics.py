@@ -0,0 +1,93 @@
+"""
+Tests for Prometheus metrics (app.metrics) and phase reporting through the compute pool.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+pytest.importorskip("prometheus_client")
+
+from astro_core.phases import phase, record_error
+from app import metrics, tasks
+from app.astro.scoring import PHASE_8_5_ERRORS
+from app.executor import ComputePool, ComputePoolConfig
+
+
+def phased_task():
+    with phase("test_phase"):
+        record_error("test_error")
+    return "done"
+
+
+@pytest.fixture
+def installed():
+    metrics.install()
+    yield
+    metrics.uninstall()
+
+
+def sample(name, **labels):
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_worker_phases_reach_the_api_process(installed):
+    before = (sample("starmeet_phase_duration_seconds_count", phase="test_phase"),
+              sample("starmeet_errors_total", kind="test_error"))
+    pool = ComputePool(ComputePoolConfig(workers=1))
+
+    async def main():
+        await pool.start()
+        try:
+            return await pool.run(phased_task)
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(main()) == "done"
+    assert sample("starmeet_phase_duration_seconds_count", phase="test_phase") == before[0] + 1
+    assert sample("starmeet_errors_total", kind="test_error") == before[1] + 1
+    assert pool.pending == 0
+
+
+def test_request_latency_by_route_template(installed):
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/v1/profiles/{profile_id}")
+    async def get_profile(profile_id: str):
+        return {"id": profile_id}
+
+    @app.get("/metrics")
+    async def prometheus_metrics():
+        return metrics.metrics_response(app)
+
+    client = TestClient(app)
+    labels = {"method": "GET", "route": "/v1/profiles/{profile_id}", "status": "200"}
+    before = sample("starmeet_request_duration_seconds_count", **labels)
+
+    client.get("/v1/profiles/a")
+    client.get("/v1/profiles/b")
+    client.get("/nowhere")
+    body = client.get("/metrics").text
+
+    assert sample("starmeet_request_duration_seconds_count", **labels) == before + 2
+    assert 'route="unmatched",status="404"' in body
+    assert 'starmeet_singleflight_inflight{flight="natal_core"}' in body
+
+
+def test_swallowed_phase_8_5_errors_are_reported():
+    def failing_layer():
+        PHASE_8_5_ERRORS["Sahama"] += 1   # As HouseScoreCalculator does when a layer raises
+        return {}
+
+    _, record = tasks.run_instrumented(failing_layer)
+
+    assert record.errors == ["house_layer.Sahama"]
@@ -0,0 +1,73 @@
+"""
+Tests for saved profile documents (/save, /profiles).
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend, packages and engine test helpers to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "astro_core" / "tests"))
+
+from conftest import VADIM_ASCENDANT, VADIM_LONGITUDES, build_chart
+from astro_core.engine import ChartContext, build_digital_twin
+
+from app import tasks
+from app.cache import CacheConfig, InMemoryCacheBackend, ResponseCache
+from app.etags import FileETags
+from app.routers import astro as astro_router
+
+INPUT = {"name": "Vadim", "date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7, "timezone": 3}
+
+
+def make_context(*args, **kwargs) -> ChartContext:
+    return ChartContext(chart=build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT), tz_offset_hours=3.0)
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+
+    def counting_context(*args, **kwargs):
+        calls.append(args)
+        return make_context()
+
+    monkeypatch.setattr(tasks, "build_chart_context", counting_context)
+    return calls
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, builds):
+    monkeypatch.setattr(astro_router, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(astro_router, "profile_etags", FileETags())
+
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+    app.state.response_cache = ResponseCache(CacheConfig(), InMemoryCacheBackend())
+    with TestClient(app) as client:
+        yield client
+
+
+def test_save_stores_the_base_twin(client):
+    saved = client.post("/v1/save", json={"input_data": INPUT, "chart_data": {"success": True}}).json()
+
+    stored = client.get(f"/v1/profiles/{saved['profile_id']}").json()["digital_twin"]
+    expected = build_digital_twin(make_context())
+    for twin in (stored, expected):
+        twin["meta"].pop("generated_at")
+
+    assert saved["success"]
+    assert stored == expected
+
+
+def test_save_shares_the_natal_core_with_calculate(client, builds):
+    client.post("/v1/calculate", json={"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7,
+                                       "timezone_override": 3, "ayanamsa": "lahiri"})
+    client.post("/v1/save", json={"input_data": {**INPUT, "ayanamsa": "lahiri"}, "chart_data": {"success": True}})
+
+    assert len(builds) == 1
@@ -0,0 +1,51 @@
+"""
+Tests for /quick-varga/batch against the single /quick-varga endpoint.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app.main import app
+from app.routers import astro
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_batch_matches_single_calls(client):
+    longitudes = [0.0, 15.0, 93.3333, 200.5, 359.99]
+    vargas = ["D1", "d9", "D30", "D60"]
+
+    body = client.post("/v1/quick-varga/batch", json={"longitudes": longitudes, "vargas": vargas}).json()
+
+    assert body["vargas"] == ["D1", "D9", "D30", "D60"]
+    for row, longitude in enumerate(longitudes):
+        for column, varga in enumerate(vargas):
+            single = client.post("/v1/quick-varga", json={"longitude": longitude, "varga": varga}).json()
+            assert body["signs"][body["matrix"][row][column]] == single["result_sign"]
+
+
+def test_batch_defaults_to_all_vargas(client):
+    body = client.post("/v1/quick-varga/batch", json={"longitudes": [100.0, 200.0]}).json()
+
+    assert body["vargas"] == astro.VARGA_CODES
+    assert len(body["matrix"]) == 2 and len(body["matrix"][0]) == len(astro.VARGA_CODES)
+
+
+def test_batch_limits(client, monkeypatch):
+    monkeypatch.setattr(astro, "QUICK_VARGA_BATCH_MAX_CELLS", 4)
+
+    too_large = client.post("/v1/quick-varga/batch", json={"longitudes": [1.0, 2.0, 3.0], "vargas": ["D1", "D9"]})
+    invalid = client.post("/v1/quick-varga/batch", json={"longitudes": [-1e-20], "vargas": ["D1"]})
+
+    assert too_large.status_code == 413
+    assert invalid.status_code == 422
@@ -0,0 +1,111 @@
+"""
+Tests for the unvalidated orjson response path and twin format negotiation (app.responses).
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from fastapi import HTTPException
+
+from app import responses
+from app.responses import (
+    COMPACT_JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    dumps,
+    engine_response,
+    negotiate_twin_format,
+    twin_response,
+)
+from astro_core.compact import decode_twin
+from app.routers.astro import CalculateResponse, DetectedTimezone, FullCalculatorResponse
+
+
+TZ_INFO = DetectedTimezone(timezone_name="Europe/Moscow", utc_offset=3.0, is_dst=False, source="auto")
+TWIN = {
+    "meta": {"as_of": date(2026, 1, 1)},
+    "houses": {1: "Aries", 2: "Taurus"},
+    "degrees": np.float64(12.5),
+    "aspects": {"Mars"},
+}
+
+
+def test_dumps_matches_json_for_engine_types():
+    assert json.loads(dumps(TWIN)) == {
+        "meta": {"as_of": "2026-01-01"},
+        "houses": {"1": "Aries", "2": "Taurus"},
+        "degrees": 12.5,
+        "aspects": ["Mars"],
+    }
+
+
+def test_engine_response_matches_validated_model():
+    response = engine_response(
+        CalculateResponse, success=True, detected_timezone=TZ_INFO, digital_twin={"houses": {"1": "Aries"}}
+    )
+    validated = CalculateResponse(success=True, detected_timezone=TZ_INFO, digital_twin={"houses": {"1": "Aries"}})
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == validated.model_dump(mode="json")
+
+
+def test_engine_response_fills_defaults():
+    response = engine_response(FullCalculatorResponse, success=False, error="boom")
+
+    assert json.loads(response.body) == {
+        "success": False,
+        "report_text": None,
+        "admin_data": None,
+        "generation_metrics": None,
+        "error": "boom",
+    }
+
+
+def test_engine_response_rejects_schema_drift():
+    with pytest.raises(TypeError, match="no field"):
+        engine_response(FullCalculatorResponse, success=True, extra=1)
+    with pytest.raises(TypeError, match="requires field"):
+        engine_response(CalculateResponse, success=True)
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, JSON_MEDIA_TYPE),
+    ("*/*", JSON_MEDIA_TYPE),
+    ("text/html, application/json", JSON_MEDIA_TYPE),
+    (COMPACT_JSON_MEDIA_TYPE, COMPACT_JSON_MEDIA_TYPE),
+    (f"application/json;q=0.5, {COMPACT_JSON_MEDIA_TYPE}", COMPACT_JSON_MEDIA_TYPE),
+    (f"{COMPACT_JSON_MEDIA_TYPE};q=0, application/json", JSON_MEDIA_TYPE),
+])
+def test_negotiate_twin_format(accept, expected):
+    assert negotiate_twin_format(accept) == expected
+
+
+def test_negotiate_msgpack_depends_on_optional_dependency(monkeypatch):
+    monkeypatch.setattr(responses, "msgpack", None)
+
+    assert negotiate_twin_format(f"application/msgpack, {COMPACT_JSON_MEDIA_TYPE};q=0.9") == COMPACT_JSON_MEDIA_TYPE
+    with pytest.raises(HTTPException) as excinfo:
+        negotiate_twin_format("application/x-msgpack")
+    assert excinfo.value.status_code == 406
+
+
+def test_twin_response_compact_round_trips():
+    twin = {"meta": {"ayanamsa": "Raman"}, "chara_karakas": {"karakas": []}}
+    response = twin_response(
+        CalculateResponse, COMPACT_JSON_MEDIA_TYPE,
+        success=True, detected_timezone=TZ_INFO, digital_twin=twin
+    )
+    body = json.loads(response.body)
+
+    assert response.media_type == COMPACT_JSON_MEDIA_TYPE
+    assert response.headers["vary"] == "Accept"
+    assert body["detected_timezone"]["timezone_name"] == "Europe/Moscow"
+    assert decode_twin(body["digital_twin"]) == twin
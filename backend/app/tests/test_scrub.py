@@ -0,0 +1,86 @@
+"""
+Tests for the /ws/scrub birth-time slider.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend, packages and engine test helpers to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages" / "astro_core" / "tests"))
+
+from conftest import VADIM_ASCENDANT, VADIM_LONGITUDES, build_chart
+from astro_core.engine import ChartContext
+
+from app import tasks
+from app.executor import ComputePool, ComputePoolConfig
+from app.routers import astro as astro_router
+
+# Interactive target: slider updates per second per session
+MIN_UPDATES_PER_SECOND = 20
+
+REQUEST = {"date": "1977-10-25", "time": "06:28", "lat": 61.7, "lon": 30.7, "timezone_override": 3.0}
+
+
+def make_context(*args, **kwargs) -> ChartContext:
+    return ChartContext(chart=build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT), tz_offset_hours=3.0)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # Patched before the pool forks, so workers build the synthetic chart too
+    monkeypatch.setattr(tasks, "build_chart_context", make_context)
+    pool = ComputePool(ComputePoolConfig(workers=1))
+    asyncio.run(pool.start())
+
+    app = FastAPI()
+    app.include_router(astro_router.router, prefix="/v1")
+    app.state.compute_pool = pool
+    yield app
+    pool.shutdown()
+
+
+def test_scrub_sends_base_then_diffs(app):
+    with TestClient(app).websocket_connect("/v1/ws/scrub") as ws:
+        ws.send_json(REQUEST)
+        base = ws.receive_json()
+        ws.send_json({"time": "07:13"})
+        update = ws.receive_json()
+
+    assert base["type"] == "base"
+    assert base["detected_timezone"]["source"] == "override"
+    assert update["type"] == "diff" and update["time"] == "1977-10-25T07:13:00"
+    assert update["diff"]["vargas"]["D1"]["ascendant"] == ["Virgo", "Libra"]
+    assert update["positions"]["ascendant"]["sign_name"] == "Libra"
+
+
+def test_scrub_rejects_invalid_time(app):
+    with TestClient(app).websocket_connect("/v1/ws/scrub") as ws:
+        ws.send_json(REQUEST)
+        ws.receive_json()
+        ws.send_json({"time": "25:99"})
+
+        assert ws.receive_json()["type"] == "error"
+
+
+def test_scrub_meets_interactive_rate(app):
+    times = [f"{6 + (28 + i) // 60:02d}:{(28 + i) % 60:02d}" for i in range(1, 41)]
+
+    with TestClient(app).websocket_connect("/v1/ws/scrub") as ws:
+        ws.send_json(REQUEST)
+        ws.receive_json()
+
+        start = time.perf_counter()
+        for time_str in times:
+            ws.send_json({"time": time_str})
+            assert ws.receive_json()["type"] == "diff"
+        elapsed = time.perf_counter() - start
+
+    assert len(times) / elapsed >= MIN_UPDATES_PER_SECOND
@@ -0,0 +1,91 @@
+"""
+Tests for singleflight coalescing (app.singleflight).
+"""
+
+import asyncio
+from pathlib import Path
+
+# Add backend to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", compute) for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats.to_dict() == {"executed": 1, "coalesced": 4, "coalesce_rate": 0.8}
+    assert flight.inflight == 0
+
+
+def test_different_keys_and_sequential_calls_execute_separately():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return len(calls)
+
+    async def main():
+        await asyncio.gather(flight.do("a", compute), flight.do("b", compute))
+        await flight.do("a", compute)
+
+    asyncio.run(main())
+
+    assert len(calls) == 3
+    assert flight.stats.coalesced == 0
+
+
+def test_exception_reaches_every_waiter():
+    flight = SingleFlight("test")
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do("key", compute) for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats.executed == 1
+    assert flight.inflight == 0
+
+
+def test_cancelled_caller_does_not_cancel_shared_computation():
+    flight = SingleFlight("test")
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("key", compute))
+        second = asyncio.ensure_future(flight.do("key", compute))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    result, first_cancelled = asyncio.run(main())
+
+    assert result == "done"
+    assert first_cancelled
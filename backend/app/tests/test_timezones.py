@@ -0,0 +1,142 @@
+"""
+Tests for the memoized timezone resolver (app.timezones) and the endpoints using it.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app.timezones import ResolvedTimezone, TimezoneResolver, parse_local_datetimes, timezone_resolver
+
+pytestmark = pytest.mark.skipif(not timezone_resolver.available, reason="timezonefinder/pytz not installed")
+
+
+class CountingFinder:
+    """timezonefinder stand-in counting polygon lookups."""
+
+    def __init__(self, tz_name="Europe/Moscow"):
+        self.tz_name = tz_name
+        self.lookups = []
+
+    def timezone_at(self, lat, lng):
+        self.lookups.append((lat, lng))
+        return self.tz_name
+
+
+def test_resolves_historical_dst():
+    resolver = TimezoneResolver()
+
+    tz = resolver.resolve(59.9343, 30.3351, "1982-05-30", "14:30")
+
+    assert tz == ResolvedTimezone("Europe/Moscow", 4.0, True, 1.0)
+
+
+def test_nearby_coordinates_share_a_lookup():
+    finder = CountingFinder()
+    resolver = TimezoneResolver(precision=2, finder=finder)
+
+    first = resolver.resolve(55.7512, 37.6184, "1990-01-15", "08:00")
+    second = resolver.resolve(55.7508, 37.6176, "1990-01-15", "08:00")
+
+    assert first == second
+    assert finder.lookups == [(55.75, 37.62)]
+    stats = resolver.stats()
+    assert stats["tz_name"]["hits"] == 1 and stats["tz_name"]["misses"] == 1
+    assert stats["offset"]["hits"] == 1 and stats["offset"]["hit_rate"] == 0.5
+
+
+@pytest.mark.parametrize("finder, date_str, time_str, expected_offset", [
+    (CountingFinder(tz_name=None), "1990-01-15", "08:00", 2.0),               # Ocean
+    (CountingFinder(tz_name="America/New_York"), "2021-11-07", "01:30", 2.0),  # Ambiguous local time
+    (None, "1990-01-15", "08:00", 2.0),                                        # timezonefinder missing
+])
+def test_geographic_fallback(finder, date_str, time_str, expected_offset):
+    resolver = TimezoneResolver(finder=finder)
+
+    tz = resolver.resolve(40.0, 30.0, date_str, time_str)
+
+    assert tz == ResolvedTimezone("UTC", expected_offset, False, 0.0)
+
+
+def test_malformed_time_uses_midnight():
+    resolver = TimezoneResolver(finder=CountingFinder(tz_name="Europe/London"))
+
+    assert resolver.resolve(51.5, -0.1, "1990-07-01", "noon").utc_offset == 1.0
+
+
+def test_endpoints_share_the_resolver(monkeypatch):
+    from app.main import app
+    from app.routers.astro import _detect_timezone
+
+    resolver = TimezoneResolver()
+    monkeypatch.setattr("app.routers.astro.timezone_resolver", resolver)
+    monkeypatch.setattr("app.main.timezone_resolver", resolver)
+    client = TestClient(app)
+
+    body = client.post("/v1/timezone", json={
+        "lat": 59.9343, "lon": 30.3351, "date": "1982-05-30", "time": "14:30"
+    }).json()
+
+    assert body == {"timezone_name": "Europe/Moscow", "utc_offset": 4.0, "is_dst": True, "dst_offset": 1.0}
+    assert _detect_timezone(59.9343, 30.3351, "1982-05-30", "14:30") == ("Europe/Moscow", 4.0, True)
+    assert client.get("/health").json()["timezone_cache"]["tz_name"] == {
+        "hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1
+    }
+
+
+BULK_ROWS = [
+    (59.9343, 30.3351, "1982-05-30", "14:30"),    # USSR summer time (UTC+4)
+    (59.9343, 30.3351, "1982-12-30", "14:30"),
+    (40.7128, -74.0060, "2021-11-07", "01:30"),   # Ambiguous: fallback
+    (40.7128, -74.0060, "2021-03-14", "02:30"),   # Skipped: fallback
+    (40.7128, -74.0060, "1944-07-01", "12:00"),   # War time
+    (28.6139, 77.2090, "1950-01-01", "7:05"),     # Non-strict time, parsed row by row
+    (51.5074, -0.1278, "1990-07-01", "noon"),     # Malformed time: midnight
+    (51.5074, -0.1278, "1982-02-30", "10:00"),    # Invalid date: fallback
+    (0.0, -30.0, "2000-01-01", "12:00"),          # Ocean (Etc/GMT+2)
+    (-33.8688, 151.2093, "1995-01-15", "03:00"),
+    (-33.8688, 151.2093, "0001-01-01", "00:00"),  # Out of pytz's range: fallback
+]
+
+
+def test_resolve_many_matches_resolve():
+    resolver = TimezoneResolver()
+    lats, lons, dates, times = zip(*BULK_ROWS)
+
+    bulk = resolver.resolve_many(lats, lons, parse_local_datetimes(dates, times))
+
+    assert [bulk.row(i) for i in range(len(bulk))] == [resolver.resolve(*row) for row in BULK_ROWS]
+    assert bulk.row(0) == ResolvedTimezone("Europe/Moscow", 4.0, True, 1.0)
+
+
+def test_resolve_many_looks_up_each_place_once():
+    finder = CountingFinder()
+    resolver = TimezoneResolver(finder=finder)
+
+    bulk = resolver.resolve_many([55.75] * 3 + [59.93], [37.62] * 3 + [30.34], ["1990-01-15T08:00"] * 4)
+
+    assert len(finder.lookups) == 2
+    assert bulk.utc_offset.tolist() == [3.0] * 4
+
+
+def test_timezone_batch_endpoint():
+    from app.main import app
+    client = TestClient(app)
+    lats, lons, dates, times = zip(*BULK_ROWS[:3])
+
+    body = client.post("/v1/timezone/batch", json={
+        "lat": lats, "lon": lons, "date": dates, "time": times
+    }).json()
+
+    assert body["timezone_name"] == ["Europe/Moscow", "Europe/Moscow", "UTC"]
+    assert body["utc_offset"] == [4.0, 3.0, -5.0]
+    assert body["is_dst"] == [True, False, False]
+
+    mismatched = client.post("/v1/timezone/batch", json={"lat": [1.0], "lon": [], "date": ["2000-01-01"]})
+    assert mismatched.status_code == 422
@@ -0,0 +1,61 @@
+"""
+Tests for the Server-Timing header (app.timing).
+"""
+
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from astro_core.phases import PhaseRecord, phase, remove_observers, replay
+from app import timing
+from app.timing import ServerTimingMiddleware, format_server_timing
+
+
+def make_app(enabled: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware, enabled=enabled)
+
+    @app.get("/chart")
+    def chart():
+        with phase("timezone"):
+            pass
+        # Phases measured in a compute pool worker
+        replay(PhaseRecord(phases=[("ephemeris", 0.0123), ("astrobrain.yogas", 0.001), ("astrobrain.yogas", 0.002)]))
+        return {"ok": True}
+
+    return app
+
+
+def teardown_function():
+    remove_observers(timing._observe_phase)
+
+
+def test_format_server_timing():
+    value = format_server_timing({"ephemeris": [0.0123, 1], "astrobrain.yogas": [0.003, 2]}, 0.05)
+
+    assert value == 'ephemeris;dur=12.3, astrobrain.yogas;dur=3.0;desc="x2", total;dur=50.0'
+
+
+def test_header_lists_request_phases():
+    client = TestClient(make_app(enabled=True))
+
+    header = client.get("/chart").headers["server-timing"]
+    names = [metric.split(";")[0] for metric in header.split(", ")]
+
+    assert names == ["timezone", "ephemeris", "astrobrain.yogas", "total"]
+    assert "ephemeris;dur=12.3" in header and 'desc="x2"' in header
+    # Timings are per request
+    assert client.get("/chart").headers["server-timing"].count("ephemeris") == 1
+
+
+def test_disabled_middleware_adds_nothing():
+    response = TestClient(make_app(enabled=False)).get("/chart")
+
+    assert response.json() == {"ok": True}
+    assert "server-timing" not in response.headers
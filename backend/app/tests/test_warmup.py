@@ -0,0 +1,78 @@
+"""
+Tests for the startup warm-up and /ready (app.warmup).
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend and packages to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "packages"))
+
+from app import tasks
+from app.main import app as main_app
+from app.warmup import WarmupState, warm_up, warm_up_process
+
+
+def run_warm_up() -> WarmupState:
+    app = FastAPI()
+    app.state.warmup = WarmupState()
+    asyncio.run(warm_up(app))
+    return app.state.warmup
+
+
+def test_warm_up_runs_reference_chart(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tasks, "reference_chart_task", lambda: calls.append(1) or 0.1)
+
+    state = run_warm_up()
+
+    assert calls == [1]
+    assert state.ready and state.duration is not None and state.error is None
+
+
+def test_failed_warm_up_stays_not_ready(monkeypatch):
+    def broken():
+        raise FileNotFoundError("seas_18.se1")
+
+    monkeypatch.setattr(tasks, "reference_chart_task", broken)
+
+    state = run_warm_up()
+
+    assert state.status == "failed" and not state.ready
+    assert state.error == "FileNotFoundError: seas_18.se1"
+
+
+def test_warm_up_process_runs_reference_chart(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tasks, "reference_chart_task", lambda: calls.append(1) or 0.1)
+
+    assert warm_up_process() >= 0
+    assert calls == [1]
+
+
+@pytest.fixture
+def client():
+    yield TestClient(main_app)
+    main_app.state.warmup = None
+
+
+@pytest.mark.parametrize("state, status_code", [
+    (None, 503),
+    (WarmupState(), 503),
+    (WarmupState(status="failed", error="boom"), 503),
+    (WarmupState(status="ready", duration=1.5), 200),
+])
+def test_ready_endpoint(client, state, status_code):
+    main_app.state.warmup = state
+
+    response = client.get("/ready")
+
+    assert response.status_code == status_code
+    assert response.json()["status"] == (state.status if state else "pending")
+    assert client.get("/health").status_code == 200
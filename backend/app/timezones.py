@@ -0,0 +1,345 @@
+"""
+StarMeet API - Timezone Resolution
+
+Historical UTC offset for a birth place and local time, shared by chart
+endpoints (_detect_timezone in app.routers.astro) and POST /timezone.
+
+Resolving takes a timezonefinder polygon lookup and a pytz localize, but
+most users are born in a handful of cities, so both steps are memoized:
+
+    coordinates (rounded to TZ_COORD_PRECISION decimals) -> tz name
+    (tz name, local datetime)                            -> UTC offset, DST
+
+Without timezonefinder/pytz, for unknown areas (oceans) and for local times
+pytz rejects (ambiguous or skipped at a DST change), the offset falls back
+to round(lon / 15) with the name "UTC". Cache hit rates are reported by
+/health and /metrics (per worker process).
+
+Imports and backfills resolve whole columns with resolve_many(): each
+distinct coordinate is looked up once, rows are grouped by zone and offsets
+come from the zone's pytz transition table (numpy.searchsorted, following
+pytz's localize rules) instead of a localize() per row. Results are
+identical to resolve() row by row, fallbacks included.
+
+Configuration (environment):
+    TZ_COORD_PRECISION     Decimals coordinates are rounded to (default: 4, ~11 m)
+    TZ_COORD_CACHE_SIZE    Cached coordinate lookups (default: 4096)
+    TZ_OFFSET_CACHE_SIZE   Cached (tz name, datetime) offsets (default: 16384)
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Timezone detection
+try:
+    from timezonefinder import TimezoneFinder
+    import pytz
+    TZ_FINDER = TimezoneFinder()
+except ImportError:
+    TZ_FINDER = None
+    pytz = None
+
+logger = logging.getLogger(__name__)
+
+_DAY_US = 86_400_000_000
+# Local datetimes pytz can localize: it looks one day either side
+_MIN_LOCAL_US = int(np.datetime64(datetime.min, "us").astype(np.int64)) + _DAY_US
+_MAX_LOCAL_US = int(np.datetime64(datetime.max, "us").astype(np.int64)) - _DAY_US
+
+# Strings numpy parses exactly as parse_local_datetime() does (year 0 excepted)
+_STRICT_DATE = re.compile(r"(?!0000)\d{4}-\d{2}-\d{2}")
+_STRICT_TIME = re.compile(r"\d{2}:\d{2}")
+_PARSE_BLOCK = 1024
+
+
+@dataclass(frozen=True)
+class ResolvedTimezone:
+    """Timezone in effect at a place and local time."""
+    tz_name: str
+    utc_offset: float       # Hours
+    is_dst: bool
+    dst_offset: float       # Hours of DST included in utc_offset
+
+
+def geographic_fallback(lon: float) -> ResolvedTimezone:
+    """Nautical timezone of a longitude, used when no IANA zone can be resolved."""
+    return ResolvedTimezone("UTC", float(round(lon / 15)), False, 0.0)
+
+
+def parse_local_datetime(date_str: str, time_str: str) -> datetime:
+    """Naive local datetime from YYYY-MM-DD and HH:MM (midnight if the time is malformed)."""
+    try:
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def parse_local_datetimes(dates: Sequence[str], times: Sequence[str]) -> np.ndarray:
+    """
+    parse_local_datetime() over columns, as datetime64[us] with NaT where it
+    would raise. Well-formed rows are parsed by numpy in one go.
+    """
+    count = len(dates)
+    parsed = np.full(count, np.datetime64("NaT"), dtype="datetime64[us]")
+    strict = np.fromiter(
+        (bool(_STRICT_DATE.fullmatch(d) and _STRICT_TIME.fullmatch(t)) for d, t in zip(dates, times)),
+        dtype=bool, count=count
+    )
+    strict_rows = np.flatnonzero(strict)
+    for start in range(0, len(strict_rows), _PARSE_BLOCK):
+        rows = strict_rows[start:start + _PARSE_BLOCK]
+        try:
+            parsed[rows] = np.array([f"{dates[i]}T{times[i]}" for i in rows], dtype="datetime64[us]")
+        except ValueError:
+            # Out-of-range fields (e.g. 1982-02-30): parse this block row by row
+            strict[rows] = False
+
+    for i in np.flatnonzero(~strict):
+        try:
+            parsed[i] = parse_local_datetime(dates[i], times[i])
+        except ValueError:
+            pass
+    return parsed
+
+
+@lru_cache(maxsize=None)
+def _transition_table(tz_name: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    pytz transitions of a zone as arrays: (UTC transition times in µs,
+    UTC offsets in µs, UTC offsets in hours, DST offsets in hours).
+    None for zones with a fixed offset.
+    """
+    tz = pytz.timezone(tz_name)
+    if not hasattr(tz, "_utc_transition_times"):
+        return None
+    transitions = np.array(tz._utc_transition_times, dtype="datetime64[us]").astype(np.int64)
+    offsets = np.array([utcoffset for utcoffset, _, _ in tz._transition_info], dtype="timedelta64[us]")
+    return (
+        transitions,
+        offsets.astype(np.int64),
+        np.array([utcoffset.total_seconds() for utcoffset, _, _ in tz._transition_info]) / 3600,
+        np.array([dst.total_seconds() for _, dst, _ in tz._transition_info]) / 3600,
+    )
+
+
+def _localize_many(transitions: np.ndarray, offsets: np.ndarray, local_us: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    pytz DstTzInfo.localize(dt, is_dst=None) over an array of local times.
+
+    Returns:
+        (transition index in effect, mask of rows localize() accepts: not
+        skipped or ambiguous at a DST change)
+    """
+    def candidate(shift: int) -> Tuple[np.ndarray, np.ndarray]:
+        # The offset in effect a day before/after, checked by normalizing
+        guess = np.maximum(np.searchsorted(transitions, local_us + shift, side="right") - 1, 0)
+        offset = offsets[guess]
+        index = np.maximum(np.searchsorted(transitions, local_us - offset, side="right") - 1, 0)
+        return index, offsets[index] == offset
+
+    before, before_valid = candidate(-_DAY_US)
+    after, after_valid = candidate(_DAY_US)
+    ambiguous = before_valid & after_valid & (offsets[before] != offsets[after])
+    return np.where(before_valid, before, after), (before_valid | after_valid) & ~ambiguous
+
+
+@dataclass
+class BulkTimezones:
+    """resolve_many() result: one entry per input row."""
+    tz_name: np.ndarray        # object (str)
+    utc_offset: np.ndarray     # float64 hours
+    is_dst: np.ndarray         # bool
+    dst_offset: np.ndarray     # float64 hours
+
+    def __len__(self) -> int:
+        return len(self.tz_name)
+
+    def row(self, i: int) -> ResolvedTimezone:
+        return ResolvedTimezone(
+            str(self.tz_name[i]), float(self.utc_offset[i]), bool(self.is_dst[i]), float(self.dst_offset[i])
+        )
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Columns as lists, in the field names of TimezoneResponse."""
+        return {
+            "timezone_name": self.tz_name.tolist(),
+            "utc_offset": self.utc_offset.tolist(),
+            "is_dst": self.is_dst.tolist(),
+            "dst_offset": self.dst_offset.tolist(),
+        }
+
+
+def _cache_stats(cache: Any) -> Dict[str, Any]:
+    info = cache.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else None,
+        "size": info.currsize,
+    }
+
+
+class TimezoneResolver:
+    """
+    Memoized timezone resolution.
+
+    Usage:
+        resolver = TimezoneResolver()
+        tz = resolver.resolve(59.9343, 30.3351, "1982-05-30", "14:30")
+        tz.tz_name, tz.utc_offset   # ("Europe/Moscow", 4.0)
+    """
+
+    def __init__(
+        self,
+        precision: int = 4,
+        coord_cache_size: int = 4096,
+        offset_cache_size: int = 16384,
+        finder: Optional[Any] = TZ_FINDER,
+    ):
+        self.precision = precision
+        self.finder = finder
+        self._tz_name = lru_cache(maxsize=coord_cache_size)(self._lookup_tz_name)
+        self._offset = lru_cache(maxsize=offset_cache_size)(self._localize)
+
+    @classmethod
+    def from_env(cls) -> "TimezoneResolver":
+        """Resolver configured from TZ_* environment variables."""
+        return cls(
+            precision=int(os.getenv("TZ_COORD_PRECISION", 4)),
+            coord_cache_size=int(os.getenv("TZ_COORD_CACHE_SIZE", 4096)),
+            offset_cache_size=int(os.getenv("TZ_OFFSET_CACHE_SIZE", 16384)),
+        )
+
+    @property
+    def available(self) -> bool:
+        """Whether timezonefinder and pytz are installed."""
+        return self.finder is not None and pytz is not None
+
+    def _lookup_tz_name(self, lat: float, lon: float) -> Optional[str]:
+        return self.finder.timezone_at(lat=lat, lng=lon)
+
+    @staticmethod
+    def _localize(tz_name: str, naive_dt: datetime) -> Tuple[float, float]:
+        local_dt = pytz.timezone(tz_name).localize(naive_dt, is_dst=None)
+        dst = local_dt.dst()
+        return local_dt.utcoffset().total_seconds() / 3600, dst.total_seconds() / 3600 if dst else 0.0
+
+    def tz_name(self, lat: float, lon: float) -> Optional[str]:
+        """IANA timezone name at coordinates, None for unknown areas."""
+        return self._tz_name(round(lat, self.precision), round(lon, self.precision))
+
+    def offset(self, tz_name: str, naive_dt: datetime) -> Tuple[float, float]:
+        """
+        (UTC offset, DST offset) in hours of a local time in tz_name.
+
+        Raises:
+            pytz.exceptions.InvalidTimeError: For local times that are
+                ambiguous or do not exist because of a DST change
+        """
+        return self._offset(tz_name, naive_dt)
+
+    def resolve(self, lat: float, lon: float, date_str: str, time_str: str) -> ResolvedTimezone:
+        """Timezone in effect at coordinates and local date/time, with the geographic fallback."""
+        if not self.available:
+            return geographic_fallback(lon)
+
+        try:
+            tz_name = self.tz_name(lat, lon)
+            if not tz_name:
+                return geographic_fallback(lon)
+            utc_offset, dst_offset = self.offset(tz_name, parse_local_datetime(date_str, time_str))
+        except Exception:
+            logger.debug("Timezone resolution failed for (%s, %s) %s %s", lat, lon, date_str, time_str, exc_info=True)
+            return geographic_fallback(lon)
+
+        return ResolvedTimezone(tz_name, utc_offset, dst_offset > 0, dst_offset)
+
+    def _zone_at(self, lat: float, lon: float) -> Optional[str]:
+        try:
+            return self._lookup_tz_name(lat, lon)
+        except Exception:
+            return None
+
+    def resolve_many(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        local_datetimes: Sequence[Any],
+    ) -> BulkTimezones:
+        """
+        resolve() over columns of coordinates and naive local datetimes
+        (anything numpy converts to datetime64; NaT rows get the fallback).
+
+        Distinct coordinates are looked up once, bypassing the LRU so a
+        backfill does not evict the hot entries of live traffic.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        local_us = np.asarray(local_datetimes, dtype="datetime64[us]").astype(np.int64)
+        count = len(lats)
+        if not (len(lons) == len(local_us) == count):
+            raise ValueError("lats, lons and local_datetimes must have the same length")
+
+        # Start from the fallback and fill in the rows that resolve
+        tz_names = np.full(count, "UTC", dtype=object)
+        utc_offset = np.rint(lons / 15) + 0.0   # + 0.0: no -0.0, as float(round(lon / 15))
+        dst_offset = np.zeros(count)
+        if not self.available or count == 0:
+            return BulkTimezones(tz_names, utc_offset, dst_offset > 0, dst_offset)
+
+        coords, coord_of_row = np.unique(np.stack([lats, lons], axis=1), axis=0, return_inverse=True)
+        zone_cache: Dict[Tuple[float, float], Optional[str]] = {}
+        coord_zones = []
+        for lat, lon in coords:
+            key = (round(lat, self.precision), round(lon, self.precision))
+            if key not in zone_cache:
+                zone_cache[key] = self._zone_at(*key)
+            coord_zones.append(zone_cache[key])
+        zones, zone_of_coord = np.unique(np.array([z or "" for z in coord_zones], dtype=object), return_inverse=True)
+        zone_of_row = zone_of_coord[coord_of_row.ravel()]
+
+        parsed = local_us != np.datetime64("NaT").astype(np.int64)
+        in_range = (local_us >= _MIN_LOCAL_US) & (local_us <= _MAX_LOCAL_US)   # NaT is below the range
+        order = np.argsort(zone_of_row, kind="stable")
+        starts = np.searchsorted(zone_of_row[order], np.arange(len(zones)))
+        for zone, rows in zip(zones, np.split(order, starts[1:])):
+            if not zone:
+                continue
+            try:
+                table = _transition_table(zone)
+                if table is None:
+                    resolved = rows[parsed[rows]]
+                    utc_offset[resolved], dst_offset[resolved] = self.offset(zone, datetime(2000, 1, 1))
+                else:
+                    transitions, offsets_us, offsets_hours, dst_hours = table
+                    rows = rows[in_range[rows]]
+                    index, valid = _localize_many(transitions, offsets_us, local_us[rows])
+                    resolved, index = rows[valid], index[valid]
+                    utc_offset[resolved], dst_offset[resolved] = offsets_hours[index], dst_hours[index]
+            except Exception:
+                logger.debug("Bulk timezone resolution failed for %s", zone, exc_info=True)
+                continue
+            tz_names[resolved] = zone
+
+        return BulkTimezones(tz_names, utc_offset, dst_offset > 0, dst_offset)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters since startup, for /health."""
+        return {"tz_name": _cache_stats(self._tz_name), "offset": _cache_stats(self._offset)}
+
+    def clear(self) -> None:
+        """Empty both caches."""
+        self._tz_name.cache_clear()
+        self._offset.cache_clear()
+
+
+# Shared by every endpoint of the process
+timezone_resolver = TimezoneResolver.from_env()
@@ -0,0 +1,88 @@
+"""
+StarMeet API - Server-Timing
+
+Adds a Server-Timing header with the request's pipeline phases, so browser
+devtools and load-test tooling can attribute latency per request without a
+metrics backend:
+
+    Server-Timing: timezone;dur=0.4, ephemeris;dur=38.2, twin_generation;dur=61.0,
+                   dasha;dur=9.7, serialization;dur=1.3, total;dur=104.9
+
+Phases come from astro_core.phases (the same marks that feed /metrics), so
+work done in compute pool workers is included once it is replayed in the
+request (app.executor). Repeated phases are summed, with their count in desc.
+Durations are in milliseconds and only cover work before the response
+headers are sent: streamed bodies report their first byte.
+
+Configuration (environment):
+    SERVER_TIMING    Set to 0/false to disable (default: enabled). Disabled,
+                     the middleware passes requests straight through.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Import the Golden Math engine
+import sys
+sys.path.insert(0, '/app/packages')
+from astro_core.phases import add_observers
+
+# Phase name -> [total seconds, count] for the current request
+_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("server_timings", default=None)
+
+
+def _observe_phase(name: str, seconds: float) -> None:
+    timings = _timings.get()
+    if timings is not None:
+        entry = timings.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def format_server_timing(timings: Dict[str, List[float]], total: float) -> str:
+    """Server-Timing header value for phase timings and the total (seconds)."""
+    metrics = []
+    for name, (seconds, count) in timings.items():
+        metric = f"{name};dur={seconds * 1000:.1f}"
+        if count > 1:
+            metric += f';desc="x{count}"'
+        metrics.append(metric)
+    metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware collecting the request's phases into a Server-Timing header."""
+
+    def __init__(self, app: ASGIApp, enabled: Optional[bool] = None):
+        self.app = app
+        if enabled is None:
+            enabled = os.getenv("SERVER_TIMING", "true").lower() not in ("0", "false", "no")
+        self.enabled = enabled
+        if enabled:
+            add_observers(_observe_phase)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, List[float]] = {}
+        token = _timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
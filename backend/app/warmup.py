@@ -0,0 +1,111 @@
+"""
+StarMeet API - Warm-up and Readiness
+
+After a deploy the first requests would otherwise pay for loading the Swiss
+Ephemeris and jyotishganit data, timezonefinder's tables and first-touch
+imports. The lifespan handler (app.main) starts warm_up() in the background:
+it resolves the reference chart's timezone in the API process and runs the
+reference chart through the whole pipeline once in every compute worker
+(tasks.reference_chart_task).
+
+GET /ready answers 503 until warm-up has finished, so the Docker healthcheck
+and nginx only send traffic to warm instances; GET /health stays a plain
+liveness check. A failed warm-up keeps the instance not-ready (the chart
+pipeline is broken, e.g. ephemeris files are missing) and is reported by /ready.
+
+Under the pre-fork runner (gunicorn.conf.py) the master process runs
+warm_up_process() once before forking, so the data is loaded a single time
+and shared copy-on-write; each worker's own warm-up then only touches it.
+
+Configuration (environment):
+    WARMUP    Set to 0/false to skip warm-up and be ready at once (default: enabled)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from app import tasks
+from app.executor import run_compute
+from app.timezones import timezone_resolver
+
+logger = logging.getLogger(__name__)
+
+# Warm-up lifecycle
+STATUS_PENDING = "pending"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up (app.state.warmup)."""
+    status: str = STATUS_PENDING
+    duration: Optional[float] = None    # Seconds, once finished
+    error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == STATUS_READY
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "warmup_seconds": round(self.duration, 3) if self.duration is not None else None,
+            "error": self.error,
+        }
+
+
+def warmup_enabled() -> bool:
+    """Whether WARMUP allows the warm-up to run."""
+    return os.getenv("WARMUP", "true").lower() not in ("0", "false", "no")
+
+
+def _warm_timezones() -> None:
+    birth_datetime, lat, lon, _, _ = tasks.REFERENCE_CHART
+    timezone_resolver.resolve(lat, lon, f"{birth_datetime:%Y-%m-%d}", f"{birth_datetime:%H:%M}")
+
+
+def warm_up_process() -> float:
+    """
+    Warm the current process synchronously: timezone data, then the reference
+    chart through the whole pipeline. Used by the pre-fork master.
+
+    Returns:
+        Seconds taken
+
+    Raises:
+        Exception: Whatever the reference chart raised
+    """
+    start = time.perf_counter()
+    _warm_timezones()
+    tasks.reference_chart_task()
+    return time.perf_counter() - start
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Warm the API process and every compute worker, updating app.state.warmup."""
+    state: WarmupState = app.state.warmup
+    start = time.perf_counter()
+    try:
+        await run_in_threadpool(_warm_timezones)
+
+        # One reference chart per worker; submitted together while every
+        # worker is idle, they are spread across the workers
+        pool = getattr(app.state, "compute_pool", None)
+        workers = pool.config.workers if pool is not None else 1
+        await asyncio.gather(*(run_compute(app, tasks.reference_chart_task) for _ in range(workers)))
+
+        state.status = STATUS_READY
+    except Exception as e:
+        logger.exception("Warm-up failed")
+        state.status = STATUS_FAILED
+        state.error = f"{type(e).__name__}: {e}"
+    state.duration = time.perf_counter() - start
+    print(f"Warm-up {state.status} in {state.duration:.1f}s")
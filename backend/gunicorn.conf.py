@@ -0,0 +1,123 @@
+"""
+StarMeet API - Production Runner (gunicorn)
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Pre-fork runner that uses every core without multiplying resident memory.
+The master imports the app (preload_app), runs the reference chart once
+(app.warmup.warm_up_process) so the Swiss Ephemeris and jyotishganit data,
+timezonefinder's tables and the engine's reference tables are loaded, then
+freezes the garbage collector's view of those objects and forks the
+workers. Workers share that memory copy-on-write: gc.freeze() keeps the
+collector from touching (and so copying) pages it would otherwise scan.
+
+Each worker runs its own lifespan (compute pool, cache, job queue, warm-up).
+Its compute pool processes are forked from the worker and share the same
+pages, so COMPUTE_WORKERS defaults to 1 here: parallelism comes from the
+API workers.
+
+Workers are recycled when the private memory (pages no longer shared with
+the master) of the worker and its compute processes exceeds
+WORKER_MAX_MEMORY_MB, and after MAX_REQUESTS requests (with jitter, so they
+do not all restart at once). The master replaces them with fresh forks.
+The defaults keep the master (~150 MB shared) plus four workers under the
+container's 512 MB limit.
+
+Configuration (environment):
+    PORT                          Listen port (default: 8000)
+    WEB_CONCURRENCY               API worker processes (default: CPU count, max 4)
+    WORKER_MAX_MEMORY_MB          Recycle a worker above this private memory, 0 = off (default: 96)
+    WORKER_MEMORY_CHECK_INTERVAL  Seconds between memory checks (default: 30)
+    MAX_REQUESTS                  Recycle a worker after this many requests, 0 = off (default: 5000)
+    MAX_REQUESTS_JITTER           Random extra requests per worker (default: 500)
+    COMPUTE_WORKERS               Compute pool processes per API worker (default here: 1)
+"""
+
+import gc
+import os
+import signal
+import threading
+
+# Settings read by app.executor when the master imports the app (preload_app)
+os.environ.setdefault("COMPUTE_WORKERS", "1")
+
+# No collections in the master while the app is loaded: objects stay where
+# they are allocated until when_ready() freezes them
+gc.disable()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+max_requests = int(os.getenv("MAX_REQUESTS", 5000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 500))
+
+# Seconds a worker's event loop may go without a heartbeat before it is killed
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+
+MAX_MEMORY_MB = float(os.getenv("WORKER_MAX_MEMORY_MB", 96))
+MEMORY_CHECK_INTERVAL = float(os.getenv("WORKER_MEMORY_CHECK_INTERVAL", 30))
+
+
+def private_memory_mb(pid: int) -> float:
+    """Private (unshared) memory of a process in MB, 0 if it is gone."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            kb = sum(int(line.split()[1]) for line in f if line.startswith(("Private_Clean:", "Private_Dirty:")))
+    except (OSError, ValueError):
+        return 0.0
+    return kb / 1024
+
+
+def child_pids(pid: int) -> list:
+    """Pids whose parent is pid (the worker's compute pool processes)."""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Field 4 is the parent pid; the command name (field 2) may contain spaces
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return children
+
+
+def _watch_memory(worker) -> None:
+    """Ask the worker to shut down gracefully once it outgrows MAX_MEMORY_MB."""
+    pid = os.getpid()
+    stop = threading.Event()
+    while not stop.wait(MEMORY_CHECK_INTERVAL):
+        used = private_memory_mb(pid) + sum(private_memory_mb(child) for child in child_pids(pid))
+        if used > MAX_MEMORY_MB:
+            worker.log.warning(
+                "Worker %s private memory %.0f MB exceeds %.0f MB, recycling", pid, used, MAX_MEMORY_MB
+            )
+            os.kill(pid, signal.SIGTERM)
+            return
+
+
+def when_ready(server) -> None:
+    from app.warmup import warm_up_process, warmup_enabled
+
+    if warmup_enabled():
+        try:
+            server.log.info("Master warm-up finished in %.1fs", warm_up_process())
+        except Exception:
+            # Workers run their own warm-up and report the failure on /ready
+            server.log.exception("Master warm-up failed")
+    gc.freeze()
+    gc.enable()
+
+
+def post_fork(server, worker) -> None:
+    if MAX_MEMORY_MB > 0 and os.path.exists("/proc/self/smaps_rollup"):
+        threading.Thread(target=_watch_memory, args=(worker,), name="memory-watchdog", daemon=True).start()
@@ -0,0 +1,247 @@
+"""
+AstroCore Batch - Shared-Memory Process Pool
+============================================
+Bulk computation of D1 positions and varga signs for many births.
+
+Births are sharded across a process pool. Each worker attaches to
+multiprocessing.shared_memory blocks owned by the parent and writes its rows
+straight into NumPy views, so results are never pickled back. Only per-row
+error messages travel through the pool.
+
+Positions come from Swiss Ephemeris directly (sidereal mode, mean nodes,
+whole-sign ascendant), matching AstroCore.calculate to within the ephemeris
+difference (arc-seconds) in the same frame: Raman for 'Raman', True Chitra
+Paksha for every other ayanamsa name, as the engine does. swe.set_sid_mode
+is process-global, so every worker sets it once in its initializer and
+batches never share ephemeris state.
+
+Usage:
+    births = [BatchBirth(datetime.datetime(1977, 10, 25, 6, 28), 61.7, 30.7, 3.0)]
+    with compute_batch(births, ayanamsa='Raman', workers=8) as result:
+        result.varga_signs[:, BODY_INDEX['Moon'], VARGA_INDEX['D9']]
+"""
+
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro_core.engine import (
+    PLANET_ORDER,
+    VARGA_CODES,
+    datetime_to_jd,
+    varga_sign_indices,
+)
+
+
+# Column order of the body axis: Ascendant first, then the engine's planet order
+BATCH_BODIES = ['Ascendant'] + PLANET_ORDER
+BODY_INDEX = {name: i for i, name in enumerate(BATCH_BODIES)}
+VARGA_INDEX = {code: i for i, code in enumerate(VARGA_CODES)}
+
+# Swiss Ephemeris body ids (Ketu is derived from Rahu)
+SWE_BODIES = {
+    'Sun': swe.SUN,
+    'Moon': swe.MOON,
+    'Mars': swe.MARS,
+    'Mercury': swe.MERCURY,
+    'Jupiter': swe.JUPITER,
+    'Venus': swe.VENUS,
+    'Saturn': swe.SATURN,
+    'Rahu': swe.MEAN_NODE,
+}
+
+def _sidereal_mode(ayanamsa: str) -> int:
+    """
+    Sidereal mode of AstroCore.calculate's output for an ayanamsa name.
+
+    The engine takes True Chitra Paksha positions from jyotishganit and only
+    shifts them for Raman, so 'Lahiri' (and any other name) is True Chitra
+    Paksha, not swe.SIDM_LAHIRI.
+    """
+    return swe.SIDM_RAMAN if ayanamsa == 'Raman' else swe.SIDM_TRUE_CITRA
+
+
+# Default number of births per pool task
+DEFAULT_CHUNK_SIZE = 64
+
+
+@dataclass
+class BatchBirth:
+    """One birth to compute."""
+    birth_datetime: datetime.datetime   # Local time
+    latitude: float
+    longitude: float
+    tz_offset_hours: float
+
+
+# (name, dtype, trailing shape) of each shared result buffer
+_BUFFER_SPECS = (
+    ('longitudes', np.float64, (len(BATCH_BODIES),)),
+    ('sign_indices', np.int8, (len(BATCH_BODIES),)),
+    ('varga_signs', np.int8, (len(BATCH_BODIES), len(VARGA_CODES))),
+)
+
+
+@dataclass
+class BatchResult:
+    """
+    Batch output backed by shared memory.
+
+    Arrays are indexed [birth, body] / [birth, body, varga] using BODY_INDEX
+    and VARGA_INDEX. Sign values are 0-11 (Aries-Pisces); rows listed in
+    errors are left as zeros. Call close() (or use as a context manager) to
+    release the shared memory; copy arrays first if they must outlive it.
+    """
+    longitudes: np.ndarray       # (N, 10) float64, sidereal 0-360
+    sign_indices: np.ndarray     # (N, 10) int8
+    varga_signs: np.ndarray      # (N, 10, len(VARGA_CODES)) int8
+    errors: Dict[int, str] = field(default_factory=dict)
+    _blocks: List[shared_memory.SharedMemory] = field(default_factory=list, repr=False)
+
+    def close(self) -> None:
+        """Release the shared memory blocks backing the arrays."""
+        self.longitudes = self.sign_indices = self.varga_signs = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> 'BatchResult':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# =============================================================================
+# WORKER SIDE
+# =============================================================================
+
+# Per-process state set by _init_worker
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+def _init_worker(block_names: Dict[str, str], count: int, ayanamsa: str) -> None:
+    """Pool initializer: attach to the shared buffers and set this process's sidereal mode."""
+    swe.set_sid_mode(_sidereal_mode(ayanamsa))
+    for name, dtype, shape in _BUFFER_SPECS:
+        block = shared_memory.SharedMemory(name=block_names[name])
+        _worker_blocks.append(block)
+        _worker_arrays[name] = np.ndarray((count,) + shape, dtype=dtype, buffer=block.buf)
+
+
+def _compute_longitudes(birth: BatchBirth) -> List[float]:
+    """Sidereal longitudes in BATCH_BODIES order (sidereal mode must already be set)."""
+    jd = datetime_to_jd(birth.birth_datetime, birth.tz_offset_hours)
+    flags = swe.FLG_SIDEREAL
+
+    ascendant = swe.houses_ex(jd, birth.latitude, birth.longitude, b'E', flags)[1][0]
+    longitudes = [ascendant]
+    for name in PLANET_ORDER:
+        if name == 'Ketu':
+            longitudes.append((longitudes[BODY_INDEX['Rahu']] + 180.0) % 360.0)
+        else:
+            longitudes.append(swe.calc_ut(jd, SWE_BODIES[name], flags)[0][0] % 360.0)
+    return longitudes
+
+
+def _compute_rows(
+    arrays: Dict[str, np.ndarray],
+    start: int,
+    births: Sequence[BatchBirth]
+) -> List[Tuple[int, str]]:
+    """Fill rows start..start+len(births) of arrays; returns (row, error) for failures."""
+    errors = []
+    for offset, birth in enumerate(births):
+        row = start + offset
+        try:
+            longitudes = _compute_longitudes(birth)
+            vargas = varga_sign_indices(longitudes, VARGA_CODES)
+        except Exception as e:
+            errors.append((row, f"{type(e).__name__}: {e}"))
+            continue
+        arrays['longitudes'][row] = longitudes
+        arrays['sign_indices'][row] = [int(longitude // 30) % 12 for longitude in longitudes]
+        arrays['varga_signs'][row] = vargas
+    return errors
+
+
+def _compute_chunk(start: int, births: Sequence[BatchBirth]) -> List[Tuple[int, str]]:
+    """Pool task: compute one shard into the shared buffers."""
+    return _compute_rows(_worker_arrays, start, births)
+
+
+# =============================================================================
+# PARENT SIDE
+# =============================================================================
+
+def compute_batch(
+    births: Sequence[BatchBirth],
+    ayanamsa: str = 'Lahiri',
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context=None
+) -> BatchResult:
+    """
+    Compute positions and varga signs for many births.
+
+    Args:
+        births: Births to compute
+        ayanamsa: Ayanamsa for the whole batch ('Lahiri', 'Raman', etc.)
+        workers: Process count (os.cpu_count() by default); 1 computes inline
+        chunk_size: Births per pool task
+        mp_context: multiprocessing context for the pool (platform default if None)
+
+    Returns:
+        BatchResult whose arrays view shared memory owned by the caller
+    """
+    count = len(births)
+    blocks = []
+    arrays = {}
+    try:
+        for name, dtype, shape in _BUFFER_SPECS:
+            nbytes = max(1, int(np.prod((count,) + shape)) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            blocks.append(block)
+            arrays[name] = np.ndarray((count,) + shape, dtype=dtype, buffer=block.buf)
+            arrays[name].fill(0)
+
+        workers = workers or os.cpu_count() or 1
+        chunks = [(start, births[start:start + chunk_size]) for start in range(0, count, chunk_size)]
+        errors: List[Tuple[int, str]] = []
+
+        if workers == 1 or len(chunks) <= 1:
+            swe.set_sid_mode(_sidereal_mode(ayanamsa))
+            for start, chunk in chunks:
+                errors.extend(_compute_rows(arrays, start, chunk))
+        else:
+            block_names = {name: block.name for (name, _, _), block in zip(_BUFFER_SPECS, blocks)}
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(block_names, count, ayanamsa)
+            ) as pool:
+                futures = [pool.submit(_compute_chunk, start, chunk) for start, chunk in chunks]
+                for future in as_completed(futures):
+                    errors.extend(future.result())
+    except BaseException:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        raise
+
+    return BatchResult(
+        longitudes=arrays['longitudes'],
+        sign_indices=arrays['sign_indices'],
+        varga_signs=arrays['varga_signs'],
+        errors=dict(errors),
+        _blocks=blocks
+    )
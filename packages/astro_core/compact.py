@@ -0,0 +1,404 @@
+"""
+AstroCore Compact - Integer-Coded Digital Twin Wire Format
+==========================================================
+Versioned compact encoding of the (enhanced) Digital Twin and its reference
+decoder. decode_twin(encode_twin(twin)) == twin for engine output.
+
+The verbose twin repeats sign names, planet names and field names thousands
+of times. The compact form replaces them with small integers:
+
+- Signs, planets, nakshatras, dignities and dasha lords are indices into the
+  engine's tables (SIGNS, PLANET_ORDER, NAKSHATRAS, DIGNITY_STATES,
+  VIMSHOTTARI_ORDER); derivable fields (sign_name, sign_lord, nakshatra_lord,
+  house signs and lords) are dropped and rebuilt by the decoder
+- Per-varga planet data is columnar: one array per field, in planet order
+- Houses (houses_owned, aspects_giving_to) and planets (conjunctions,
+  aspects_receiving_from, occupants, aspects_received) become bitmasks
+- Degrees are fixed-point integers (x100 or x10000, the engine's rounding)
+- Dasha dates are proleptic Gregorian ordinals
+
+Layout (COMPACT_VERSION 1):
+    {
+        "format": "starmeet.twin.compact",
+        "version": 1,
+        "encoded": ["vargas", "arudha_padas", ...],   # sections in compact form
+        "twin": {<twin keys in order; encoded sections replaced>}
+    }
+
+A section whose shape is not the engine's (e.g. trimmed below the section
+by a TwinProjection) is carried verbatim and left out of "encoded".
+
+Usage:
+    compact = encode_twin(twin)
+    assert decode_twin(compact) == twin
+"""
+
+import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from astro_core.engine import (
+    NAKSHATRA_LORDS,
+    NAKSHATRAS,
+    PLANET_ORDER,
+    SIGN_INDEX,
+    SIGN_LORDS,
+    SIGNS,
+    VARGA_CODES,
+    VIMSHOTTARI_ORDER,
+)
+
+
+COMPACT_FORMAT = "starmeet.twin.compact"
+COMPACT_VERSION = 1
+
+# Values of get_planet_dignity, in code order
+DIGNITY_STATES = ['Exalted', 'Moolatrikona', 'Own', 'Debilitated', 'Friend', 'Neutral', 'Enemy']
+
+# Field order of the verbose shapes (the decoder rebuilds dicts in this order)
+PLANET_FIELDS = (
+    'name', 'sign_id', 'sign_name', 'absolute_degree', 'relative_degree', 'house_occupied',
+    'houses_owned', 'nakshatra', 'nakshatra_lord', 'nakshatra_pada', 'sign_lord',
+    'dignity_state', 'aspects_giving_to', 'aspects_receiving_from', 'conjunctions', 'is_retrograde',
+)
+HOUSE_FIELDS = ('house_number', 'sign_id', 'sign_name', 'lord', 'occupants', 'aspects_received')
+ASCENDANT_FIELDS = ('sign_id', 'sign_name', 'degrees')
+VARGA_FIELDS = ('ascendant', 'planets', 'houses')
+SPECIAL_LAGNA_FIELDS = ('longitude', 'sign_id', 'sign_name', 'degrees', 'vargas')
+MAHADASHA_FIELDS = ('lord', 'years', 'start_date', 'end_date', 'antardashas')
+ANTARDASHA_FIELDS = ('lord', 'start_date', 'end_date', 'days', 'pratyantardashas')
+PRATYANTARDASHA_FIELDS = ('lord', 'start_date', 'end_date')
+
+_PLANET_INDEX = {name: i for i, name in enumerate(PLANET_ORDER)}
+_NAKSHATRA_INDEX = {name: i for i, name in enumerate(NAKSHATRAS)}
+_DIGNITY_INDEX = {name: i for i, name in enumerate(DIGNITY_STATES)}
+_LORD_INDEX = {name: i for i, name in enumerate(VIMSHOTTARI_ORDER)}
+
+
+class CompactFormatError(ValueError):
+    """A compact document is malformed or of an unsupported version."""
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+
+def _fixed(value: float, scale: int) -> int:
+    """Fixed-point integer of a value already rounded to log10(scale) decimals."""
+    return int(round(value * scale))
+
+
+def _check_fields(data: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    if tuple(data) != fields:
+        raise ValueError(f"unexpected fields {list(data)}")
+
+
+def _house_mask(houses: List[int]) -> int:
+    """Bitmask of ascending 1-based house numbers."""
+    if list(houses) != sorted(set(houses)):
+        raise ValueError("houses not ascending")
+    mask = 0
+    for house in houses:
+        mask |= 1 << (house - 1)
+    return mask
+
+
+def _mask_houses(mask: int) -> List[int]:
+    return [house + 1 for house in range(12) if mask >> house & 1]
+
+
+def _name_mask(names: List[str], index: Dict[str, int]) -> int:
+    """Bitmask of names by their position in a varga's planet list (must be in that order)."""
+    positions = [index[name] for name in names]
+    if positions != sorted(set(positions)):
+        raise ValueError("names not in planet order")
+    mask = 0
+    for position in positions:
+        mask |= 1 << position
+    return mask
+
+
+def _mask_names(mask: int, names: List[str]) -> List[str]:
+    return [name for i, name in enumerate(names) if mask >> i & 1]
+
+
+def _date_ordinal(value: str) -> int:
+    ordinal = datetime.date.fromisoformat(value).toordinal()
+    if datetime.date.fromordinal(ordinal).isoformat() != value:
+        raise ValueError(f"non-canonical date {value!r}")
+    return ordinal
+
+
+def _ordinal_date(ordinal: int) -> str:
+    return datetime.date.fromordinal(ordinal).isoformat()
+
+
+# =============================================================================
+# SECTIONS
+# =============================================================================
+
+def _encode_varga(chart: Dict[str, Any]) -> Dict[str, Any]:
+    _check_fields(chart, VARGA_FIELDS)
+    ascendant = chart['ascendant']
+    _check_fields(ascendant, ASCENDANT_FIELDS)
+    asc_idx = SIGN_INDEX[ascendant['sign_name']]
+
+    planets = chart['planets']
+    for planet in planets:
+        _check_fields(planet, PLANET_FIELDS)
+    position = {planet['name']: i for i, planet in enumerate(planets)}
+
+    houses = chart['houses']
+    if [house['house_number'] for house in houses] != list(range(1, 13)):
+        raise ValueError("houses must be 1-12")
+    for house in houses:
+        _check_fields(house, HOUSE_FIELDS)
+
+    return {
+        'asc': [asc_idx, _fixed(ascendant['degrees'], 100)],
+        'name': [_PLANET_INDEX[p['name']] for p in planets],
+        'sign': [SIGN_INDEX[p['sign_name']] for p in planets],
+        'abs': [_fixed(p['absolute_degree'], 10000) for p in planets],
+        'rel': [_fixed(p['relative_degree'], 100) for p in planets],
+        'house': [p['house_occupied'] for p in planets],
+        'owned': [_house_mask(p['houses_owned']) for p in planets],
+        'nak': [_NAKSHATRA_INDEX[p['nakshatra']] for p in planets],
+        'pada': [p['nakshatra_pada'] for p in planets],
+        'dignity': [_DIGNITY_INDEX[p['dignity_state']] for p in planets],
+        'aspects': [_house_mask(p['aspects_giving_to']) for p in planets],
+        'aspected_by': [_name_mask(p['aspects_receiving_from'], position) for p in planets],
+        'conj': [_name_mask(p['conjunctions'], position) for p in planets],
+        'retro': [int(p['is_retrograde']) for p in planets],
+        'occupants': [_name_mask(h['occupants'], position) for h in houses],
+        'house_aspected_by': [_name_mask(h['aspects_received'], position) for h in houses],
+    }
+
+
+def _decode_varga(data: Dict[str, Any]) -> Dict[str, Any]:
+    asc_idx, asc_degrees = data['asc']
+    names = [PLANET_ORDER[i] for i in data['name']]
+
+    planets = []
+    for i, name in enumerate(names):
+        sign = SIGNS[data['sign'][i]]
+        nakshatra = NAKSHATRAS[data['nak'][i]]
+        planets.append({
+            'name': name,
+            'sign_id': data['sign'][i] + 1,
+            'sign_name': sign,
+            'absolute_degree': data['abs'][i] / 10000,
+            'relative_degree': data['rel'][i] / 100,
+            'house_occupied': data['house'][i],
+            'houses_owned': _mask_houses(data['owned'][i]),
+            'nakshatra': nakshatra,
+            'nakshatra_lord': NAKSHATRA_LORDS.get(nakshatra, ''),
+            'nakshatra_pada': data['pada'][i],
+            'sign_lord': SIGN_LORDS.get(sign, ''),
+            'dignity_state': DIGNITY_STATES[data['dignity'][i]],
+            'aspects_giving_to': _mask_houses(data['aspects'][i]),
+            'aspects_receiving_from': _mask_names(data['aspected_by'][i], names),
+            'conjunctions': _mask_names(data['conj'][i], names),
+            'is_retrograde': bool(data['retro'][i]),
+        })
+
+    houses = []
+    for house in range(12):
+        sign = SIGNS[(asc_idx + house) % 12]
+        houses.append({
+            'house_number': house + 1,
+            'sign_id': SIGN_INDEX[sign] + 1,
+            'sign_name': sign,
+            'lord': SIGN_LORDS.get(sign, ''),
+            'occupants': _mask_names(data['occupants'][house], names),
+            'aspects_received': _mask_names(data['house_aspected_by'][house], names),
+        })
+
+    return {
+        'ascendant': {'sign_id': asc_idx + 1, 'sign_name': SIGNS[asc_idx], 'degrees': asc_degrees / 100},
+        'planets': planets,
+        'houses': houses,
+    }
+
+
+def _encode_vargas(section: Dict[str, Any]) -> Dict[str, Any]:
+    return {code: _encode_varga(chart) for code, chart in section.items()}
+
+
+def _decode_vargas(section: Dict[str, Any]) -> Dict[str, Any]:
+    return {code: _decode_varga(data) for code, data in section.items()}
+
+
+def _encode_arudha_padas(section: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = {}
+    for code, padas in section.items():
+        _check_fields(padas, tuple(f"A{h}" for h in range(1, 13)))
+        for pada in padas.values():
+            _check_fields(pada, ('sign_id', 'sign_name', 'house'))
+        encoded[code] = [
+            [SIGN_INDEX[pada['sign_name']] for pada in padas.values()],
+            [pada['house'] for pada in padas.values()],
+        ]
+    return encoded
+
+
+def _decode_arudha_padas(section: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        code: {
+            f"A{h + 1}": {'sign_id': signs[h] + 1, 'sign_name': SIGNS[signs[h]], 'house': houses[h]}
+            for h in range(12)
+        }
+        for code, (signs, houses) in section.items()
+    }
+
+
+def _encode_special_lagnas(section: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = {}
+    for name, entry in section.items():
+        if not isinstance(entry, dict):
+            encoded[name] = entry  # "sunrise"
+            continue
+        _check_fields(entry, SPECIAL_LAGNA_FIELDS)
+        _check_fields(entry['vargas'], tuple(VARGA_CODES))
+        encoded[name] = [
+            _fixed(entry['longitude'], 10000),
+            SIGN_INDEX[entry['sign_name']],
+            _fixed(entry['degrees'], 100),
+            [SIGN_INDEX[sign] for sign in entry['vargas'].values()],
+        ]
+    return encoded
+
+
+def _decode_special_lagnas(section: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = {}
+    for name, entry in section.items():
+        if not isinstance(entry, list):
+            decoded[name] = entry
+            continue
+        longitude, sign_idx, degrees, vargas = entry
+        decoded[name] = {
+            'longitude': longitude / 10000,
+            'sign_id': sign_idx + 1,
+            'sign_name': SIGNS[sign_idx],
+            'degrees': degrees / 100,
+            'vargas': {code: SIGNS[vargas[i]] for i, code in enumerate(VARGA_CODES)},
+        }
+    return decoded
+
+
+def _encode_dasha(section: Dict[str, Any]) -> Dict[str, Any]:
+    if 'periods' not in section:
+        raise ValueError("no periods")
+
+    def period_dates(period: Dict[str, Any]) -> List[int]:
+        return [_LORD_INDEX[period['lord']], _date_ordinal(period['start_date']), _date_ordinal(period['end_date'])]
+
+    periods = []
+    for maha in section['periods']:
+        _check_fields(maha, MAHADASHA_FIELDS)
+        antardashas = []
+        for antar in maha['antardashas']:
+            _check_fields(antar, ANTARDASHA_FIELDS)
+            for pratyantar in antar['pratyantardashas']:
+                _check_fields(pratyantar, PRATYANTARDASHA_FIELDS)
+            antardashas.append(period_dates(antar) + [
+                antar['days'],
+                [period_dates(pratyantar) for pratyantar in antar['pratyantardashas']],
+            ])
+        periods.append(period_dates(maha) + [maha['years'], antardashas])
+
+    return {**section, 'periods': periods}
+
+
+def _decode_dasha(section: Dict[str, Any]) -> Dict[str, Any]:
+    def period_dates(lord: int, start: int, end: int) -> Dict[str, Any]:
+        return {'lord': VIMSHOTTARI_ORDER[lord], 'start_date': _ordinal_date(start), 'end_date': _ordinal_date(end)}
+
+    periods = []
+    for lord, start, end, years, antardashas in section['periods']:
+        maha = period_dates(lord, start, end)
+        periods.append({
+            'lord': maha['lord'],
+            'years': years,
+            'start_date': maha['start_date'],
+            'end_date': maha['end_date'],
+            'antardashas': [
+                {
+                    **period_dates(a_lord, a_start, a_end),
+                    'days': days,
+                    'pratyantardashas': [period_dates(*pratyantar) for pratyantar in pratyantardashas],
+                }
+                for a_lord, a_start, a_end, days, pratyantardashas in antardashas
+            ],
+        })
+
+    return {**section, 'periods': periods}
+
+
+# Section name -> (encoder, decoder); other sections are carried verbatim
+_SECTION_CODECS: Dict[str, Tuple[Callable, Callable]] = {
+    'vargas': (_encode_vargas, _decode_vargas),
+    'arudha_padas': (_encode_arudha_padas, _decode_arudha_padas),
+    'special_lagnas': (_encode_special_lagnas, _decode_special_lagnas),
+    'dasha': (_encode_dasha, _decode_dasha),
+}
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def encode_twin(twin: Dict[str, Any], verify: bool = True) -> Dict[str, Any]:
+    """
+    Encode a Digital Twin (or a projection of it) into the compact form.
+
+    Args:
+        twin: Digital Twin dict as produced by the engine
+        verify: Decode each encoded section and carry it verbatim unless it
+            round-trips exactly (guards derived fields the encoder drops)
+
+    Returns:
+        Compact document (plain lists, ints and strings; JSON/MessagePack safe)
+    """
+    encoded_sections = []
+    body = {}
+    for name, section in twin.items():
+        codec = _SECTION_CODECS.get(name)
+        if codec is not None:
+            try:
+                encoded = codec[0](section)
+                if not verify or codec[1](encoded) == section:
+                    body[name] = encoded
+                    encoded_sections.append(name)
+                    continue
+            except (KeyError, ValueError, TypeError, AttributeError, IndexError):
+                pass  # Not the engine's shape: carry verbatim
+        body[name] = section
+
+    return {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_VERSION,
+        "encoded": encoded_sections,
+        "twin": body,
+    }
+
+
+def decode_twin(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reference decoder: rebuild the verbose Digital Twin from encode_twin output.
+
+    Raises:
+        CompactFormatError: If the document is not a supported compact twin
+    """
+    if compact.get("format") != COMPACT_FORMAT:
+        raise CompactFormatError(f"not a compact twin (format={compact.get('format')!r})")
+    if compact.get("version") != COMPACT_VERSION:
+        raise CompactFormatError(f"unsupported compact twin version {compact.get('version')!r}")
+
+    encoded = set(compact.get("encoded", []))
+    unknown = encoded - set(_SECTION_CODECS)
+    if unknown:
+        raise CompactFormatError(f"unknown encoded sections {sorted(unknown)}")
+
+    return {
+        name: _SECTION_CODECS[name][1](section) if name in encoded else section
+        for name, section in compact["twin"].items()
+    }
@@ -19,9 +19,16 @@ Version: 2.0.0 (Clean Slate)
 """
 
 import datetime
-from typing import Dict, List, Tuple, Optional, Any
+import hashlib
+import json
+from fractions import Fraction
+from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from astro_core.phases import phase
+
 # Swiss Ephemeris for ayanamsa calculations
 import swisseph as swe
 
@@ -52,6 +59,9 @@ from jyotishganit.components.divisional_charts import (
 # CONSTANTS
 # =============================================================================
 
+# Bump whenever calculation output changes; cached results are keyed on it
+ENGINE_VERSION = "2.1.0"
+
 SIGNS = [
     'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
     'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
@@ -896,6 +906,158 @@ def calculate_all_vargas_with_degrees(abs_longitude: float) -> Dict[str, Dict[st
     return vargas
 
 
+# -----------------------------------------------------------------------------
+# Vectorized varga kernel
+# -----------------------------------------------------------------------------
+# get_varga_sign over arrays of longitudes, for bulk callers. The rules below
+# restate the library functions as (divisions, start sign per D1 sign, step):
+# varga sign = start[sign] + step * part. tests/test_varga_kernel.py pins the
+# kernel to get_varga_sign on a dense grid that includes every part boundary.
+
+def _lower_bounds(divisions: int) -> np.ndarray:
+    """
+    Part boundaries k * 30 / divisions (k = 1..divisions-1) as the smallest
+    float not below each, so `degrees >= bound` is exact as in jyotishganit's
+    rational _equal_division.
+    """
+    bounds = []
+    for k in range(1, divisions):
+        exact = Fraction(30 * k, divisions)
+        bound = float(exact)
+        if Fraction(bound) < exact:
+            bound = float(np.nextafter(bound, np.inf))
+        bounds.append(bound)
+    return np.array(bounds)
+
+
+def _by_modality(movable: int, fixed: int, dual: int) -> List[int]:
+    return [(movable, fixed, dual)[s % 3] for s in range(12)]
+
+
+def _by_parity(odd: int, even: int, relative: bool = False) -> List[int]:
+    """Start sign for odd (Aries, Gemini, ...) and even signs, absolute or counted from the sign."""
+    return [((odd if s % 2 == 0 else even) + (s if relative else 0)) % 12 for s in range(12)]
+
+
+# code -> (divisions, jyotishganit exact division?, start sign index per D1 sign, step)
+_VARGA_RULES: Dict[str, Tuple[int, bool, List[int], int]] = {
+    'D3': (3, True, _by_parity(0, 0, relative=True), 4),
+    'D4': (4, True, _by_parity(0, 0, relative=True), 3),
+    'D5': (5, False, _by_parity(0, 8), 1),
+    'D6': (6, False, _by_parity(0, 6, relative=True), 1),
+    'D7': (7, True, _by_parity(0, 6, relative=True), 1),
+    'D8': (8, False, _by_modality(0, 8, 4), 1),
+    'D9': (9, True, [(s + (0, 8, 4)[s % 3]) % 12 for s in range(12)], 1),
+    'D10': (10, True, _by_parity(0, 8, relative=True), 1),
+    'D11': (11, False, _by_parity(0, 7), 1),
+    'D12': (12, True, _by_parity(0, 0, relative=True), 1),
+    'D16': (16, True, _by_modality(0, 4, 8), 1),
+    'D20': (20, True, _by_modality(0, 8, 4), 1),
+    'D24': (24, True, _by_parity(4, 3), 1),
+    'D27': (27, True, [(0, 3, 6, 9)[s % 4] for s in range(12)], 1),
+    'D40': (40, True, _by_parity(0, 6), 1),
+    'D45': (45, True, _by_modality(0, 4, 8), 1),
+    'D60': (60, True, _by_parity(0, 0, relative=True), 1),
+}
+_VARGA_BOUNDS = {code: _lower_bounds(rule[0]) for code, rule in _VARGA_RULES.items() if rule[1]}
+_VARGA_STARTS = {code: np.array(rule[2], dtype=np.int64) for code, rule in _VARGA_RULES.items()}
+
+# D30 (unequal, upper-inclusive): part = number of bounds below the degrees
+_TRIMSAMSA_BOUNDS = {0: np.array([5.0, 10.0, 18.0, 25.0]), 1: np.array([5.0, 12.0, 20.0, 25.0])}
+_TRIMSAMSA_SIGNS = {0: np.array([0, 10, 8, 2, 6]), 1: np.array([1, 5, 11, 9, 7])}
+
+
+def _varga_column(sign_idx: np.ndarray, degrees: np.ndarray, varga_code: str) -> np.ndarray:
+    if varga_code == 'D2':
+        # Odd signs: Leo then Cancer; even signs: Cancer then Leo
+        first_half = np.searchsorted(_lower_bounds(2), degrees, side='right') == 0
+        return np.where((sign_idx % 2 == 0) == first_half, 4, 3)
+
+    if varga_code == 'D30':
+        parity = sign_idx % 2
+        result = np.empty_like(sign_idx)
+        for p in (0, 1):
+            mask = parity == p
+            result[mask] = _TRIMSAMSA_SIGNS[p][np.searchsorted(_TRIMSAMSA_BOUNDS[p], degrees[mask], side='left')]
+        return result
+
+    rule = _VARGA_RULES.get(varga_code)
+    if rule is None:
+        # D1, and unknown codes fall back to the D1 sign as in get_varga_sign
+        return sign_idx
+    divisions, exact, _, step = rule
+    if exact:
+        part = np.searchsorted(_VARGA_BOUNDS[varga_code], degrees, side='right')
+    else:
+        part = np.minimum((degrees / (30.0 / divisions)).astype(np.int64), divisions - 1)
+    return (_VARGA_STARTS[varga_code][sign_idx] + step * part) % 12
+
+
+def varga_sign_indices(longitudes: Any, varga_codes: List[str]) -> np.ndarray:
+    """
+    Vectorized get_varga_sign: varga sign indices (0 = Aries) of many
+    longitudes in many vargas.
+
+    Args:
+        longitudes: Absolute longitudes (any shape is flattened), normalized like get_varga_sign
+        varga_codes: Varga codes (case-insensitive); unknown codes give the D1 sign
+
+    Returns:
+        (len(longitudes), len(varga_codes)) int8 array, indices into SIGNS
+
+    Raises:
+        ValueError: For longitudes get_varga_sign cannot place (NaN, infinite,
+            or tiny negatives that normalize to 360)
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64).ravel()
+    if not np.isfinite(longitudes).all():
+        raise ValueError("Longitudes must be finite")
+    longitudes = np.mod(longitudes, 360.0)
+    sign_idx = (longitudes / 30).astype(np.int64)
+    if (sign_idx > 11).any():
+        raise ValueError("Longitudes must normalize below 360")
+    degrees = np.mod(longitudes, 30.0)
+
+    result = np.empty((len(longitudes), len(varga_codes)), dtype=np.int8)
+    for column, code in enumerate(varga_codes):
+        result[:, column] = _varga_column(sign_idx, degrees, code.upper())
+    return result
+
+
+def link_chart_positions(planets: List[PlanetPosition], houses: List[HousePosition]) -> None:
+    """
+    Fill the cross-references between D1 planets and houses in place.
+
+    Planets get conjunctions and aspects_receiving, houses get occupants and
+    aspects_received. Requires house and aspects_giving to be set on planets.
+    """
+    planet_signs = {p.name: p.sign for p in planets}
+
+    for planet in planets:
+        # Conjunctions - planets in the same sign
+        planet.conjunctions = [
+            p_name for p_name, p_sign in planet_signs.items()
+            if p_sign == planet.sign and p_name != planet.name
+        ]
+
+        # Aspects receiving - which planets aspect this planet's house
+        planet.aspects_receiving = [
+            other_planet.name for other_planet in planets
+            if other_planet.name != planet.name and planet.house in other_planet.aspects_giving
+        ]
+
+    for house in houses:
+        # Occupants - planets in this house
+        house.occupants = [
+            p.name for p in planets if p.house == house.house_number
+        ]
+
+        # Aspects received - planets aspecting this house
+        house.aspects_received = [
+            p.name for p in planets if house.house_number in p.aspects_giving
+        ]
+
+
 # =============================================================================
 # MAIN CALCULATION CLASS
 # =============================================================================
@@ -1005,8 +1167,6 @@ class AstroCore:
 
         # Step 4: Process planets - apply delta and calculate vargas
         planets = []
-        planet_signs: Dict[str, str] = {}  # For conjunction calculation
-        planet_houses: Dict[str, int] = {}  # For aspect calculation
 
         if hasattr(raw_chart, 'd1_chart') and hasattr(raw_chart.d1_chart, 'planets'):
             for p in raw_chart.d1_chart.planets:
@@ -1031,8 +1191,6 @@ class AstroCore:
                 varga_signs = calculate_all_vargas(corrected_longitude)
 
                 planet_name = str(p.celestial_body)
-                planet_signs[planet_name] = corrected_sign
-                planet_houses[planet_name] = p.house
 
                 # Create planet position object with extended data
                 planet = PlanetPosition(
@@ -1052,31 +1210,8 @@ class AstroCore:
                 )
                 planets.append(planet)
 
-        # Step 5: Calculate conjunctions and aspects received (need all planets first)
-        for planet in planets:
-            # Conjunctions - planets in the same sign
-            planet.conjunctions = [
-                p_name for p_name, p_sign in planet_signs.items()
-                if p_sign == planet.sign and p_name != planet.name
-            ]
-
-            # Aspects receiving - which planets aspect this planet's house
-            for other_planet in planets:
-                if other_planet.name != planet.name:
-                    if planet.house in other_planet.aspects_giving:
-                        planet.aspects_receiving.append(other_planet.name)
-
-        # Step 6: Update houses with occupants and aspects
-        for house in houses:
-            # Occupants - planets in this house
-            house.occupants = [
-                p.name for p in planets if p.house == house.house_number
-            ]
-
-            # Aspects received - planets aspecting this house
-            house.aspects_received = [
-                p.name for p in planets if house.house_number in p.aspects_giving
-            ]
+        # Steps 5-6: Conjunctions, aspects received and house occupants
+        link_chart_positions(planets, houses)
 
         # Step 7: Create and return ChartData
         return ChartData(
@@ -1184,6 +1319,289 @@ def calculate_navamsha_sign(abs_longitude: float) -> str:
     return get_varga_sign(abs_longitude, 'D9')
 
 
+# =============================================================================
+# CHART CONTEXT (shared per-chart state)
+# =============================================================================
+
+@dataclass
+class ChartContext:
+    """
+    Shared per-chart state used while building a Digital Twin.
+
+    Holds the D1 ChartData plus the inputs it was built from. Sections that
+    need more than the D1 positions (sunrise, special lagnas) are computed on
+    first access and memoized here, so the twin generator, formatter and
+    scorers all reuse the same values for a chart.
+    """
+    chart: ChartData
+    tz_offset_hours: float
+    _cache: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def sunrise_window(self) -> Tuple[float, Optional[float]]:
+        """Julian Days (UT) of the sunrise preceding birth and the one after it (see calculate_sunrise_window)."""
+        if 'sunrise_window' not in self._cache:
+            self._cache['sunrise_window'] = calculate_sunrise_window(
+                self.chart.julian_day,
+                self.chart.latitude,
+                self.chart.longitude,
+                self.chart.birth_datetime,
+                self.tz_offset_hours
+            )
+        return self._cache['sunrise_window']
+
+    @property
+    def sunrise_jd(self) -> float:
+        """Julian Day (UT) of the sunrise preceding birth."""
+        return self.sunrise_window[0]
+
+    @property
+    def varga_positions(self) -> Dict[Tuple[float, str], Tuple[str, float]]:
+        """(longitude, varga_code) -> (sign, degrees) memo used by _generate_varga_chart."""
+        return self._cache.setdefault('varga_positions', {})
+
+    @property
+    def special_lagnas(self) -> Dict[str, Any]:
+        """Hora, Ghati, Bhava, Sree and Indu lagnas (see calculate_special_lagnas)."""
+        if 'special_lagnas' not in self._cache:
+            self._cache['special_lagnas'] = calculate_special_lagnas(self)
+        return self._cache['special_lagnas']
+
+    def get_planet(self, name: str) -> Optional[PlanetPosition]:
+        """Get a D1 planet by name."""
+        for planet in self.chart.planets:
+            if planet.name == name:
+                return planet
+        return None
+
+
+def build_chart_context(
+    birth_datetime: datetime.datetime,
+    latitude: float,
+    longitude: float,
+    tz_offset_hours: float,
+    ayanamsa: str = 'Lahiri'
+) -> ChartContext:
+    """
+    Calculate the D1 chart and wrap it in a ChartContext.
+
+    Args:
+        birth_datetime: Birth date and time (local time)
+        latitude: Birth latitude
+        longitude: Birth longitude
+        tz_offset_hours: Timezone offset in hours
+        ayanamsa: Ayanamsa to use ('Lahiri', 'Raman', etc.)
+
+    Returns:
+        ChartContext for the chart
+    """
+    core = AstroCore()
+    with phase("ephemeris"):
+        chart = core.calculate(
+            birth_datetime=birth_datetime,
+            latitude=latitude,
+            longitude=longitude,
+            tz_offset_hours=tz_offset_hours,
+            timezone_name=f"UTC{'+' if tz_offset_hours >= 0 else ''}{tz_offset_hours}",
+            ayanamsa=ayanamsa
+        )
+    return ChartContext(chart=chart, tz_offset_hours=tz_offset_hours)
+
+
+# =============================================================================
+# SPECIAL LAGNAS (Hora, Ghati, Bhava, Sree, Indu)
+# =============================================================================
+
+# Degrees per minute since sunrise (BPHS): Bhava = 1 sign / 5 ghatis,
+# Hora = 1 sign / 2.5 ghatis, Ghati = 1 sign / 1 ghati (1 ghati = 24 min)
+SPECIAL_LAGNA_RATES = {
+    'bhava_lagna': 30.0 / 120.0,
+    'hora_lagna': 30.0 / 60.0,
+    'ghati_lagna': 30.0 / 24.0,
+}
+
+# Kala values used for Indu Lagna (Rahu/Ketu have none)
+INDU_KALAS = {
+    'Sun': 30, 'Moon': 16, 'Mars': 6, 'Mercury': 8,
+    'Jupiter': 10, 'Venus': 12, 'Saturn': 1
+}
+
+
+def calculate_sunrise_window(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    birth_datetime: datetime.datetime,
+    tz_offset_hours: float
+) -> Tuple[float, Optional[float]]:
+    """
+    Find the sunrise preceding birth (Hindu rising: disc center, no
+    refraction) and the sunrise following it.
+
+    Falls back to 06:00 local time on the birth date where the Sun does not
+    rise (polar day/night). Every birth between the two sunrises shares the
+    first (see shift_chart_context). The following sunrise is None when it
+    is unknown, including with the 06:00 fallback.
+
+    Args:
+        jd: Julian Day (UT) of birth
+        latitude: Birth latitude
+        longitude: Birth longitude
+        birth_datetime: Birth date and time (local time)
+        tz_offset_hours: Timezone offset in hours
+
+    Returns:
+        (sunrise, next_sunrise) as Julian Days (UT)
+    """
+    geopos = (longitude, latitude, 0.0)
+    rsmi = swe.CALC_RISE | swe.BIT_HINDU_RISING
+
+    def next_sunrise(start_jd: float) -> Optional[float]:
+        try:
+            res, tret = swe.rise_trans(start_jd, swe.SUN, rsmi, geopos)
+        except swe.Error:
+            return None
+        return tret[0] if res == 0 else None
+
+    sunrise = next_sunrise(jd - 1.1)
+    following = None
+    while sunrise is not None:
+        following = next_sunrise(sunrise + 0.01)
+        if following is None or following > jd:
+            break
+        sunrise = following
+
+    if sunrise is None or sunrise > jd:
+        local_six = birth_datetime.replace(hour=6, minute=0, second=0, microsecond=0)
+        return datetime_to_jd(local_six, tz_offset_hours), None
+    return sunrise, following
+
+
+def _special_lagna_entry(abs_longitude: float) -> Dict[str, Any]:
+    """Position of a special lagna with its varga placements."""
+    abs_longitude = normalize_longitude(abs_longitude)
+    sign, degrees = longitude_to_sign_degrees(abs_longitude)
+    return {
+        "longitude": round(abs_longitude, 4),
+        "sign_id": SIGNS.index(sign) + 1,
+        "sign_name": sign,
+        "degrees": round(degrees, 2),
+        "vargas": calculate_all_vargas(abs_longitude)
+    }
+
+
+def calculate_special_lagnas(context: ChartContext) -> Dict[str, Any]:
+    """
+    Calculate the special lagnas from first principles.
+
+    - Bhava / Hora / Ghati Lagna: Sun's longitude at sunrise advanced at a
+      fixed rate per minute elapsed since sunrise (SPECIAL_LAGNA_RATES)
+    - Sree Lagna: Ascendant advanced by the elapsed fraction of the Moon's
+      nakshatra times 360°
+    - Indu Lagna: Kalas of the 9th lords from Lagna and Moon, summed mod 12
+      and counted from the Moon's sign (degrees carried over from the Moon)
+
+    The Sun at sunrise is derived from the chart's Sun minus its Swiss
+    Ephemeris motion between sunrise and birth, so all lagnas stay in the
+    chart's ayanamsa frame.
+
+    Args:
+        context: ChartContext of the chart
+
+    Returns:
+        Dict with "sunrise" plus one entry per lagna (see _special_lagna_entry)
+    """
+    chart = context.chart
+    sun = context.get_planet('Sun')
+    moon = context.get_planet('Moon')
+    if sun is None or moon is None or not chart.houses:
+        return {}
+
+    sunrise_jd = context.sunrise_jd
+    sun_motion = swe.calc_ut(chart.julian_day, swe.SUN)[0][0] - swe.calc_ut(sunrise_jd, swe.SUN)[0][0]
+    sun_at_sunrise = normalize_longitude(sun.abs_longitude - sun_motion)
+    minutes_since_sunrise = (chart.julian_day - sunrise_jd) * 1440.0
+
+    lagnas = {
+        "sunrise": (
+            datetime.datetime(*swe.revjul(sunrise_jd)[:3])
+            + datetime.timedelta(days=(sunrise_jd + 0.5) % 1, hours=context.tz_offset_hours)
+        ).replace(microsecond=0).isoformat(),
+    }
+    for name, rate in SPECIAL_LAGNA_RATES.items():
+        lagnas[name] = _special_lagna_entry(sun_at_sunrise + minutes_since_sunrise * rate)
+
+    # Sree Lagna
+    nakshatra_span = 360.0 / 27.0
+    nakshatra_fraction = (moon.abs_longitude % nakshatra_span) / nakshatra_span
+    lagnas["sree_lagna"] = _special_lagna_entry(chart.houses[0].abs_longitude + nakshatra_fraction * 360.0)
+
+    # Indu Lagna
+    asc_sign_idx = int(normalize_longitude(chart.houses[0].abs_longitude) / 30)
+    moon_sign_idx = int(moon.abs_longitude / 30)
+    ninth_lord_from_lagna = SIGN_LORDS[SIGNS[(asc_sign_idx + 8) % 12]]
+    ninth_lord_from_moon = SIGN_LORDS[SIGNS[(moon_sign_idx + 8) % 12]]
+    remainder = (INDU_KALAS[ninth_lord_from_lagna] + INDU_KALAS[ninth_lord_from_moon]) % 12 or 12
+    indu_sign_idx = (moon_sign_idx + remainder - 1) % 12
+    lagnas["indu_lagna"] = _special_lagna_entry(indu_sign_idx * 30 + moon.sign_degrees)
+
+    return lagnas
+
+
+# =============================================================================
+# HOUSE BITMASK TABLES (used by _generate_varga_chart)
+# =============================================================================
+# Houses are encoded as 12-bit masks (bit 0 = house 1) and planets of a chart as
+# masks over their position in ChartData.planets, so occupancy, conjunctions and
+# aspects reduce to a few integer operations per varga.
+
+SIGN_INDEX = {sign: i for i, sign in enumerate(SIGNS)}
+
+
+def _aspect_mask_row(offsets: List[int]) -> Tuple[int, ...]:
+    """Aspect masks for a planet in each house 1-12 (see get_aspects_giving)."""
+    return tuple(
+        sum(1 << ((house + offset) % 12) for offset in set(offsets))
+        for house in range(12)
+    )
+
+
+# Planet -> 12 aspect masks indexed by house_occupied - 1
+ASPECT_MASKS = {
+    planet: _aspect_mask_row(offsets) for planet, offsets in PLANETARY_ASPECTS.items()
+}
+_DEFAULT_ASPECT_MASKS = _aspect_mask_row([7])
+
+# 12-bit house mask -> sorted house numbers
+HOUSE_MASK_TO_HOUSES = tuple(
+    tuple(house + 1 for house in range(12) if mask >> house & 1)
+    for mask in range(1 << 12)
+)
+
+# Planet mask -> planet indices, for charts with up to 9 planets
+_PLANET_MASK_TO_INDICES = tuple(
+    tuple(i for i in range(9) if mask >> i & 1)
+    for mask in range(1 << 9)
+)
+
+# (planet, ascendant sign index) -> houses owned
+HOUSES_OWNED = {
+    (planet, asc_idx): [
+        house + 1 for house in range(12)
+        if SIGN_LORDS[SIGNS[(asc_idx + house) % 12]] == planet
+    ]
+    for planet in PLANETARY_ASPECTS
+    for asc_idx in range(12)
+}
+
+
+def _planet_mask_indices(mask: int) -> Tuple[int, ...]:
+    """Indices of the set bits of a planet mask."""
+    if mask < len(_PLANET_MASK_TO_INDICES):
+        return _PLANET_MASK_TO_INDICES[mask]
+    return tuple(i for i in range(mask.bit_length()) if mask >> i & 1)
+
+
 # =============================================================================
 # DIGITAL TWIN GENERATOR
 # =============================================================================
@@ -1223,46 +1641,103 @@ def generate_digital_twin(
                 "D1": {"ascendant": {...}, "planets": [...], "houses": [...]},
                 "D9": {...},
                 ...
-            }
+            },
+            "arudha_padas": {"D1": {"A1": {...}, ..., "A12": {...}}, ...},
+            "special_lagnas": {"hora_lagna": {...}, "ghati_lagna": {...}, ...}
         }
     """
-    # Step 1: Calculate base D1 chart using AstroCore
-    core = AstroCore()
-    base_chart = core.calculate(
+    context = build_chart_context(
         birth_datetime=birth_datetime,
         latitude=latitude,
         longitude=longitude,
         tz_offset_hours=tz_offset_hours,
-        timezone_name=f"UTC{'+' if tz_offset_hours >= 0 else ''}{tz_offset_hours}",
         ayanamsa=ayanamsa
     )
+    return build_digital_twin(context)
 
-    # Build meta information
-    meta = {
-        "birth_datetime": birth_datetime.isoformat(),
-        "latitude": latitude,
-        "longitude": longitude,
-        "timezone_offset": tz_offset_hours,
-        "ayanamsa": ayanamsa,
-        "ayanamsa_delta": round(base_chart.ayanamsa_delta, 6),
-        "julian_day": base_chart.julian_day,
-        "generated_at": datetime.datetime.now().isoformat()
-    }
 
-    # Step 2: Generate data for all 16 Vargas
-    vargas_data = {}
+@phase("twin_generation")
+def build_digital_twin(context: ChartContext) -> Dict[str, Any]:
+    """
+    Build the Digital Twin (see generate_digital_twin) from a ChartContext.
 
-    for varga_code in VARGA_CODES:
-        varga_data = _generate_varga_chart(base_chart, varga_code)
-        vargas_data[varga_code] = varga_data
+    Args:
+        context: ChartContext of the chart
+
+    Returns:
+        Digital Twin dict with meta, vargas, arudha_padas and special_lagnas
+    """
+    twin = _build_natal_twin(context)
+    twin['meta']['generated_at'] = datetime.datetime.now().isoformat()
+    return twin
+
+
+def _build_natal_twin(
+    context: ChartContext,
+    projection: Optional['TwinProjection'] = None
+) -> Dict[str, Any]:
+    """
+    Digital Twin sections that depend only on the birth data (no wall clock).
 
+    With a projection, only its vargas are generated and sections it leaves
+    out are not computed (varga charts are still built for arudha_padas).
+    """
+    projection = projection or FULL_PROJECTION
+    base_chart = context.chart
+
+    twin: Dict[str, Any] = {"meta": _twin_meta(context)}
+
+    # Step 2: Generate data for all 16 Vargas (or the projected ones)
+    if projection.wants('vargas') or projection.wants('arudha_padas'):
+        vargas_data = {}
+
+        for varga_code in projection.computed_vargas():
+            varga_data = _generate_varga_chart(base_chart, varga_code, context.varga_positions)
+            vargas_data[varga_code] = varga_data
+
+        if projection.wants('vargas'):
+            twin["vargas"] = vargas_data
+        if projection.wants('arudha_padas'):
+            twin["arudha_padas"] = calculate_arudha_section(vargas_data)
+
+    if projection.wants('special_lagnas'):
+        twin["special_lagnas"] = context.special_lagnas
+
+    return twin
+
+
+def _twin_meta(context: ChartContext) -> Dict[str, Any]:
+    """Digital Twin "meta" section (without generated_at)."""
+    chart = context.chart
     return {
-        "meta": meta,
-        "vargas": vargas_data
+        "birth_datetime": chart.birth_datetime.isoformat(),
+        "latitude": chart.latitude,
+        "longitude": chart.longitude,
+        "timezone_offset": context.tz_offset_hours,
+        "ayanamsa": chart.ayanamsa,
+        "ayanamsa_delta": round(chart.ayanamsa_delta, 6),
+        "julian_day": chart.julian_day,
     }
 
 
-def _generate_varga_chart(base_chart: ChartData, varga_code: str) -> Dict[str, Any]:
+def _varga_position(
+    position_cache: Dict[Tuple[float, str], Tuple[str, float]],
+    abs_longitude: float,
+    varga_code: str
+) -> Tuple[str, float]:
+    """Memoized get_varga_sign_and_degrees (see ChartContext.varga_positions)."""
+    key = (abs_longitude, varga_code)
+    position = position_cache.get(key)
+    if position is None:
+        position = position_cache[key] = get_varga_sign_and_degrees(abs_longitude, varga_code)
+    return position
+
+
+def _generate_varga_chart(
+    base_chart: ChartData,
+    varga_code: str,
+    position_cache: Optional[Dict[Tuple[float, str], Tuple[str, float]]] = None
+) -> Dict[str, Any]:
     """
     Generate complete chart data for a specific Varga.
 
@@ -1274,122 +1749,95 @@ def _generate_varga_chart(base_chart: ChartData, varga_code: str) -> Dict[str, A
     Args:
         base_chart: The calculated D1 ChartData
         varga_code: Varga code (D1, D2, ..., D60)
+        position_cache: Optional (longitude, varga_code) -> (sign, degrees) memo,
+            shared between charts that keep some longitudes (see ChartContext)
 
     Returns:
         Dict with ascendant, planets, and houses data
     """
+    if position_cache is None:
+        position_cache = {}
+
     # Get ascendant for this varga
     asc_longitude = base_chart.houses[0].abs_longitude if base_chart.houses else 0
-    asc_sign, asc_degrees = get_varga_sign_and_degrees(asc_longitude, varga_code)
-    asc_sign_id = SIGNS.index(asc_sign) + 1 if asc_sign in SIGNS else 1
+    asc_sign, asc_degrees = _varga_position(position_cache, asc_longitude, varga_code)
+    asc_idx = SIGN_INDEX.get(asc_sign, 0)
+    asc_sign_id = asc_idx + 1
 
     # Build house signs for this varga (12 houses starting from ascendant sign)
-    varga_house_signs: Dict[int, str] = {}
-    for house_num in range(1, 13):
-        # Each house is one sign forward from ascendant
-        house_sign_idx = (asc_sign_id - 1 + house_num - 1) % 12
-        varga_house_signs[house_num] = SIGNS[house_sign_idx]
+    varga_house_signs: Dict[int, str] = {
+        house_num: SIGNS[(asc_idx + house_num - 1) % 12] for house_num in range(1, 13)
+    }
 
     # Process planets for this varga
     planets_data = []
-    planet_in_varga_sign: Dict[str, str] = {}  # For conjunctions
-    planet_in_varga_house: Dict[str, int] = {}  # For aspects
+    names = [planet.name for planet in base_chart.planets]
+    planet_houses: List[int] = []  # 0-based house occupied, per planet index
+    occupants_mask = [0] * 12      # house -> planet mask (same house == same sign)
+    aspected_by_mask = [0] * 12    # house -> mask of planets aspecting it
 
-    for planet in base_chart.planets:
+    for i, planet in enumerate(base_chart.planets):
         # Get varga sign and degrees
-        varga_sign, varga_degrees = get_varga_sign_and_degrees(
-            planet.abs_longitude, varga_code
-        )
-        varga_sign_id = SIGNS.index(varga_sign) + 1 if varga_sign in SIGNS else 1
+        varga_sign, varga_degrees = _varga_position(position_cache, planet.abs_longitude, varga_code)
+        varga_idx = SIGN_INDEX.get(varga_sign, 0)
 
-        # Calculate house occupied in this varga
         # House = (planet_sign_id - ascendant_sign_id) % 12 + 1
-        house_occupied = ((varga_sign_id - asc_sign_id) % 12) + 1
-
-        # Calculate houses owned in this varga
-        houses_owned = get_houses_owned(planet.name, varga_house_signs)
-
-        # Get dignity for this varga position
-        dignity = get_planet_dignity(planet.name, varga_sign, varga_degrees)
-
-        # Get sign lord
-        sign_lord = SIGN_LORDS.get(varga_sign, '')
+        house = (varga_idx - asc_idx) % 12
+        aspect_mask = ASPECT_MASKS.get(planet.name, _DEFAULT_ASPECT_MASKS)[house]
 
-        # Calculate aspects giving (based on house occupied in this varga)
-        aspects_giving = get_aspects_giving(planet.name, house_occupied)
+        bit = 1 << i
+        planet_houses.append(house)
+        occupants_mask[house] |= bit
+        for target in HOUSE_MASK_TO_HOUSES[aspect_mask]:
+            aspected_by_mask[target - 1] |= bit
 
-        # Store for conjunction/aspect calculations
-        planet_in_varga_sign[planet.name] = varga_sign
-        planet_in_varga_house[planet.name] = house_occupied
+        houses_owned = HOUSES_OWNED.get((planet.name, asc_idx))
+        if houses_owned is None:
+            houses_owned = get_houses_owned(planet.name, varga_house_signs)
 
         planet_data = {
             "name": planet.name,
-            "sign_id": varga_sign_id,
+            "sign_id": varga_idx + 1,
             "sign_name": varga_sign,
             "absolute_degree": round(planet.abs_longitude, 4),
             "relative_degree": round(varga_degrees, 2),
-            "house_occupied": house_occupied,
-            "houses_owned": houses_owned,
+            "house_occupied": house + 1,
+            "houses_owned": list(houses_owned),
             "nakshatra": planet.nakshatra,
             "nakshatra_lord": planet.nakshatra_lord,
             "nakshatra_pada": planet.nakshatra_pada,
-            "sign_lord": sign_lord,
-            "dignity_state": dignity,
-            "aspects_giving_to": aspects_giving,
+            "sign_lord": SIGN_LORDS.get(varga_sign, ''),
+            "dignity_state": get_planet_dignity(planet.name, varga_sign, varga_degrees),
+            "aspects_giving_to": list(HOUSE_MASK_TO_HOUSES[aspect_mask]),
             "aspects_receiving_from": [],  # Will be filled after all planets processed
             "conjunctions": [],  # Will be filled after all planets processed
             "is_retrograde": False  # TODO: Add retrograde detection
         }
         planets_data.append(planet_data)
 
-    # Second pass: Calculate conjunctions and aspects received
-    for planet_data in planets_data:
-        planet_name = planet_data["name"]
-        planet_sign = planet_in_varga_sign[planet_name]
-        planet_house = planet_in_varga_house[planet_name]
-
-        # Conjunctions - planets in the same sign in this varga
+    # Second pass: conjunctions (same sign) and aspects received, excluding self
+    for i, planet_data in enumerate(planets_data):
+        house = planet_houses[i]
+        others = ~(1 << i)
         planet_data["conjunctions"] = [
-            p_name for p_name, p_sign in planet_in_varga_sign.items()
-            if p_sign == planet_sign and p_name != planet_name
+            names[j] for j in _planet_mask_indices(occupants_mask[house] & others)
+        ]
+        planet_data["aspects_receiving_from"] = [
+            names[j] for j in _planet_mask_indices(aspected_by_mask[house] & others)
         ]
-
-        # Aspects receiving - which planets aspect this planet's house
-        for other_name, other_house in planet_in_varga_house.items():
-            if other_name != planet_name:
-                other_aspects = get_aspects_giving(other_name, other_house)
-                if planet_house in other_aspects:
-                    planet_data["aspects_receiving_from"].append(other_name)
 
     # Build houses data for this varga
     houses_data = []
     for house_num in range(1, 13):
         house_sign = varga_house_signs[house_num]
-        house_sign_id = SIGNS.index(house_sign) + 1 if house_sign in SIGNS else 1
-        house_lord = SIGN_LORDS.get(house_sign, '')
-
-        # Get occupants (planets in this house in this varga)
-        occupants = [
-            p_name for p_name, p_house in planet_in_varga_house.items()
-            if p_house == house_num
-        ]
-
-        # Get aspects received (planets aspecting this house)
-        aspects_received = []
-        for p_name, p_house in planet_in_varga_house.items():
-            planet_aspects = get_aspects_giving(p_name, p_house)
-            if house_num in planet_aspects:
-                aspects_received.append(p_name)
-
-        house_data = {
+        houses_data.append({
             "house_number": house_num,
-            "sign_id": house_sign_id,
+            "sign_id": SIGN_INDEX[house_sign] + 1,
             "sign_name": house_sign,
-            "lord": house_lord,
-            "occupants": occupants,
-            "aspects_received": aspects_received
-        }
-        houses_data.append(house_data)
+            "lord": SIGN_LORDS.get(house_sign, ''),
+            "occupants": [names[j] for j in _planet_mask_indices(occupants_mask[house_num - 1])],
+            "aspects_received": [names[j] for j in _planet_mask_indices(aspected_by_mask[house_num - 1])]
+        })
 
     return {
         "ascendant": {
@@ -1402,6 +1850,98 @@ def _generate_varga_chart(base_chart: ChartData, varga_code: str) -> Dict[str, A
     }
 
 
+# =============================================================================
+# ARUDHA PADAS (Jaimini System)
+# =============================================================================
+
+# Fixed planet order used by all array-based calculations
+PLANET_ORDER = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+# Sign index (0-11) -> index of its lord in PLANET_ORDER
+SIGN_LORD_INDEX = np.array(
+    [PLANET_ORDER.index(SIGN_LORDS[sign]) for sign in SIGNS], dtype=np.int16
+)
+
+
+def calculate_arudha_padas(asc_signs: np.ndarray, planet_signs: np.ndarray) -> np.ndarray:
+    """
+    Calculate all 12 Arudha Padas for a stack of charts at once.
+
+    Pure integer sign arithmetic over arrays (no per-house loops):
+        house_sign = ascendant + (house - 1)
+        lord_sign  = sign occupied by the lord of house_sign
+        pada       = lord_sign + (lord_sign - house_sign)   (same distance again)
+
+    Standard exceptions (BPHS):
+    - Pada falls in the house itself -> take the 10th from the house
+    - Pada falls in the 7th from the house -> take the 4th from the house
+
+    Args:
+        asc_signs: Shape (N,) ascendant sign indices (0-11), e.g. one per varga
+        planet_signs: Shape (N, 9) planet sign indices (0-11) in PLANET_ORDER
+
+    Returns:
+        Shape (N, 12) array of pada sign indices (0-11); column h is A(h+1)
+    """
+    asc = np.asarray(asc_signs, dtype=np.int16).reshape(-1, 1)
+    planets = np.asarray(planet_signs, dtype=np.int16).reshape(asc.shape[0], len(PLANET_ORDER))
+
+    house_signs = (asc + np.arange(12, dtype=np.int16)) % 12
+    lord_signs = np.take_along_axis(planets, SIGN_LORD_INDEX[house_signs], axis=1)
+
+    padas = (2 * lord_signs - house_signs) % 12
+    distance = (padas - house_signs) % 12
+    padas = np.where(distance == 0, (house_signs + 9) % 12, padas)
+    padas = np.where(distance == 6, (house_signs + 3) % 12, padas)
+    return padas
+
+
+def calculate_arudha_section(vargas_data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the Digital Twin "arudha_padas" section for every varga.
+
+    All vargas are stacked into one (V, 9) sign matrix and solved in a single
+    call to calculate_arudha_padas().
+
+    Args:
+        vargas_data: Digital Twin "vargas" section (varga_code -> chart dict)
+
+    Returns:
+        Dict mapping varga code to {"A1": {sign_id, sign_name, house}, ..., "A12": {...}}
+        where "house" is counted from that varga's ascendant
+    """
+    codes = list(vargas_data.keys())
+    if not codes:
+        return {}
+
+    planet_column = {name: i for i, name in enumerate(PLANET_ORDER)}
+    asc_signs = np.zeros(len(codes), dtype=np.int16)
+    planet_signs = np.zeros((len(codes), len(PLANET_ORDER)), dtype=np.int16)
+
+    for row, code in enumerate(codes):
+        chart = vargas_data[code]
+        asc_signs[row] = chart["ascendant"]["sign_id"] - 1
+        for planet in chart["planets"]:
+            column = planet_column.get(planet["name"])
+            if column is not None:
+                planet_signs[row, column] = planet["sign_id"] - 1
+
+    padas = calculate_arudha_padas(asc_signs, planet_signs)
+    houses = (padas - asc_signs.reshape(-1, 1)) % 12 + 1
+
+    section = {}
+    for row, code in enumerate(codes):
+        section[code] = {
+            f"A{h + 1}": {
+                "sign_id": int(padas[row, h]) + 1,
+                "sign_name": SIGNS[padas[row, h]],
+                "house": int(houses[row, h])
+            }
+            for h in range(12)
+        }
+    return section
+
+
 # =============================================================================
 # CHARA KARAKA CALCULATION (Jaimini System)
 # =============================================================================
@@ -1820,58 +2360,750 @@ def generate_digital_twin_enhanced(
     Returns:
         Enhanced Digital Twin dict with dasha section
     """
-    # Generate base digital twin
-    base_twin = generate_digital_twin(
+    context = build_chart_context(
         birth_datetime=birth_datetime,
         latitude=latitude,
         longitude=longitude,
         tz_offset_hours=tz_offset_hours,
         ayanamsa=ayanamsa
     )
+    return build_digital_twin_enhanced(context)
+
+
+def build_digital_twin_enhanced(
+    context: ChartContext,
+    as_of: Optional[datetime.date] = None
+) -> Dict[str, Any]:
+    """
+    Build the enhanced Digital Twin (see generate_digital_twin_enhanced) from a ChartContext.
+
+    Equivalent to the natal core with the as-of overlay for as_of (today by default).
+
+    Args:
+        context: ChartContext of the chart
+        as_of: Date the current dasha periods are reported for
+
+    Returns:
+        Enhanced Digital Twin dict with dasha section
+    """
+    core = build_natal_core(context)
+    return apply_as_of_overlay(core, compute_as_of_overlay(core, as_of or datetime.date.today()))
+
+
+# =============================================================================
+# NATAL CORE AND AS-OF OVERLAY
+# =============================================================================
+# The natal core holds everything determined by the birth data alone and is
+# deterministic, so it can be hashed and cached indefinitely. Fields that depend
+# on the calendar (current dasha periods, generation time) live in a small
+# overlay computed from the core for any date.
 
-    # Get Julian Day for retrograde calculation
-    jd = datetime_to_jd(birth_datetime, tz_offset_hours)
+# Dasha fields that belong to the overlay, not the core
+AS_OF_DASHA_FIELDS = ('current_mahadasha', 'current_antardasha', 'current_pratyantardasha')
 
-    # Update planets with retrograde status
-    if 'vargas' in base_twin and 'D1' in base_twin['vargas']:
-        d1_planets = base_twin['vargas']['D1']['planets']
-        moon_longitude = None
 
-        for planet in d1_planets:
-            # Calculate retrograde status
-            planet['is_retrograde'] = is_planet_retrograde(planet['name'], jd)
+@phase("twin_generation")
+def build_natal_core(
+    context: ChartContext,
+    projection: Optional['TwinProjection'] = None
+) -> Dict[str, Any]:
+    """
+    Build the deterministic natal core of the enhanced Digital Twin.
 
-            # Store Moon longitude for Dasha calculation
-            if planet['name'] == 'Moon':
-                moon_longitude = planet['absolute_degree']
+    Same sections as build_digital_twin_enhanced, without meta.generated_at
+    and the current_* dasha fields.
 
-        # Update all vargas with retrograde info from D1
-        retrograde_status = {p['name']: p['is_retrograde'] for p in d1_planets}
-        for varga_code in VARGA_CODES:
-            if varga_code in base_twin['vargas']:
-                for planet in base_twin['vargas'][varga_code]['planets']:
-                    planet['is_retrograde'] = retrograde_status.get(planet['name'], False)
+    Args:
+        context: ChartContext of the chart
+        projection: Sections and vargas to compute (everything by default).
+            Skipped sections are never calculated; dotted paths inside a
+            section are trimmed later by TwinProjection.apply.
 
-        # Calculate Vimshottari Dasha with full sub-periods
-        if moon_longitude is not None:
-            # Use native library function for full sub-periods support
+    Returns:
+        Natal core dict
+    """
+    projection = projection or FULL_PROJECTION
+    base_twin = _build_natal_twin(context, projection)
+    chart = context.chart
+
+    # Julian Day for retrograde calculation
+    jd = chart.julian_day
+
+    # Update planets in all vargas with retrograde status (same in every varga)
+    if 'vargas' in base_twin:
+        retrograde_status = {p.name: is_planet_retrograde(p.name, jd) for p in chart.planets}
+        for varga in base_twin['vargas'].values():
+            for planet in varga['planets']:
+                planet['is_retrograde'] = retrograde_status.get(planet['name'], False)
+
+    # Calculate Vimshottari Dasha with full sub-periods
+    moon = context.get_planet('Moon')
+    if projection.wants('dasha') and moon is not None:
+        # Use native library function for full sub-periods support
+        with phase("dasha"):
             dasha_data = calculate_vimshottari_dasha_native(
-                birth_datetime=birth_datetime,
-                latitude=latitude,
-                longitude=longitude,
-                tz_offset_hours=tz_offset_hours,
+                birth_datetime=chart.birth_datetime,
+                latitude=chart.latitude,
+                longitude=chart.longitude,
+                tz_offset_hours=context.tz_offset_hours,
                 ayanamsa_delta=base_twin['meta']['ayanamsa_delta'],
-                moon_longitude=moon_longitude
+                moon_longitude=round(moon.abs_longitude, 4)
             )
-            base_twin['dasha'] = dasha_data
+        for key in AS_OF_DASHA_FIELDS:
+            dasha_data.pop(key, None)
+        base_twin['dasha'] = dasha_data
 
-        # Calculate Chara Karakas (Jaimini system)
-        chara_karakas = calculate_chara_karakas(d1_planets)
-        base_twin['chara_karakas'] = chara_karakas
+    # Calculate Chara Karakas (Jaimini system) from the D1 planets
+    if projection.wants('chara_karakas'):
+        d1 = base_twin.get('vargas', {}).get('D1')
+        if d1 is None:
+            d1 = _generate_varga_chart(chart, 'D1', context.varga_positions)
+        base_twin['chara_karakas'] = calculate_chara_karakas(d1['planets'])
 
     return base_twin
 
 
+def natal_core_hash(core: Dict[str, Any]) -> str:
+    """Content hash (sha256 hex) of a natal core."""
+    payload = json.dumps(core, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _period_at(periods: List[Dict[str, Any]], as_of: str) -> Optional[Dict[str, Any]]:
+    """First period whose [start_date, end_date] contains the ISO date as_of."""
+    for period in periods:
+        if period["start_date"] <= as_of <= period["end_date"]:
+            return period
+    return None
+
+
+def compute_as_of_overlay(core: Dict[str, Any], as_of: datetime.date) -> Dict[str, Any]:
+    """
+    Compute the calendar-dependent fields of the twin for a given date.
+
+    Current Mahadasha/Antardasha/Pratyantardasha are looked up in the core's
+    dasha periods. Where a Mahadasha has no antardashas (basic fallback), the
+    Antardasha is found from its proportional share of the Mahadasha.
+
+    Args:
+        core: Natal core (see build_natal_core)
+        as_of: Date to report the current periods for
+
+    Returns:
+        {"as_of": "YYYY-MM-DD", "dasha": {"current_mahadasha": ..., ...}}
+    """
+    as_of_str = as_of.isoformat()
+    current: Dict[str, Optional[str]] = dict.fromkeys(AS_OF_DASHA_FIELDS)
+
+    mahadasha = _period_at(core.get("dasha", {}).get("periods", []), as_of_str)
+    if mahadasha is not None:
+        current["current_mahadasha"] = mahadasha["lord"]
+        antardasha = _period_at(mahadasha.get("antardashas", []), as_of_str)
+        if antardasha is not None:
+            current["current_antardasha"] = antardasha["lord"]
+            pratyantardasha = _period_at(antardasha.get("pratyantardashas", []), as_of_str)
+            if pratyantardasha is not None:
+                current["current_pratyantardasha"] = pratyantardasha["lord"]
+        elif not mahadasha.get("antardashas"):
+            start = datetime.date.fromisoformat(mahadasha["start_date"])
+            end = datetime.date.fromisoformat(mahadasha["end_date"])
+            maha_days = (end - start).days
+            progress = (as_of - start).days / maha_days if maha_days > 0 else 0
+
+            maha_lord_idx = VIMSHOTTARI_ORDER.index(mahadasha["lord"])
+            antar_progress = 0
+            for j in range(9):
+                antar_lord = VIMSHOTTARI_ORDER[(maha_lord_idx + j) % 9]
+                antar_portion = VIMSHOTTARI_PERIODS[antar_lord] / 120.0
+                if antar_progress + antar_portion >= progress:
+                    current["current_antardasha"] = antar_lord
+                    break
+                antar_progress += antar_portion
+
+    return {"as_of": as_of_str, "dasha": current}
+
+
+def apply_as_of_overlay(
+    core: Dict[str, Any],
+    overlay: Dict[str, Any],
+    generated_at: Optional[datetime.datetime] = None
+) -> Dict[str, Any]:
+    """
+    Combine a natal core and an overlay into the enhanced twin shape.
+
+    The core is not modified; only its top-level, meta and dasha dicts are
+    copied, so the (large) varga sections are shared with the core.
+
+    Args:
+        core: Natal core (see build_natal_core)
+        overlay: Result of compute_as_of_overlay
+        generated_at: Timestamp for meta.generated_at (now by default)
+
+    Returns:
+        Enhanced Digital Twin dict
+    """
+    twin = dict(core)
+    twin["meta"] = {
+        **core.get("meta", {}),
+        "as_of": overlay["as_of"],
+        "generated_at": (generated_at or datetime.datetime.now()).isoformat(),
+    }
+    if "dasha" in core:
+        twin["dasha"] = {**core["dasha"], **overlay["dasha"]}
+    return twin
+
+
+def base_twin_from_core(
+    core: Dict[str, Any],
+    generated_at: Optional[datetime.datetime] = None
+) -> Dict[str, Any]:
+    """
+    The base Digital Twin (build_digital_twin) contained in a natal core.
+
+    Drops the enhanced sections (dasha, chara_karakas) and resets the
+    planets' is_retrograde flags to the varga charts' placeholder (False),
+    so callers holding a core need not rebuild the chart for the base twin.
+    The core is not modified.
+
+    Args:
+        core: Full natal core (see build_natal_core)
+        generated_at: Timestamp for meta.generated_at (now by default)
+
+    Returns:
+        Digital Twin dict with meta, vargas, arudha_padas and special_lagnas
+    """
+    twin = {key: value for key, value in core.items() if key not in ('dasha', 'chara_karakas')}
+    twin["meta"] = {
+        **core["meta"],
+        "generated_at": (generated_at or datetime.datetime.now()).isoformat(),
+    }
+    if "vargas" in core:
+        twin["vargas"] = {
+            code: {
+                **varga,
+                "planets": [
+                    {**planet, "is_retrograde": False}
+                    for planet in varga["planets"]
+                ],
+            }
+            for code, varga in core["vargas"].items()
+        }
+    return twin
+
+
+# =============================================================================
+# TWIN PROJECTION (sparse fieldsets)
+# =============================================================================
+# Clients that render only part of the twin (e.g. D1/D9 and the current dasha)
+# pass a projection: top-level sections it leaves out are never computed, only
+# its vargas are generated, and dotted paths inside sections are trimmed from
+# the finished twin.
+
+# Top-level sections of the enhanced twin
+TWIN_SECTIONS = ('meta', 'vargas', 'arudha_padas', 'special_lagnas', 'dasha', 'chara_karakas')
+
+# Shorthand paths expanding to several fields
+TWIN_PATH_ALIASES = {
+    'dasha.current': tuple(f'dasha.{name}' for name in AS_OF_DASHA_FIELDS),
+}
+
+
+def _path_tree(paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """Nested dict of dotted paths; True marks a whole subtree."""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        *parents, leaf = path.split('.')
+        for part in parents:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = True
+    return tree
+
+
+def _project_node(value: Any, include: Optional[Dict[str, Any]], exclude: Dict[str, Any]) -> Any:
+    """Copy of value restricted to include (None = all) minus exclude; non-dicts are kept whole."""
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, child in value.items():
+        sub_include = None if include is None else include.get(key)
+        if include is not None and sub_include is None:
+            continue
+        sub_exclude = exclude.get(key, {})
+        if sub_exclude is True:
+            continue
+        if sub_include is True:
+            sub_include = None
+        projected[key] = child if sub_include is None and not sub_exclude else \
+            _project_node(child, sub_include, sub_exclude)
+    return projected
+
+
+@dataclass(frozen=True)
+class TwinProjection:
+    """
+    Sparse fieldset of the Digital Twin.
+
+    include/exclude are dotted paths ("meta", "dasha.current", "dasha.periods");
+    include=None means everything. vargas lists the varga charts to generate.
+    """
+    include: Optional[Tuple[str, ...]] = None
+    exclude: Tuple[str, ...] = ()
+    vargas: Tuple[str, ...] = tuple(VARGA_CODES)
+
+    @classmethod
+    def parse(
+        cls,
+        include: Optional[str] = None,
+        exclude: Optional[str] = None,
+        vargas: Optional[str] = None,
+        sections: Tuple[str, ...] = TWIN_SECTIONS
+    ) -> 'TwinProjection':
+        """
+        Build a projection from comma-separated query values.
+
+        Args:
+            include: e.g. "meta,dasha.current"
+            exclude: e.g. "dasha.periods"
+            vargas: e.g. "D1,D9" (kept in VARGA_CODES order)
+            sections: Valid top-level names (TWIN_SECTIONS for the twin)
+
+        Raises:
+            ValueError: On unknown sections or varga codes
+        """
+        def split(value: Optional[str]) -> Tuple[str, ...]:
+            paths = []
+            for path in (part.strip() for part in (value or '').split(',')):
+                if path:
+                    paths.extend(TWIN_PATH_ALIASES.get(path, (path,)))
+            unknown = sorted({path.split('.')[0] for path in paths} - set(sections))
+            if unknown:
+                raise ValueError(f"Unknown field(s) {unknown}; expected one of {list(sections)}")
+            return tuple(paths)
+
+        codes = tuple(VARGA_CODES)
+        if vargas:
+            requested = {code.strip().upper() for code in vargas.split(',') if code.strip()}
+            unknown = sorted(requested - set(VARGA_CODES))
+            if unknown:
+                raise ValueError(f"Unknown varga(s) {unknown}; expected codes from {VARGA_CODES}")
+            codes = tuple(code for code in VARGA_CODES if code in requested)
+
+        return cls(include=split(include) if include else None, exclude=split(exclude), vargas=codes)
+
+    @property
+    def is_full(self) -> bool:
+        """True if the projection selects the whole twin."""
+        return self.include is None and not self.exclude and self.vargas == tuple(VARGA_CODES)
+
+    def wants(self, path: str) -> bool:
+        """True if any part of the field at a dotted path is selected (i.e. it must be computed)."""
+        if any(path == excluded or path.startswith(excluded + '.') for excluded in self.exclude):
+            return False
+        if self.include is None:
+            return True
+        return any(
+            included == path or included.startswith(path + '.') or path.startswith(included + '.')
+            for included in self.include
+        )
+
+    def computed_sections(self) -> Tuple[str, ...]:
+        """Top-level sections the engine computes for this projection."""
+        return tuple(section for section in TWIN_SECTIONS if self.wants(section))
+
+    def computed_vargas(self) -> Tuple[str, ...]:
+        """Varga charts the engine generates (for the vargas or arudha_padas sections)."""
+        return tuple(
+            code for code in self.vargas
+            if self.wants(f'vargas.{code}') or self.wants(f'arudha_padas.{code}')
+        )
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Trim data to the projection.
+
+        Only dicts along projected paths are copied; data is not modified and
+        unchanged subtrees are shared with it.
+        """
+        if self.include is None and not self.exclude:
+            return data
+        include = None if self.include is None else _path_tree(self.include)
+        return _project_node(data, include, _path_tree(self.exclude))
+
+
+FULL_PROJECTION = TwinProjection()
+
+
+# =============================================================================
+# INCREMENTAL DELTA (small birth-time shifts)
+# =============================================================================
+# Rectification tools move the birth time by minutes. Within DELTA_MAX_SHIFT_MINUTES
+# the slow bodies move by hundredths of a degree, so they are reused as-is and only
+# the fast bodies and the ascendant are advanced by their Swiss Ephemeris motion.
+
+DELTA_MAX_SHIFT_MINUTES = 120
+
+# Bodies advanced on a shift; all others (Jupiter, Saturn, nodes) are reused
+DELTA_FAST_PLANETS = {
+    'Sun': swe.SUN,
+    'Moon': swe.MOON,
+    'Mars': swe.MARS,
+    'Mercury': swe.MERCURY,
+    'Venus': swe.VENUS,
+}
+
+# Twin fields compared by diff_digital_twins
+_DIFF_PLANET_FIELDS = ('sign_name', 'house_occupied', 'nakshatra', 'nakshatra_pada', 'dignity_state')
+
+
+@dataclass
+class TwinDelta:
+    """Result of shift_digital_twin."""
+    context: ChartContext          # Context of the shifted chart
+    twin: Dict[str, Any]           # Digital Twin of the shifted chart
+    diff: Dict[str, Any]           # What changed (see diff_digital_twins)
+    incremental: bool              # False if the shift fell back to a full recompute
+
+
+def _sidereal_motion(body_delta: float, chart: ChartData, new_jd: float) -> float:
+    """Convert tropical motion between chart.julian_day and new_jd to the chart's sidereal frame."""
+    frame = 'Raman' if chart.ayanamsa == 'Raman' else 'True_Chitrapaksha'
+    precession = get_ayanamsa_value(new_jd, frame) - get_ayanamsa_value(chart.julian_day, frame)
+    return body_delta - precession
+
+
+def _tropical_delta(start: float, end: float) -> float:
+    """Signed shortest-arc difference end - start in degrees."""
+    return (end - start + 180.0) % 360.0 - 180.0
+
+
+def shift_chart_context(
+    context: ChartContext,
+    new_birth_datetime: datetime.datetime
+) -> ChartContext:
+    """
+    Build the ChartContext for the same native born at a nearby time.
+
+    Advances the ascendant and DELTA_FAST_PLANETS by their motion between the
+    two Julian Days and keeps the slow bodies. The varga position memo is
+    carried over for the unchanged longitudes, and the sunrise if the new
+    birth falls between the same two sunrises.
+
+    Raises:
+        ValueError: If the shift exceeds DELTA_MAX_SHIFT_MINUTES
+    """
+    chart = context.chart
+    shift_minutes = (new_birth_datetime - chart.birth_datetime).total_seconds() / 60.0
+    if abs(shift_minutes) > DELTA_MAX_SHIFT_MINUTES:
+        raise ValueError(
+            f"Shift of {shift_minutes:.0f} min exceeds {DELTA_MAX_SHIFT_MINUTES} min"
+        )
+
+    new_jd = chart.julian_day + shift_minutes / 1440.0
+
+    # Ascendant (all house cusps move with it)
+    asc_old = swe.houses(chart.julian_day, chart.latitude, chart.longitude, b'E')[1][0]
+    asc_new = swe.houses(new_jd, chart.latitude, chart.longitude, b'E')[1][0]
+    asc_shift = _sidereal_motion(_tropical_delta(asc_old, asc_new), chart, new_jd)
+
+    houses = []
+    for house in chart.houses:
+        house_longitude = normalize_longitude(house.abs_longitude + asc_shift)
+        sign, degrees = longitude_to_sign_degrees(house_longitude)
+        houses.append(HousePosition(
+            house_number=house.house_number,
+            abs_longitude=house_longitude,
+            sign=sign,
+            sign_degrees=degrees,
+            lord=SIGN_LORDS.get(sign, '')
+        ))
+    house_signs = {house.house_number: house.sign for house in houses}
+    asc_idx = SIGN_INDEX.get(houses[0].sign, 0) if houses else 0
+
+    planets = []
+    kept_longitudes = set()
+    for planet in chart.planets:
+        if planet.name in DELTA_FAST_PLANETS:
+            body = DELTA_FAST_PLANETS[planet.name]
+            motion = _tropical_delta(swe.calc_ut(chart.julian_day, body)[0][0], swe.calc_ut(new_jd, body)[0][0])
+            planet_longitude = normalize_longitude(planet.abs_longitude + _sidereal_motion(motion, chart, new_jd))
+        else:
+            planet_longitude = planet.abs_longitude
+            kept_longitudes.add(planet_longitude)
+
+        sign, degrees = longitude_to_sign_degrees(planet_longitude)
+        nakshatra, pada = longitude_to_nakshatra(planet_longitude)
+        house_num = (SIGN_INDEX[sign] - asc_idx) % 12 + 1
+        planets.append(PlanetPosition(
+            name=planet.name,
+            abs_longitude=planet_longitude,
+            sign=sign,
+            sign_degrees=degrees,
+            nakshatra=nakshatra,
+            nakshatra_pada=pada,
+            house=house_num,
+            varga_signs=(
+                planet.varga_signs if planet_longitude == planet.abs_longitude
+                else calculate_all_vargas(planet_longitude)
+            ),
+            sign_lord=SIGN_LORDS.get(sign, ''),
+            nakshatra_lord=NAKSHATRA_LORDS.get(nakshatra, ''),
+            houses_owned=get_houses_owned(planet.name, house_signs),
+            dignity=get_planet_dignity(planet.name, sign, degrees),
+            aspects_giving=get_aspects_giving(planet.name, house_num)
+        ))
+    link_chart_positions(planets, houses)
+
+    shifted = ChartData(
+        birth_datetime=new_birth_datetime,
+        latitude=chart.latitude,
+        longitude=chart.longitude,
+        timezone=chart.timezone,
+        ayanamsa=chart.ayanamsa,
+        julian_day=new_jd,
+        ayanamsa_delta=chart.ayanamsa_delta,
+        planets=planets,
+        houses=houses,
+        ascendant_sign=houses[0].sign if houses else chart.ascendant_sign,
+        ascendant_degrees=houses[0].sign_degrees if houses else chart.ascendant_degrees
+    )
+
+    cache: Dict[str, Any] = {
+        'varga_positions': {
+            key: position for key, position in context.varga_positions.items()
+            if key[0] in kept_longitudes
+        }
+    }
+    sunrise_window = context._cache.get('sunrise_window')
+    if sunrise_window is not None:
+        sunrise, next_sunrise = sunrise_window
+        if next_sunrise is not None and sunrise <= new_jd < next_sunrise:
+            cache['sunrise_window'] = sunrise_window
+
+    return ChartContext(chart=shifted, tz_offset_hours=context.tz_offset_hours, _cache=cache)
+
+
+def diff_digital_twins(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare two Digital Twins of the same native.
+
+    Returns:
+        {
+            "vargas": {"D9": {"ascendant": [old_sign, new_sign],
+                              "planets": {"Moon": {"sign_name": [old, new], ...}}}},
+            "arudha_padas": {"D1": {"A1": [old_sign, new_sign]}},
+            "special_lagnas": {"hora_lagna": [old_sign, new_sign]}
+        }
+        Only changed entries are present; an empty dict means no visible change.
+    """
+    diff: Dict[str, Any] = {}
+
+    vargas_diff = {}
+    for varga_code, new_varga in new.get("vargas", {}).items():
+        old_varga = old.get("vargas", {}).get(varga_code)
+        if old_varga is None:
+            continue
+        varga_diff: Dict[str, Any] = {}
+
+        old_asc = old_varga["ascendant"]["sign_name"]
+        new_asc = new_varga["ascendant"]["sign_name"]
+        if old_asc != new_asc:
+            varga_diff["ascendant"] = [old_asc, new_asc]
+
+        old_planets = {p["name"]: p for p in old_varga["planets"]}
+        planets_diff = {}
+        for planet in new_varga["planets"]:
+            previous = old_planets.get(planet["name"])
+            if previous is None:
+                continue
+            changes = {
+                key: [previous.get(key), planet.get(key)]
+                for key in _DIFF_PLANET_FIELDS
+                if previous.get(key) != planet.get(key)
+            }
+            if changes:
+                planets_diff[planet["name"]] = changes
+        if planets_diff:
+            varga_diff["planets"] = planets_diff
+
+        if varga_diff:
+            vargas_diff[varga_code] = varga_diff
+    if vargas_diff:
+        diff["vargas"] = vargas_diff
+
+    arudha_diff = {}
+    for varga_code, new_padas in new.get("arudha_padas", {}).items():
+        old_padas = old.get("arudha_padas", {}).get(varga_code, {})
+        changes = {
+            pada: [old_padas[pada]["sign_name"], value["sign_name"]]
+            for pada, value in new_padas.items()
+            if pada in old_padas and old_padas[pada]["sign_name"] != value["sign_name"]
+        }
+        if changes:
+            arudha_diff[varga_code] = changes
+    if arudha_diff:
+        diff["arudha_padas"] = arudha_diff
+
+    old_lagnas = old.get("special_lagnas", {})
+    lagnas_diff = {
+        name: [old_lagnas[name]["sign_name"], value["sign_name"]]
+        for name, value in new.get("special_lagnas", {}).items()
+        if isinstance(value, dict) and isinstance(old_lagnas.get(name), dict)
+        and old_lagnas[name]["sign_name"] != value["sign_name"]
+    }
+    if lagnas_diff:
+        diff["special_lagnas"] = lagnas_diff
+
+    return diff
+
+
+def _shift_varga_chart(
+    varga: Dict[str, Any],
+    chart: ChartData,
+    varga_code: str,
+    moved: Set[str],
+    position_cache: Dict[Tuple[float, str], Tuple[str, float]]
+) -> Optional[Dict[str, Any]]:
+    """
+    _generate_varga_chart(chart, varga_code) from the varga chart of the unshifted chart.
+
+    Houses, ownership, aspects and conjunctions depend only on signs: if the
+    ascendant and every planet keep their varga sign, only the degrees,
+    nakshatras and dignities of the ascendant and the moved planets are
+    updated. Returns None if a sign changed.
+    """
+    asc_longitude = chart.houses[0].abs_longitude if chart.houses else 0
+    asc_sign, asc_degrees = _varga_position(position_cache, asc_longitude, varga_code)
+    if asc_sign != varga["ascendant"]["sign_name"] or len(varga["planets"]) != len(chart.planets):
+        return None
+
+    planets_data = []
+    for planet, planet_data in zip(chart.planets, varga["planets"]):
+        if planet.name != planet_data["name"]:
+            return None
+        if planet.name not in moved:
+            planets_data.append(dict(planet_data))
+            continue
+
+        varga_sign, varga_degrees = _varga_position(position_cache, planet.abs_longitude, varga_code)
+        if varga_sign != planet_data["sign_name"]:
+            return None
+        planets_data.append({
+            **planet_data,
+            "absolute_degree": round(planet.abs_longitude, 4),
+            "relative_degree": round(varga_degrees, 2),
+            "nakshatra": planet.nakshatra,
+            "nakshatra_lord": planet.nakshatra_lord,
+            "nakshatra_pada": planet.nakshatra_pada,
+            "dignity_state": get_planet_dignity(planet.name, varga_sign, varga_degrees),
+        })
+
+    return {
+        "ascendant": {**varga["ascendant"], "degrees": round(asc_degrees, 2)},
+        "planets": planets_data,
+        "houses": [dict(house) for house in varga["houses"]]
+    }
+
+
+def _shift_natal_twin(
+    context: ChartContext,
+    base_twin: Dict[str, Any],
+    new_context: ChartContext
+) -> Dict[str, Any]:
+    """
+    build_digital_twin(new_context) reusing what base_twin (of context) already has.
+
+    Varga charts (and their arudha padas) are regenerated only where a sign
+    changed; the others are updated in place by _shift_varga_chart.
+    """
+    old_planets = {planet.name: planet.abs_longitude for planet in context.chart.planets}
+    moved = {
+        planet.name for planet in new_context.chart.planets
+        if old_planets.get(planet.name) != planet.abs_longitude
+    }
+
+    chart = new_context.chart
+    vargas_data = {}
+    regenerated = {}
+    for varga_code, varga in base_twin["vargas"].items():
+        shifted = _shift_varga_chart(varga, chart, varga_code, moved, new_context.varga_positions)
+        if shifted is None:
+            shifted = regenerated[varga_code] = _generate_varga_chart(
+                chart, varga_code, new_context.varga_positions
+            )
+        vargas_data[varga_code] = shifted
+
+    arudha_padas = calculate_arudha_section(regenerated) if regenerated else {}
+    twin = {
+        "meta": _twin_meta(new_context),
+        "vargas": vargas_data,
+        "arudha_padas": {
+            varga_code: arudha_padas.get(varga_code) or {
+                pada: dict(entry) for pada, entry in base_twin["arudha_padas"][varga_code].items()
+            }
+            for varga_code in vargas_data
+        },
+        "special_lagnas": new_context.special_lagnas,
+    }
+    twin['meta']['generated_at'] = datetime.datetime.now().isoformat()
+    return twin
+
+
+@phase("twin_shift")
+def shift_digital_twin(
+    context: ChartContext,
+    new_birth_datetime: datetime.datetime,
+    base_twin: Optional[Dict[str, Any]] = None
+) -> TwinDelta:
+    """
+    Digital Twin for a nearby birth time, plus what changed.
+
+    Uses shift_chart_context within DELTA_MAX_SHIFT_MINUTES and a full
+    build_chart_context beyond it. The twin has the build_digital_twin
+    sections (no dasha/retrograde enrichment); on the incremental path it is
+    derived from base_twin (see _shift_natal_twin).
+
+    Args:
+        context: ChartContext of the original chart
+        new_birth_datetime: New birth date and time (local time)
+        base_twin: Twin already built from context, if the caller has it
+
+    Returns:
+        TwinDelta with the new context, twin and diff against base_twin
+    """
+    if base_twin is None:
+        base_twin = build_digital_twin(context)
+
+    try:
+        new_context = shift_chart_context(context, new_birth_datetime)
+        incremental = True
+    except ValueError:
+        chart = context.chart
+        new_context = build_chart_context(
+            birth_datetime=new_birth_datetime,
+            latitude=chart.latitude,
+            longitude=chart.longitude,
+            tz_offset_hours=context.tz_offset_hours,
+            ayanamsa=chart.ayanamsa
+        )
+        incremental = False
+
+    if incremental and "vargas" in base_twin and "arudha_padas" in base_twin:
+        twin = _shift_natal_twin(context, base_twin, new_context)
+    else:
+        twin = build_digital_twin(new_context)
+    return TwinDelta(
+        context=new_context,
+        twin=twin,
+        diff=diff_digital_twins(base_twin, twin),
+        incremental=incremental
+    )
+
+
 # =============================================================================
 # TESTING
 # =============================================================================
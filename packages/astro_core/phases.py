@@ -0,0 +1,116 @@
+"""
+Phase Timing
+============
+Lightweight instrumentation hooks for the calculation pipeline.
+
+Code marks its phases with `with phase("ephemeris"): ...` (or decorates a
+function with `@phase("twin_generation")`) and counts errors it deliberately
+swallows with `record_error("...")`. Neither depends on a metrics library: by
+default they are no-ops, the host application registers observers
+(add_observers) to feed its metrics, and work running in another process is
+captured with collect_phases() and replayed in the host (replay).
+
+Nested phases of the same name (e.g. a twin built inside a twin builder)
+are timed once, by the outermost block.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+PhaseObserver = Callable[[str, float], None]
+ErrorObserver = Callable[[str], None]
+
+_phase_observers: List[PhaseObserver] = []
+_error_observers: List[ErrorObserver] = []
+
+
+@dataclass
+class PhaseRecord:
+    """Phases and errors captured by collect_phases()."""
+    phases: List[Tuple[str, float]] = field(default_factory=list)   # (name, seconds)
+    errors: List[str] = field(default_factory=list)
+
+
+_record: ContextVar[Optional[PhaseRecord]] = ContextVar("astro_core_phase_record", default=None)
+_active: ContextVar[Tuple[str, ...]] = ContextVar("astro_core_active_phases", default=())
+
+
+def add_observers(on_phase: Optional[PhaseObserver], on_error: Optional[ErrorObserver] = None) -> None:
+    """Register process-wide observers for phase durations and/or errors (idempotent)."""
+    if on_phase is not None and on_phase not in _phase_observers:
+        _phase_observers.append(on_phase)
+    if on_error is not None and on_error not in _error_observers:
+        _error_observers.append(on_error)
+
+
+def remove_observers(on_phase: Optional[PhaseObserver], on_error: Optional[ErrorObserver] = None) -> None:
+    """Unregister observers added with add_observers."""
+    if on_phase in _phase_observers:
+        _phase_observers.remove(on_phase)
+    if on_error in _error_observers:
+        _error_observers.remove(on_error)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the block as phase `name` (no-op unless observed or collected)."""
+    if (_record.get() is None and not _phase_observers) or name in _active.get():
+        yield
+        return
+
+    token = _active.set(_active.get() + (name,))
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        record_phase(name, time.perf_counter() - start)
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Report a phase duration measured by the caller (e.g. one step of an iterator)."""
+    record = _record.get()
+    if record is not None:
+        record.phases.append((name, seconds))
+    else:
+        for observer in _phase_observers:
+            observer(name, seconds)
+
+
+def record_error(name: str) -> None:
+    """Count a handled error (one that does not propagate) under `name`."""
+    record = _record.get()
+    if record is not None:
+        record.errors.append(name)
+    else:
+        for observer in _error_observers:
+            observer(name)
+
+
+@contextmanager
+def collect_phases() -> Iterator[PhaseRecord]:
+    """
+    Capture phases and errors of the block instead of reporting them.
+
+    Usage (in a worker process):
+        with collect_phases() as record:
+            result = compute(...)
+        return result, record
+    """
+    record = PhaseRecord()
+    token = _record.set(record)
+    try:
+        yield record
+    finally:
+        _record.reset(token)
+
+
+def replay(record: PhaseRecord) -> None:
+    """Report a captured PhaseRecord to the installed observers."""
+    for name, elapsed in record.phases:
+        record_phase(name, elapsed)
+    for name in record.errors:
+        record_error(name)
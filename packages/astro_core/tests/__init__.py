@@ -0,0 +1 @@
+"""Tests for the astro_core engine (Golden Math)."""
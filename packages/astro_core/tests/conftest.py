@@ -0,0 +1,91 @@
+"""
+Shared fixtures for astro_core tests.
+
+Charts are assembled directly from absolute longitudes so the tests do not
+need jyotishganit's ephemeris download.
+"""
+
+import datetime
+
+import pytest
+
+from astro_core.engine import (
+    ChartData,
+    HousePosition,
+    PlanetPosition,
+    SIGN_LORDS,
+    calculate_all_vargas,
+    longitude_to_nakshatra,
+    longitude_to_sign_degrees,
+    NAKSHATRA_LORDS,
+)
+
+
+# Vadim (1977-10-25 06:28 Sortavala) - approximate sidereal longitudes
+VADIM_LONGITUDES = {
+    'Sun': 189.5082,
+    'Moon': 348.4402,
+    'Mars': 97.1885,
+    'Mercury': 193.5746,
+    'Jupiter': 69.2141,
+    'Venus': 157.8473,
+    'Saturn': 130.0913,
+    'Rahu': 177.2291,
+    'Ketu': 357.2291,
+}
+VADIM_ASCENDANT = 173.48
+
+
+def build_chart(planet_longitudes, asc_longitude, birth_datetime=None) -> ChartData:
+    """Build a whole-sign ChartData from absolute longitudes."""
+    asc_sign_idx = int(asc_longitude // 30)
+
+    houses = []
+    for i in range(12):
+        house_longitude = ((asc_sign_idx + i) % 12) * 30 + (asc_longitude % 30)
+        sign, degrees = longitude_to_sign_degrees(house_longitude)
+        houses.append(HousePosition(
+            house_number=i + 1,
+            abs_longitude=house_longitude,
+            sign=sign,
+            sign_degrees=degrees,
+            lord=SIGN_LORDS[sign],
+        ))
+
+    planets = []
+    for name, longitude in planet_longitudes.items():
+        sign, degrees = longitude_to_sign_degrees(longitude)
+        nakshatra, pada = longitude_to_nakshatra(longitude)
+        planets.append(PlanetPosition(
+            name=name,
+            abs_longitude=longitude,
+            sign=sign,
+            sign_degrees=degrees,
+            nakshatra=nakshatra,
+            nakshatra_pada=pada,
+            house=(int(longitude // 30) - asc_sign_idx) % 12 + 1,
+            varga_signs=calculate_all_vargas(longitude),
+            sign_lord=SIGN_LORDS[sign],
+            nakshatra_lord=NAKSHATRA_LORDS[nakshatra],
+        ))
+
+    asc_sign, asc_degrees = longitude_to_sign_degrees(asc_longitude)
+    return ChartData(
+        birth_datetime=birth_datetime or datetime.datetime(1977, 10, 25, 6, 28),
+        latitude=61.7,
+        longitude=30.7,
+        timezone='UTC+3.0',
+        ayanamsa='Lahiri',
+        julian_day=2443441.6444,
+        ayanamsa_delta=0.0,
+        planets=planets,
+        houses=houses,
+        ascendant_sign=asc_sign,
+        ascendant_degrees=asc_degrees,
+    )
+
+
+@pytest.fixture
+def vadim_chart() -> ChartData:
+    """Synthetic D1 chart with Vadim's positions."""
+    return build_chart(VADIM_LONGITUDES, VADIM_ASCENDANT)
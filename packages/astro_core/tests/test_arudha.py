@@ -0,0 +1,87 @@
+"""
+Tests for Arudha Padas (A1-A12) across all vargas.
+"""
+
+import numpy as np
+
+from astro_core.engine import (
+    PLANET_ORDER,
+    SIGNS,
+    SIGN_LORDS,
+    VARGA_CODES,
+    _generate_varga_chart,
+    calculate_arudha_padas,
+    calculate_arudha_section,
+)
+
+
+def _reference_pada(asc_idx: int, planet_signs: dict, house: int) -> int:
+    """Straightforward per-house Arudha calculation used as the oracle."""
+    house_sign = (asc_idx + house - 1) % 12
+    lord_sign = planet_signs[SIGN_LORDS[SIGNS[house_sign]]]
+    pada = (lord_sign + (lord_sign - house_sign)) % 12
+    distance = (pada - house_sign) % 12
+    if distance == 0:
+        pada = (house_sign + 9) % 12
+    elif distance == 6:
+        pada = (house_sign + 3) % 12
+    return pada
+
+
+class TestCalculateArudhaPadas:
+    """Vectorized kernel against the per-house oracle."""
+
+    def test_matches_reference_for_random_charts(self):
+        rng = np.random.default_rng(26)
+        asc = rng.integers(0, 12, size=500)
+        planets = rng.integers(0, 12, size=(500, len(PLANET_ORDER)))
+
+        padas = calculate_arudha_padas(asc, planets)
+
+        assert padas.shape == (500, 12)
+        for row in range(500):
+            signs = dict(zip(PLANET_ORDER, planets[row]))
+            for house in range(1, 13):
+                assert padas[row, house - 1] == _reference_pada(asc[row], signs, house)
+
+    def test_lord_in_own_house_moves_to_tenth(self):
+        # Aries lagna, Mars in Aries: A1 would fall in Aries itself -> Capricorn
+        planets = np.zeros((1, len(PLANET_ORDER)), dtype=int)
+        padas = calculate_arudha_padas(np.array([0]), planets)
+        assert SIGNS[padas[0, 0]] == 'Capricorn'
+
+    def test_lord_in_fourth_moves_to_fourth(self):
+        # Aries lagna, Mars in Cancer: A1 would fall in Libra (7th) -> Cancer
+        planets = np.zeros((1, len(PLANET_ORDER)), dtype=int)
+        planets[0, PLANET_ORDER.index('Mars')] = 3
+        padas = calculate_arudha_padas(np.array([0]), planets)
+        assert SIGNS[padas[0, 0]] == 'Cancer'
+
+
+class TestArudhaSection:
+    """Digital Twin "arudha_padas" section."""
+
+    def test_section_covers_all_vargas_and_padas(self, vadim_chart):
+        vargas = {code: _generate_varga_chart(vadim_chart, code) for code in VARGA_CODES}
+        section = calculate_arudha_section(vargas)
+
+        assert list(section.keys()) == VARGA_CODES
+        for code in VARGA_CODES:
+            assert list(section[code].keys()) == [f"A{h}" for h in range(1, 13)]
+
+    def test_section_matches_varga_positions(self, vadim_chart):
+        vargas = {code: _generate_varga_chart(vadim_chart, code) for code in VARGA_CODES}
+        section = calculate_arudha_section(vargas)
+
+        for code, chart in vargas.items():
+            asc_idx = chart["ascendant"]["sign_id"] - 1
+            signs = {p["name"]: p["sign_id"] - 1 for p in chart["planets"]}
+            for house in range(1, 13):
+                pada = section[code][f"A{house}"]
+                expected = _reference_pada(asc_idx, signs, house)
+                assert pada["sign_id"] == expected + 1
+                assert pada["sign_name"] == SIGNS[expected]
+                assert pada["house"] == (expected - asc_idx) % 12 + 1
+
+    def test_empty_vargas(self):
+        assert calculate_arudha_section({}) == {}
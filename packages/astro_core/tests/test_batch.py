@@ -0,0 +1,129 @@
+"""
+Tests for the shared-memory batch executor.
+"""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from astro_core.batch import (
+    BATCH_BODIES,
+    BODY_INDEX,
+    VARGA_INDEX,
+    BatchBirth,
+    compute_batch,
+)
+from astro_core.engine import SIGNS, VARGA_CODES, get_varga_sign
+
+
+def _births(count, seed=7):
+    rng = random.Random(seed)
+    base = datetime.datetime(1950, 1, 1)
+    return [
+        BatchBirth(
+            birth_datetime=base + datetime.timedelta(minutes=rng.randrange(0, 60 * 24 * 365 * 60)),
+            latitude=rng.uniform(-60, 60),
+            longitude=rng.uniform(-180, 180),
+            tz_offset_hours=rng.choice([-5.0, 0.0, 3.0, 5.5]),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_inline_batch_shapes_and_consistency():
+    births = _births(20)
+
+    with compute_batch(births, workers=1) as result:
+        assert result.longitudes.shape == (20, len(BATCH_BODIES))
+        assert result.varga_signs.shape == (20, len(BATCH_BODIES), len(VARGA_CODES))
+        assert result.errors == {}
+
+        # D1 varga column equals the sign index column
+        np.testing.assert_array_equal(result.varga_signs[:, :, VARGA_INDEX['D1']], result.sign_indices)
+        # Ketu opposite Rahu
+        diff = (result.longitudes[:, BODY_INDEX['Ketu']] - result.longitudes[:, BODY_INDEX['Rahu']]) % 360
+        np.testing.assert_allclose(diff, 180.0)
+
+        for row in range(3):
+            for body in ('Ascendant', 'Moon', 'Saturn'):
+                longitude = result.longitudes[row, BODY_INDEX[body]]
+                for code in ('D9', 'D60'):
+                    expected = get_varga_sign(longitude, code)
+                    assert SIGNS[result.varga_signs[row, BODY_INDEX[body], VARGA_INDEX[code]]] == expected
+
+
+def test_pool_matches_inline():
+    births = _births(40, seed=11)
+
+    with compute_batch(births, ayanamsa='Raman', workers=1) as inline:
+        with compute_batch(births, ayanamsa='Raman', workers=3, chunk_size=7) as pooled:
+            np.testing.assert_array_equal(pooled.longitudes, inline.longitudes)
+            np.testing.assert_array_equal(pooled.varga_signs, inline.varga_signs)
+
+
+def test_ayanamsa_is_per_batch():
+    births = _births(5)
+
+    with compute_batch(births, ayanamsa='Lahiri', workers=1) as lahiri:
+        with compute_batch(births, ayanamsa='Raman', workers=2, chunk_size=2) as raman:
+            shift = (raman.longitudes - lahiri.longitudes) % 360
+            # Raman ayanamsa is ~1.4° smaller than Lahiri in the 20th century
+            assert np.all((shift > 1.0) & (shift < 2.0))
+
+
+# AstroCore.calculate output (ayanamsa='Raman') recorded in
+# backend/app/astro/tests/fixtures/digital_twin_fixture.json and
+# docs/vadim_digital_twin_full.json: birth, D1 absolute longitudes, and the
+# Raman delta the engine added to its True Chitra Paksha positions
+ENGINE_REFERENCES = [
+    (
+        BatchBirth(datetime.datetime(1977, 10, 25, 6, 28), 61.7, 30.69, 3.0),
+        {'Sun': 189.5082, 'Moon': 348.4402, 'Mars': 97.1885, 'Mercury': 193.5746,
+         'Jupiter': 74.0394, 'Venus': 167.9185, 'Saturn': 126.4589},
+        1.425161,
+    ),
+    (
+        BatchBirth(datetime.datetime(1977, 10, 24, 6, 28), 61.70274, 30.691231, 3.0),
+        {'Sun': 188.512, 'Moon': 335.7086, 'Mars': 96.7499, 'Mercury': 191.9468,
+         'Jupiter': 74.0401, 'Venus': 166.6758, 'Saturn': 126.3787},
+        1.425146,
+    ),
+]
+
+
+@pytest.mark.parametrize("ayanamsa", ['Raman', 'Lahiri'])
+def test_positions_match_engine(ayanamsa):
+    births = [birth for birth, _, _ in ENGINE_REFERENCES]
+
+    with compute_batch(births, ayanamsa=ayanamsa, workers=1) as result:
+        for row, (_, longitudes, raman_delta) in enumerate(ENGINE_REFERENCES):
+            # The engine's 'Lahiri' is its unshifted True Chitra Paksha frame
+            shift = 0.0 if ayanamsa == 'Raman' else raman_delta
+            for name, longitude in longitudes.items():
+                assert result.longitudes[row, BODY_INDEX[name]] == pytest.approx(longitude - shift, abs=1e-3), name
+
+
+def test_failed_rows_are_reported():
+    births = _births(4)
+    births[2] = BatchBirth(birth_datetime=None, latitude=0.0, longitude=0.0, tz_offset_hours=0.0)
+
+    with compute_batch(births, workers=1) as result:
+        assert list(result.errors) == [2]
+        assert "TypeError" in result.errors[2]
+        assert not result.longitudes[2].any()
+        assert result.longitudes[3].any()
+
+
+def test_close_releases_buffers():
+    result = compute_batch(_births(2), workers=1)
+    result.close()
+
+    assert result.longitudes is None
+    result.close()  # idempotent
+
+
+def test_empty_batch():
+    with compute_batch([], workers=4) as result:
+        assert result.longitudes.shape == (0, len(BATCH_BODIES))
@@ -0,0 +1,101 @@
+"""
+Tests for the compact Digital Twin wire format (astro_core.compact).
+"""
+
+import copy
+import datetime
+import json
+
+import pytest
+
+from astro_core.compact import COMPACT_VERSION, CompactFormatError, decode_twin, encode_twin
+from astro_core.engine import (
+    ChartContext,
+    TwinProjection,
+    build_digital_twin_enhanced,
+)
+
+
+@pytest.fixture
+def vadim_twin(vadim_chart):
+    return build_digital_twin_enhanced(ChartContext(chart=vadim_chart, tz_offset_hours=3.0), datetime.date(2026, 10, 18))
+
+
+# Native-library dasha shape (antardashas with pratyantardashas)
+NATIVE_DASHA = {
+    "birth_nakshatra": "Revati",
+    "birth_nakshatra_lord": "Mercury",
+    "nakshatra_pada": 2,
+    "current_mahadasha": "Venus",
+    "current_antardasha": "Sun",
+    "current_pratyantardasha": "Moon",
+    "first_dasha_balance_years": 4.12,
+    "periods": [{
+        "lord": "Venus", "years": 20.0, "start_date": "2000-01-01", "end_date": "2020-01-01",
+        "antardashas": [
+            {"lord": "Venus", "start_date": "2000-01-01", "end_date": "2003-05-01", "days": 1216,
+             "pratyantardashas": []},
+            {"lord": "Sun", "start_date": "2003-05-01", "end_date": "2004-05-01", "days": 366.0,
+             "pratyantardashas": [
+                 {"lord": "Sun", "start_date": "2003-05-01", "end_date": "2003-05-19"},
+                 {"lord": "Moon", "start_date": "2003-05-19", "end_date": "2003-06-19"},
+             ]},
+        ],
+    }],
+}
+
+
+def test_round_trip_full_twin(vadim_twin):
+    compact = encode_twin(vadim_twin)
+
+    assert compact["version"] == COMPACT_VERSION
+    assert compact["encoded"] == ["vargas", "arudha_padas", "special_lagnas", "dasha"]
+    decoded = decode_twin(json.loads(json.dumps(compact)))
+    assert decoded == vadim_twin
+    assert json.dumps(decoded) == json.dumps(vadim_twin)  # Same key order and value types
+
+
+def test_compact_is_much_smaller(vadim_twin):
+    verbose = len(json.dumps(vadim_twin, separators=(",", ":")))
+    compact = len(json.dumps(encode_twin(vadim_twin), separators=(",", ":")))
+
+    assert compact < verbose / 3
+
+
+def test_round_trip_native_dasha(vadim_twin):
+    twin = {**vadim_twin, "dasha": NATIVE_DASHA}
+
+    compact = encode_twin(twin)
+
+    assert "dasha" in compact["encoded"]
+    assert decode_twin(compact) == twin
+
+
+def test_round_trip_projections(vadim_twin):
+    for projection in (
+        TwinProjection.parse(include="meta,dasha.current,vargas", vargas="D1,D9"),
+        TwinProjection.parse(exclude="dasha.periods"),
+        TwinProjection.parse(include="vargas.D9.ascendant"),
+    ):
+        projected = projection.apply(vadim_twin)
+        assert decode_twin(encode_twin(projected)) == projected
+
+
+def test_unexpected_shapes_are_carried_verbatim(vadim_twin):
+    twin = copy.deepcopy(vadim_twin)
+    twin["vargas"]["D9"]["planets"][0]["note"] = "custom"
+    twin["vargas"]["D1"]["houses"][0]["lord"] = "Nobody"
+
+    compact = encode_twin(twin)
+
+    assert "vargas" not in compact["encoded"]
+    assert decode_twin(compact) == twin
+
+
+def test_decoder_rejects_unknown_versions(vadim_twin):
+    compact = encode_twin(vadim_twin)
+
+    with pytest.raises(CompactFormatError, match="version"):
+        decode_twin({**compact, "version": COMPACT_VERSION + 1})
+    with pytest.raises(CompactFormatError, match="not a compact twin"):
+        decode_twin(vadim_twin)
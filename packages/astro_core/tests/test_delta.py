@@ -0,0 +1,174 @@
+"""
+Tests for the incremental birth-time shift (shift_chart_context / shift_digital_twin).
+"""
+
+import datetime
+
+import pytest
+import swisseph as swe
+
+from astro_core import engine
+from astro_core.engine import (
+    DELTA_FAST_PLANETS,
+    DELTA_MAX_SHIFT_MINUTES,
+    ChartContext,
+    build_digital_twin,
+    diff_digital_twins,
+    shift_chart_context,
+    shift_digital_twin,
+)
+
+
+@pytest.fixture
+def vadim_context(vadim_chart) -> ChartContext:
+    return ChartContext(chart=vadim_chart, tz_offset_hours=3.0)
+
+
+def _planets(context):
+    return {p.name: p for p in context.chart.planets}
+
+
+def _sidereal(jd, body):
+    swe.set_sid_mode(swe.SIDM_TRUE_CITRA)
+    return swe.calc_ut(jd, body, swe.FLG_SIDEREAL)[0][0]
+
+
+def test_zero_shift_is_identity(vadim_context):
+    shifted = shift_chart_context(vadim_context, vadim_context.chart.birth_datetime)
+
+    for name, planet in _planets(shifted).items():
+        assert planet.abs_longitude == pytest.approx(_planets(vadim_context)[name].abs_longitude, abs=1e-9)
+    assert shifted.chart.houses[0].abs_longitude == pytest.approx(
+        vadim_context.chart.houses[0].abs_longitude, abs=1e-9
+    )
+    assert diff_digital_twins(build_digital_twin(vadim_context), build_digital_twin(shifted)) == {}
+
+
+def test_fast_planets_follow_ephemeris_motion(vadim_context):
+    birth = vadim_context.chart.birth_datetime
+    shifted = shift_chart_context(vadim_context, birth + datetime.timedelta(minutes=30))
+    old, new = _planets(vadim_context), _planets(shifted)
+    jd_old, jd_new = vadim_context.chart.julian_day, shifted.chart.julian_day
+
+    assert jd_new - jd_old == pytest.approx(30 / 1440)
+    moon_motion = _sidereal(jd_new, swe.MOON) - _sidereal(jd_old, swe.MOON)
+    assert new['Moon'].abs_longitude - old['Moon'].abs_longitude == pytest.approx(moon_motion, abs=1e-6)
+
+    for name in ('Jupiter', 'Saturn', 'Rahu', 'Ketu'):
+        assert new[name].abs_longitude == old[name].abs_longitude
+        assert new[name].varga_signs is old[name].varga_signs
+
+    # Ascendant moves roughly a sign per two hours
+    asc_motion = shifted.chart.houses[0].abs_longitude - vadim_context.chart.houses[0].abs_longitude
+    assert 3 < asc_motion < 15
+
+
+def test_houses_reassigned_after_shift(vadim_context):
+    shifted = shift_chart_context(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=90)
+    )
+    asc_idx = int(shifted.chart.houses[0].abs_longitude // 30)
+
+    for planet in shifted.chart.planets:
+        assert planet.house == (int(planet.abs_longitude // 30) - asc_idx) % 12 + 1
+    assert sum(len(h.occupants) for h in shifted.chart.houses) == len(shifted.chart.planets)
+
+
+def test_shift_beyond_window_raises(vadim_context):
+    too_far = vadim_context.chart.birth_datetime + datetime.timedelta(minutes=DELTA_MAX_SHIFT_MINUTES + 1)
+
+    with pytest.raises(ValueError):
+        shift_chart_context(vadim_context, too_far)
+
+
+def test_varga_positions_carried_for_slow_planets(vadim_context):
+    build_digital_twin(vadim_context)
+    shifted = shift_chart_context(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=10)
+    )
+
+    kept = {key[0] for key in shifted.varga_positions}
+    slow = {p.abs_longitude for p in shifted.chart.planets if p.name in ('Jupiter', 'Saturn', 'Rahu', 'Ketu')}
+    assert kept == slow
+    assert shifted.varga_positions is not vadim_context.varga_positions
+
+
+def test_shift_digital_twin_diff_matches_twins(vadim_context):
+    base = build_digital_twin(vadim_context)
+    delta = shift_digital_twin(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=45), base
+    )
+
+    assert delta.incremental
+    assert delta.twin["meta"]["birth_datetime"] == "1977-10-25T07:13:00"
+    for varga_code, varga in delta.twin["vargas"].items():
+        old_asc = base["vargas"][varga_code]["ascendant"]["sign_name"]
+        changed = varga_code in delta.diff.get("vargas", {}) and "ascendant" in delta.diff["vargas"][varga_code]
+        assert changed == (old_asc != varga["ascendant"]["sign_name"])
+
+    # Virgo 23.5° rises into Libra: every D1 house shifts, slow planets keep their sign
+    assert delta.diff["vargas"]["D1"]["ascendant"] == ["Virgo", "Libra"]
+    assert delta.diff["vargas"]["D1"]["planets"]["Jupiter"] == {"house_occupied": [10, 9]}
+
+
+def _without_generated_at(twin):
+    return {**twin, "meta": {k: v for k, v in twin["meta"].items() if k != "generated_at"}}
+
+
+@pytest.mark.parametrize("minutes", [1, 10, 45, -30, 120])
+def test_incremental_twin_matches_full_build(vadim_context, minutes):
+    base = build_digital_twin(vadim_context)
+
+    delta = shift_digital_twin(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=minutes), base
+    )
+
+    expected = build_digital_twin(ChartContext(chart=delta.context.chart, tz_offset_hours=3.0))
+    assert _without_generated_at(delta.twin) == _without_generated_at(expected)
+
+
+def test_shift_reuses_sunrise_and_unchanged_vargas(vadim_context, monkeypatch):
+    base = build_digital_twin(vadim_context)
+    counts = {"calculate_all_vargas": 0, "calculate_sunrise_window": 0, "_generate_varga_chart": 0}
+    for name in counts:
+        original = getattr(engine, name)
+
+        def counted(*args, _name=name, _original=original, **kwargs):
+            counts[_name] += 1
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(engine, name, counted)
+
+    shifted = shift_chart_context(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=5)
+    )
+    moved_planet_vargas = counts["calculate_all_vargas"]
+    delta = shift_digital_twin(
+        vadim_context, vadim_context.chart.birth_datetime + datetime.timedelta(minutes=5), base
+    )
+
+    # Only the moved (fast) planets get new varga signs
+    assert moved_planet_vargas == len(DELTA_FAST_PLANETS)
+    # Both births follow the same sunrise
+    assert counts["calculate_sunrise_window"] == 0
+    assert shifted.sunrise_jd == vadim_context.sunrise_jd
+    # Only vargas where a sign changed are regenerated
+    sign_changes = {
+        code for code, varga_diff in delta.diff.get("vargas", {}).items()
+        if "ascendant" in varga_diff
+        or any("sign_name" in changes for changes in varga_diff.get("planets", {}).values())
+    }
+    assert counts["_generate_varga_chart"] == len(sign_changes) < len(base["vargas"])
+
+
+def test_shift_across_sunrise_recomputes_it(vadim_context):
+    sunrise, next_sunrise = vadim_context.sunrise_window
+    minutes_to_sunrise = (next_sunrise - vadim_context.chart.julian_day) * 1440.0
+
+    shifted = shift_chart_context(
+        vadim_context,
+        vadim_context.chart.birth_datetime + datetime.timedelta(minutes=minutes_to_sunrise + 5)
+    )
+
+    assert "sunrise_window" not in shifted._cache
+    assert shifted.sunrise_jd == pytest.approx(next_sunrise)
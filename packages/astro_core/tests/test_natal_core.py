@@ -0,0 +1,116 @@
+"""
+Tests for the natal core / as-of overlay split of the enhanced Digital Twin.
+"""
+
+import datetime
+
+import pytest
+
+from astro_core.engine import (
+    AS_OF_DASHA_FIELDS,
+    ChartContext,
+    apply_as_of_overlay,
+    base_twin_from_core,
+    build_digital_twin,
+    build_digital_twin_enhanced,
+    build_natal_core,
+    calculate_vimshottari_dasha_basic,
+    compute_as_of_overlay,
+    natal_core_hash,
+)
+
+
+@pytest.fixture
+def vadim_core(vadim_chart):
+    return build_natal_core(ChartContext(chart=vadim_chart, tz_offset_hours=3.0))
+
+
+def test_core_has_no_wall_clock_fields(vadim_core):
+    assert "generated_at" not in vadim_core["meta"]
+    for key in AS_OF_DASHA_FIELDS:
+        assert key not in vadim_core["dasha"]
+    assert vadim_core["dasha"]["periods"]
+    assert "chara_karakas" in vadim_core
+
+
+def test_core_hash_is_stable(vadim_chart, vadim_core):
+    again = build_natal_core(ChartContext(chart=vadim_chart, tz_offset_hours=3.0))
+
+    assert natal_core_hash(again) == natal_core_hash(vadim_core)
+    assert len(natal_core_hash(vadim_core)) == 64
+
+
+def test_core_hash_changes_with_birth_data(vadim_chart, vadim_core):
+    shifted = ChartContext(chart=vadim_chart, tz_offset_hours=4.0)
+
+    assert natal_core_hash(build_natal_core(shifted)) != natal_core_hash(vadim_core)
+
+
+@pytest.mark.parametrize("as_of", [
+    datetime.date(1980, 1, 1),
+    datetime.date(2001, 6, 15),
+    datetime.date(2026, 10, 18),
+    datetime.date(2060, 3, 3),
+])
+def test_overlay_matches_basic_dasha(vadim_core, as_of):
+    overlay = compute_as_of_overlay(vadim_core, as_of)
+
+    # Oracle: the basic calculator's "current" periods, evaluated at as_of
+    periods = calculate_vimshottari_dasha_basic(348.4402, datetime.datetime(1977, 10, 25, 6, 28))["periods"]
+    expected = next(p["lord"] for p in periods if p["start_date"] <= as_of.isoformat() <= p["end_date"])
+
+    assert overlay["as_of"] == as_of.isoformat()
+    assert overlay["dasha"]["current_mahadasha"] == expected
+    assert overlay["dasha"]["current_antardasha"] is not None
+
+
+def test_overlay_uses_nested_periods():
+    core = {"dasha": {"periods": [{
+        "lord": "Venus", "start_date": "2000-01-01", "end_date": "2020-01-01",
+        "antardashas": [
+            {"lord": "Venus", "start_date": "2000-01-01", "end_date": "2003-05-01", "pratyantardashas": []},
+            {"lord": "Sun", "start_date": "2003-05-01", "end_date": "2004-05-01", "pratyantardashas": [
+                {"lord": "Sun", "start_date": "2003-05-01", "end_date": "2003-05-19"},
+                {"lord": "Moon", "start_date": "2003-05-19", "end_date": "2003-06-19"},
+            ]},
+        ],
+    }]}}
+
+    overlay = compute_as_of_overlay(core, datetime.date(2003, 6, 1))
+
+    assert overlay["dasha"] == {
+        "current_mahadasha": "Venus",
+        "current_antardasha": "Sun",
+        "current_pratyantardasha": "Moon",
+    }
+
+
+def test_apply_overlay_does_not_mutate_core(vadim_core):
+    before = natal_core_hash(vadim_core)
+    overlay = compute_as_of_overlay(vadim_core, datetime.date(2026, 10, 18))
+
+    twin = apply_as_of_overlay(vadim_core, overlay, datetime.datetime(2026, 10, 18, 12, 0))
+
+    assert natal_core_hash(vadim_core) == before
+    assert twin["meta"]["generated_at"] == "2026-10-18T12:00:00"
+    assert twin["meta"]["as_of"] == "2026-10-18"
+    assert twin["dasha"]["current_mahadasha"] == overlay["dasha"]["current_mahadasha"]
+    assert twin["vargas"] is vadim_core["vargas"]
+
+
+def test_enhanced_twin_is_core_plus_overlay(vadim_chart, vadim_core):
+    as_of = datetime.date(2026, 10, 18)
+    twin = build_digital_twin_enhanced(ChartContext(chart=vadim_chart, tz_offset_hours=3.0), as_of)
+
+    expected = apply_as_of_overlay(vadim_core, compute_as_of_overlay(vadim_core, as_of))
+    twin["meta"].pop("generated_at")
+    expected["meta"].pop("generated_at")
+    assert twin == expected
+
+
+def test_base_twin_from_core_matches_build_digital_twin(vadim_chart, vadim_core):
+    expected = build_digital_twin(ChartContext(chart=vadim_chart, tz_offset_hours=3.0))
+    generated_at = datetime.datetime.fromisoformat(expected["meta"]["generated_at"])
+
+    assert base_twin_from_core(vadim_core, generated_at) == expected
+    assert any(planet["is_retrograde"] for planet in vadim_core["vargas"]["D1"]["planets"])
@@ -0,0 +1,52 @@
+"""
+Tests for pipeline phase instrumentation (astro_core.phases).
+"""
+
+import pickle
+
+import pytest
+
+from astro_core.phases import add_observers, collect_phases, phase, record_error, record_phase, remove_observers, replay
+
+
+@pytest.fixture
+def observed():
+    seen = {"phases": [], "errors": []}
+    observers = (lambda name, seconds: seen["phases"].append(name), seen["errors"].append)
+    add_observers(*observers)
+    yield seen
+    remove_observers(*observers)
+
+
+def test_observers_receive_phases_and_errors(observed):
+    with phase("twin_generation"):
+        with phase("twin_generation"):   # Nested: timed once
+            pass
+    record_phase("astrobrain.yogas", 0.01)
+    record_error("house_layer.Sahama")
+
+    assert observed == {"phases": ["twin_generation", "astrobrain.yogas"], "errors": ["house_layer.Sahama"]}
+
+
+def test_decorated_functions_are_timed(observed):
+    @phase("twin_generation")
+    def build():
+        return 42
+
+    assert build() == 42 and build() == 42
+    assert observed["phases"] == ["twin_generation", "twin_generation"]
+
+
+def test_collected_phases_are_replayed(observed):
+    with collect_phases() as record:
+        with phase("ephemeris"):
+            pass
+        record_error("planet_scoring")
+
+    assert observed == {"phases": [], "errors": []}
+    record = pickle.loads(pickle.dumps(record))   # As returned by a worker process
+    assert [name for name, _ in record.phases] == ["ephemeris"]
+
+    replay(record)
+
+    assert observed == {"phases": ["ephemeris"], "errors": ["planet_scoring"]}
@@ -0,0 +1,104 @@
+"""
+Tests for sparse fieldsets of the Digital Twin (TwinProjection).
+"""
+
+import datetime
+
+import pytest
+
+from astro_core import engine
+from astro_core.engine import (
+    ChartContext,
+    TwinProjection,
+    apply_as_of_overlay,
+    build_natal_core,
+    compute_as_of_overlay,
+)
+
+
+@pytest.fixture
+def full_core(vadim_chart):
+    return build_natal_core(ChartContext(chart=vadim_chart, tz_offset_hours=3.0))
+
+
+def test_parse_expands_aliases_and_orders_vargas():
+    projection = TwinProjection.parse(include="meta, dasha.current", vargas="d9,D1")
+
+    assert projection.include == (
+        "meta", "dasha.current_mahadasha", "dasha.current_antardasha", "dasha.current_pratyantardasha",
+    )
+    assert projection.vargas == ("D1", "D9")
+    assert projection.computed_sections() == ("meta", "dasha")
+    assert not projection.is_full
+    assert TwinProjection.parse().is_full
+
+
+@pytest.mark.parametrize("kwargs", [{"include": "planets"}, {"exclude": "vargas,foo.bar"}, {"vargas": "D1,D13"}])
+def test_parse_rejects_unknown_names(kwargs):
+    with pytest.raises(ValueError, match="Unknown"):
+        TwinProjection.parse(**kwargs)
+
+
+def test_projected_core_matches_full_core(vadim_chart, full_core):
+    projection = TwinProjection.parse(include="meta,vargas,arudha_padas,chara_karakas", vargas="D1,D9")
+
+    core = build_natal_core(ChartContext(chart=vadim_chart, tz_offset_hours=3.0), projection)
+
+    assert list(core) == ["meta", "vargas", "arudha_padas", "chara_karakas"]
+    assert core["vargas"] == {code: full_core["vargas"][code] for code in ("D1", "D9")}
+    assert core["arudha_padas"] == {code: full_core["arudha_padas"][code] for code in ("D1", "D9")}
+    assert core["chara_karakas"] == full_core["chara_karakas"]
+
+
+def test_skipped_sections_are_not_computed(vadim_chart, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be computed")
+
+    monkeypatch.setattr(engine, "calculate_vimshottari_dasha_native", fail)
+    monkeypatch.setattr(engine, "calculate_special_lagnas", fail)
+    monkeypatch.setattr(engine, "_generate_varga_chart", fail)
+
+    core = build_natal_core(
+        ChartContext(chart=vadim_chart, tz_offset_hours=3.0),
+        TwinProjection.parse(exclude="vargas,arudha_padas,special_lagnas,dasha,chara_karakas")
+    )
+
+    assert list(core) == ["meta"]
+
+
+def test_karakas_without_vargas_use_d1(vadim_chart, full_core):
+    core = build_natal_core(
+        ChartContext(chart=vadim_chart, tz_offset_hours=3.0),
+        TwinProjection.parse(include="chara_karakas")
+    )
+
+    assert "vargas" not in core
+    assert core["chara_karakas"] == full_core["chara_karakas"]
+
+
+def test_apply_trims_paths_without_mutating(full_core):
+    twin = apply_as_of_overlay(full_core, compute_as_of_overlay(full_core, datetime.date(2026, 10, 18)))
+    projection = TwinProjection.parse(include="meta.as_of,dasha.current,vargas", exclude="vargas.D60")
+
+    projected = projection.apply(twin)
+
+    assert projected["meta"] == {"as_of": "2026-10-18"}
+    assert set(projected["dasha"]) == {"current_mahadasha", "current_antardasha", "current_pratyantardasha"}
+    assert "D60" not in projected["vargas"] and projected["vargas"]["D9"] is twin["vargas"]["D9"]
+    assert "D60" in twin["vargas"] and "periods" in twin["dasha"]
+
+
+def test_apply_exclude_only(full_core):
+    projected = TwinProjection.parse(exclude="dasha.periods,special_lagnas").apply(full_core)
+
+    assert "periods" not in projected["dasha"] and "birth_nakshatra" in projected["dasha"]
+    assert "special_lagnas" not in projected
+    assert projected["vargas"] is full_core["vargas"]
+
+
+def test_wants_nested_paths():
+    projection = TwinProjection.parse(include="dasha.current,vargas", exclude="vargas.D60", sections=("dasha", "vargas"))
+
+    assert projection.wants("dasha") and projection.wants("dasha.current_mahadasha")
+    assert not projection.wants("dasha.periods")
+    assert projection.wants("vargas.D9") and not projection.wants("vargas.D60")
@@ -0,0 +1,107 @@
+"""
+Tests for the special lagnas (Hora, Ghati, Bhava, Sree, Indu) and ChartContext.
+"""
+
+import dataclasses
+import datetime
+
+import pytest
+
+from astro_core.engine import (
+    ChartContext,
+    SPECIAL_LAGNA_RATES,
+    build_digital_twin,
+    calculate_sunrise_window,
+    datetime_to_jd,
+)
+
+
+@pytest.fixture
+def vadim_context(vadim_chart) -> ChartContext:
+    return ChartContext(chart=vadim_chart, tz_offset_hours=3.0)
+
+
+def test_sunrise_precedes_birth(vadim_context):
+    jd = vadim_context.chart.julian_day
+    sunrise = vadim_context.sunrise_jd
+
+    # Late-October sunrise in Karelia is after 06:28, so it is the previous day's
+    assert jd - 1 < sunrise < jd
+    assert jd - sunrise > 0.5
+
+
+def test_sunrise_polar_fallback():
+    birth = datetime.datetime(1977, 12, 21, 12, 0)
+    jd = datetime_to_jd(birth, 0.0)
+
+    sunrise, following = calculate_sunrise_window(jd, 89.0, 0.0, birth, 0.0)
+
+    assert sunrise == pytest.approx(datetime_to_jd(birth.replace(hour=6), 0.0))
+    assert following is None
+
+
+def test_time_based_lagnas_follow_rates(vadim_context):
+    lagnas = vadim_context.special_lagnas
+    minutes = (vadim_context.chart.julian_day - vadim_context.sunrise_jd) * 1440.0
+
+    # All three start from the same Sun-at-sunrise point
+    starts = {
+        name: (lagnas[name]["longitude"] - minutes * rate) % 360
+        for name, rate in SPECIAL_LAGNA_RATES.items()
+    }
+    assert starts["hora_lagna"] == pytest.approx(starts["bhava_lagna"], abs=0.01)
+    assert starts["ghati_lagna"] == pytest.approx(starts["bhava_lagna"], abs=0.01)
+
+    # Sun at sunrise is within a degree of the birth Sun
+    sun = vadim_context.get_planet('Sun').abs_longitude
+    assert abs(starts["bhava_lagna"] - sun) < 1.0
+
+
+def test_sree_lagna(vadim_context):
+    sree = vadim_context.special_lagnas["sree_lagna"]
+
+    # Moon 348.4402 in Revati (346.667-360): 13.3% elapsed -> Asc + 47.89°
+    assert sree["sign_name"] == "Scorpio"
+    assert sree["longitude"] == pytest.approx(221.366, abs=0.01)
+
+
+def test_indu_lagna(vadim_context):
+    indu = vadim_context.special_lagnas["indu_lagna"]
+
+    # 9th from Virgo = Taurus (Venus, 12); 9th from Pisces = Scorpio (Mars, 6)
+    # 18 % 12 = 6 -> 6th sign from Pisces = Leo
+    assert indu["sign_name"] == "Leo"
+    assert indu["sign_id"] == 5
+    assert indu["degrees"] == pytest.approx(18.44, abs=0.01)
+
+
+def test_lagna_entries_have_vargas(vadim_context):
+    for name in ("hora_lagna", "ghati_lagna", "bhava_lagna", "sree_lagna", "indu_lagna"):
+        entry = vadim_context.special_lagnas[name]
+        assert entry["vargas"]["D1"] == entry["sign_name"]
+        assert "D60" in entry["vargas"]
+
+
+def test_context_memoizes_special_lagnas(vadim_context):
+    assert vadim_context.special_lagnas is vadim_context.special_lagnas
+
+
+def test_digital_twin_includes_special_lagnas(vadim_context):
+    twin = build_digital_twin(vadim_context)
+
+    assert twin["special_lagnas"] is vadim_context.special_lagnas
+    assert twin["meta"]["timezone_offset"] == 3.0
+    assert "arudha_padas" in twin
+
+
+def test_polar_chart_still_has_lagnas(vadim_chart):
+    polar = dataclasses.replace(
+        vadim_chart,
+        latitude=89.0,
+        birth_datetime=datetime.datetime(1977, 12, 21, 12, 0),
+        julian_day=datetime_to_jd(datetime.datetime(1977, 12, 21, 12, 0), 3.0),
+    )
+    context = ChartContext(chart=polar, tz_offset_hours=3.0)
+
+    assert set(context.special_lagnas) >= {"sunrise", "hora_lagna", "indu_lagna"}
+    assert context.special_lagnas["sunrise"].startswith("1977-12-21T06:00")
@@ -0,0 +1,114 @@
+"""
+Tests for _generate_varga_chart and its bitmask lookup tables.
+"""
+
+import random
+
+import pytest
+
+from astro_core.engine import (
+    HOUSE_MASK_TO_HOUSES,
+    PLANET_ORDER,
+    SIGNS,
+    SIGN_LORDS,
+    VARGA_CODES,
+    _generate_varga_chart,
+    get_aspects_giving,
+    get_houses_owned,
+    get_planet_dignity,
+    get_varga_sign_and_degrees,
+)
+
+from .conftest import build_chart
+
+
+def _reference_varga_chart(base_chart, varga_code):
+    """Straightforward list-based implementation used as the oracle."""
+    asc_longitude = base_chart.houses[0].abs_longitude
+    asc_sign, asc_degrees = get_varga_sign_and_degrees(asc_longitude, varga_code)
+    asc_sign_id = SIGNS.index(asc_sign) + 1
+    house_signs = {h: SIGNS[(asc_sign_id - 1 + h - 1) % 12] for h in range(1, 13)}
+
+    planets = []
+    in_sign, in_house = {}, {}
+    for planet in base_chart.planets:
+        sign, degrees = get_varga_sign_and_degrees(planet.abs_longitude, varga_code)
+        sign_id = SIGNS.index(sign) + 1
+        house = ((sign_id - asc_sign_id) % 12) + 1
+        in_sign[planet.name] = sign
+        in_house[planet.name] = house
+        planets.append({
+            "name": planet.name,
+            "sign_id": sign_id,
+            "sign_name": sign,
+            "absolute_degree": round(planet.abs_longitude, 4),
+            "relative_degree": round(degrees, 2),
+            "house_occupied": house,
+            "houses_owned": get_houses_owned(planet.name, house_signs),
+            "nakshatra": planet.nakshatra,
+            "nakshatra_lord": planet.nakshatra_lord,
+            "nakshatra_pada": planet.nakshatra_pada,
+            "sign_lord": SIGN_LORDS.get(sign, ''),
+            "dignity_state": get_planet_dignity(planet.name, sign, degrees),
+            "aspects_giving_to": get_aspects_giving(planet.name, house),
+            "aspects_receiving_from": [],
+            "conjunctions": [],
+            "is_retrograde": False,
+        })
+
+    for p in planets:
+        p["conjunctions"] = [
+            n for n, s in in_sign.items() if s == in_sign[p["name"]] and n != p["name"]
+        ]
+        p["aspects_receiving_from"] = [
+            n for n, h in in_house.items()
+            if n != p["name"] and in_house[p["name"]] in get_aspects_giving(n, h)
+        ]
+
+    houses = [{
+        "house_number": h,
+        "sign_id": SIGNS.index(house_signs[h]) + 1,
+        "sign_name": house_signs[h],
+        "lord": SIGN_LORDS[house_signs[h]],
+        "occupants": [n for n, ph in in_house.items() if ph == h],
+        "aspects_received": [n for n, ph in in_house.items() if h in get_aspects_giving(n, ph)],
+    } for h in range(1, 13)]
+
+    return {
+        "ascendant": {"sign_id": asc_sign_id, "sign_name": asc_sign, "degrees": round(asc_degrees, 2)},
+        "planets": planets,
+        "houses": houses,
+    }
+
+
+def test_house_mask_table():
+    assert HOUSE_MASK_TO_HOUSES[0] == ()
+    assert HOUSE_MASK_TO_HOUSES[0b100000000001] == (1, 12)
+    assert len(HOUSE_MASK_TO_HOUSES) == 4096
+
+
+@pytest.mark.parametrize("varga_code", VARGA_CODES)
+def test_matches_reference_for_vadim(vadim_chart, varga_code):
+    assert _generate_varga_chart(vadim_chart, varga_code) == _reference_varga_chart(vadim_chart, varga_code)
+
+
+def test_matches_reference_for_random_charts():
+    rng = random.Random(20240601)
+    for _ in range(40):
+        longitudes = {name: rng.uniform(0, 360) for name in PLANET_ORDER}
+        # Force some stelliums so conjunctions are exercised
+        longitudes['Mercury'] = (longitudes['Sun'] + rng.uniform(-5, 5)) % 360
+        longitudes['Venus'] = (longitudes['Sun'] + rng.uniform(-5, 5)) % 360
+        chart = build_chart(longitudes, rng.uniform(0, 360))
+        for varga_code in VARGA_CODES:
+            assert _generate_varga_chart(chart, varga_code) == _reference_varga_chart(chart, varga_code)
+
+
+def test_output_lists_are_not_shared(vadim_chart):
+    first = _generate_varga_chart(vadim_chart, 'D1')
+    first["planets"][0]["aspects_giving_to"].append(99)
+    first["planets"][0]["houses_owned"].append(99)
+
+    second = _generate_varga_chart(vadim_chart, 'D1')
+    assert 99 not in second["planets"][0]["aspects_giving_to"]
+    assert 99 not in second["planets"][0]["houses_owned"]
@@ -0,0 +1,58 @@
+"""
+Tests for the vectorized varga kernel (varga_sign_indices) against get_varga_sign.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from astro_core.engine import SIGNS, VARGA_CODES, get_varga_sign, varga_sign_indices
+
+DIVISIONS = sorted({int(code[1:]) for code in VARGA_CODES} | {5, 10, 12, 18, 25})
+
+
+def _dense_grid():
+    """Every part boundary of every sign, the floats either side of it, and a 0.01° grid."""
+    points = set(np.round(np.arange(0, 360, 0.01), 10).tolist())
+    for sign in range(12):
+        for divisions in DIVISIONS:
+            for k in range(divisions + 1):
+                boundary = float(sign * 30 + Fraction(30 * k, divisions))
+                points.update((
+                    boundary,
+                    float(np.nextafter(boundary, -np.inf)),
+                    float(np.nextafter(boundary, np.inf)),
+                ))
+    return np.array(sorted(p for p in points if p >= 0))
+
+
+def test_matches_get_varga_sign_on_dense_grid():
+    grid = _dense_grid()
+
+    kernel = varga_sign_indices(grid, VARGA_CODES)
+
+    for column, code in enumerate(VARGA_CODES):
+        expected = [SIGNS.index(get_varga_sign(longitude, code)) for longitude in grid]
+        mismatches = np.flatnonzero(kernel[:, column] != expected)
+        assert len(mismatches) == 0, f"{code} differs at {grid[mismatches[:5]].tolist()}"
+
+
+@pytest.mark.parametrize("longitude", [-30.5, -1e-9, 360.0, 725.25, 1e6])
+def test_normalizes_like_get_varga_sign(longitude):
+    kernel = varga_sign_indices([longitude], VARGA_CODES)[0]
+
+    assert [SIGNS[i] for i in kernel] == [get_varga_sign(longitude, code) for code in VARGA_CODES]
+
+
+def test_lowercase_and_unknown_codes():
+    kernel = varga_sign_indices([100.0], ["d9", "D99"])[0]
+
+    assert SIGNS[kernel[0]] == get_varga_sign(100.0, "D9")
+    assert SIGNS[kernel[1]] == get_varga_sign(100.0, "D99") == "Cancer"
+
+
+@pytest.mark.parametrize("longitude", [float("nan"), float("inf"), -1e-20])
+def test_rejects_unplaceable_longitudes(longitude):
+    with pytest.raises(ValueError):
+        varga_sign_indices([longitude], ["D1"])